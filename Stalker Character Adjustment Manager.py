@@ -1,6 +1,10 @@
 # main.py
-from modules.gui import MovementConfigEditor
+import sys
+import multiprocessing
 
 if __name__ == "__main__":
-    app = MovementConfigEditor()
-    app.run()
\ No newline at end of file
+    # Worker processes of the frozen exe (preset lint) start here too
+    multiprocessing.freeze_support()
+    # Runs a command without the GUI, or opens the GUI (or hands over to the window already open)
+    from modules.cli import main
+    sys.exit(main())
\ No newline at end of file
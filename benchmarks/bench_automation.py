@@ -0,0 +1,115 @@
+# benchmarks/bench_automation.py
+"""
+Automation API load test: many local clients editing and building at once.
+
+Serves an AutomationService (as the serve command does) over a synthetic
+~mods folder, with stand_in_packer.py in place of repak.exe, and runs
+--clients AutomationClient threads that each repeat set_values, get_config,
+status and build_mod with their own WalkSpeed. Reports the latency of each
+method and how many builds the build_mod calls cost. A waiting build serves
+every request that arrives before it starts, so builds should stay far
+below requests; any failed call or build fails the run.
+
+    python benchmarks/bench_automation.py --clients 8 --output automation.json
+    python benchmarks/bench_automation.py --baseline automation.json
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from harness import REPO_ROOT, build_parser, finish, summarize
+
+from modules.automation import AutomationClient, AutomationServer, AutomationService
+from modules.build_queue import BuildQueue
+from modules.config import ConfigHandler, get_mods_path
+from modules.mod import ModCreator
+from modules.settings_model import SettingsModel
+
+STAND_IN_PACKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stand_in_packer.py')
+METHODS = ('set_values', 'get_config', 'status', 'build_mod')
+
+
+def run_client(user_data_path, index, repeat, samples, errors):
+    """One client's requests; latencies go to samples[method], failures to errors"""
+    try:
+        with AutomationClient(user_data_path) as client:
+            for i in range(repeat):
+                calls = (
+                    ('set_values', {'values': {'MovementParams.WalkSpeed': 200 + index * 100 + i}}),
+                    ('get_config', {}),
+                    ('status', {}),
+                    ('build_mod', {}),
+                )
+                for method, params in calls:
+                    start = time.perf_counter()
+                    client.call(method, **params)
+                    samples[method].append((time.perf_counter() - start) * 1000)
+    except Exception as e:
+        errors.append(f"client {index}: {e!r}")
+
+
+def main(argv=None):
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=8, help="Concurrent clients (default: 8)")
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help="Stand-in packer latency in seconds (default: 0.05)")
+    parser.set_defaults(repeat=10)
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_automation')
+    try:
+        mods_path = get_mods_path(os.path.join(work_dir, 'game'))
+        os.makedirs(mods_path)
+        handler = ConfigHandler(REPO_ROOT, work_dir)
+        build_queue = BuildQueue(ModCreator(REPO_ROOT, interactive=False, packer_command=[
+            sys.executable, STAND_IN_PACKER, '--latency', str(args.latency)]))
+        service = AutomationService(handler, SettingsModel.from_handler(handler), build_queue, lambda: mods_path)
+        server = AutomationServer(service, work_dir)
+        server.start()
+
+        samples = {method: [] for method in METHODS}
+        errors = []
+        try:
+            threads = [threading.Thread(target=run_client, args=(work_dir, index, args.repeat, samples, errors))
+                       for index in range(args.clients)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            wall_ms = (time.perf_counter() - start) * 1000
+        finally:
+            server.stop()
+            build_queue.stop()
+        if errors:
+            raise SystemExit('\n'.join(errors))
+
+        counts = build_queue.counts
+        builds = counts['installed'] + counts['unchanged'] + counts['failed']
+        if counts['failed']:
+            raise SystemExit(f"{counts['failed']} builds failed: {build_queue.last_result}")
+        benchmarks = {}
+        for method in METHODS:
+            if args.filter not in method:
+                continue
+            stats = benchmarks[f'automation/{method}'] = summarize(samples[method])
+            print(f"{method:<11} median {stats['median_ms']:>8.1f} ms  max {stats['max_ms']:>8.1f} ms",
+                  file=sys.stderr)
+        print(f"{args.clients} clients, {args.clients * args.repeat * len(METHODS)} calls in {wall_ms:.0f} ms; "
+              f"{counts['requested']} build requests cost {builds} builds "
+              f"({counts['installed']} installed, {counts['unchanged']} unchanged, {counts['merged']} merged)",
+              file=sys.stderr)
+        return finish('automation', benchmarks, args, {
+            'parameters': {'clients': args.clients, 'latency_s': args.latency},
+            'builds': dict(counts, builds=builds),
+            'wall_ms': round(wall_ms, 1),
+        })
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# benchmarks/bench_build.py
+"""
+End-to-end mod build benchmark with a stand-in packer.
+
+Runs ModCreator.create_mod headless against a synthetic game folder whose
+~mods holds N paks, with stand_in_packer.py in place of repak.exe, and
+reports the distribution of every stage over many runs: incompatible-mod
+scan, cfg generation (including writing the build tree), temp-tree setup,
+pack, verify/move and cleanup. Pack time includes starting the stand-in's
+Python interpreter on top of the configured latency.
+
+    python benchmarks/bench_build.py --paks 500 --latency 0.1 --output build.json
+    python benchmarks/bench_build.py --baseline build.json
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from harness import REPO_ROOT, build_parser, finish, summarize
+from stand_in_packer import write_pak
+
+from modules.config import ConfigHandler, get_mods_path
+from modules.mod import ModCreator
+from modules.timing import SpanRecorder
+
+STAND_IN_PACKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stand_in_packer.py')
+STAGES = ['scan', 'setup', 'generate', 'pack', 'install', 'cleanup']
+PROTOTYPES = {'NPCBase': {'MaxHP': 150}, 'Bloodsucker': {'MaxHP': 400, 'RegenHP': 0.5}}
+
+
+def create_synthetic_mods(mods_path, pak_count):
+    """Fill ~mods with small paks, a few of them in subfolders, one matching an incompatible mod name"""
+    os.makedirs(mods_path, exist_ok=True)
+    for i in range(pak_count):
+        folder = mods_path if i % 10 else os.path.join(mods_path, f'group{i // 10}')
+        os.makedirs(folder, exist_ok=True)
+        name = 'FMAO_P.pak' if i == 0 else f'mod{i:05d}_P.pak'
+        entry = f'Stalker2/Content/GameLite/GameData/Mod{i}/Mod{i}.cfg'
+        write_pak(os.path.join(folder, name), {entry: f'Mod{i} : struct.begin\nstruct.end\n'.encode()})
+
+
+def main(argv=None):
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument('--paks', type=int, default=200, help="Paks in the synthetic ~mods (default: 200)")
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help="Stand-in packer latency in seconds (default: 0.05)")
+    parser.set_defaults(repeat=20)
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_build')
+    try:
+        mods_path = get_mods_path(os.path.join(work_dir, 'game'))
+        create_synthetic_mods(mods_path, args.paks)
+        handler = ConfigHandler(REPO_ROOT, work_dir)
+        mod_creator = ModCreator(REPO_ROOT, interactive=False,
+                                 packer_command=[sys.executable, STAND_IN_PACKER, '--latency', str(args.latency)])
+
+        samples = {stage: [] for stage in STAGES + ['total']}
+        for _ in range(args.repeat):
+            spans = SpanRecorder(enabled=True)
+            # create_mod drops the Aiming section from the config it is given
+            config = {section: dict(values) for section, values in handler.default_config.items()}
+            start = time.perf_counter()
+            mod_creator.create_mod(config, mods_path, PROTOTYPES, spans)
+            samples['total'].append((time.perf_counter() - start) * 1000)
+            for span in spans.spans:
+                samples[span['name']].append(span['duration_ms'])
+
+        benchmarks = {}
+        for stage, stage_samples in samples.items():
+            if args.filter not in stage or not stage_samples:
+                continue
+            benchmarks[f'build/{stage}'] = summarize(stage_samples)
+            stats = benchmarks[f'build/{stage}']
+            print(f"{stage:<10} median {stats['median_ms']:>10.3f} ms  p95 {stats['p95_ms']:>10.3f} ms  "
+                  f"max {stats['max_ms']:>10.3f} ms", file=sys.stderr)
+        return finish('build', benchmarks, args, {'parameters': {'paks': args.paks, 'latency_s': args.latency}})
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+# benchmarks/bench_core.py
+"""
+Core benchmarks: default config loading per language, preset parsing, cfg
+generation and the preferences round trip, on the shipped schema and on
+synthetic schemas of 1k and 10k keys, and preset inheritance over a synthetic
+library of 1000 presets in chains 50 deep. Needs no display.
+
+    python benchmarks/bench_core.py --output core.json
+    python benchmarks/bench_core.py --baseline core.json
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from harness import REPO_ROOT, build_parser, finish, run_benchmarks
+
+from modules.config import ConfigHandler
+from modules.mod import ModCreator
+from modules.presets import PresetResolver
+
+# Codes as stored in app_preferences.json by the language manager
+LANGUAGES = ['en', 'russian', 'ukrainian', 'korean', 'chinese']
+SYNTHETIC_SIZES = [1_000, 10_000]
+KEYS_PER_SECTION = 50
+PRESET_LIBRARY_SIZE = 1_000
+PRESET_CHAIN_DEPTH = 50
+SMALL_CONFIG = {'MovementParams': {'SprintSpeed': 600.0, 'WalkSpeed': 250.0},
+                'StaminaPerAction': {'SpendStaminaInSafeZone': False}}
+
+
+def write_preferences(handler, **preferences):
+    with open(handler.preferences_file, 'w', encoding='utf-8') as f:
+        json.dump(preferences, f)
+
+
+def write_synthetic_schema(base_path, key_count):
+    """Write a default_values.ini with key_count keys of mixed types, KEYS_PER_SECTION per section"""
+    ini_dir = os.path.join(base_path, 'default_ini')
+    os.makedirs(ini_dir, exist_ok=True)
+    lines = []
+    for i in range(key_count):
+        if i % KEYS_PER_SECTION == 0:
+            lines.append(f"\n[Section{i // KEYS_PER_SECTION}]")
+        kind = i % 3
+        if kind == 0:
+            value = f"{i * 0.5:.2f}|{i * 2.0:.1f}"
+        elif kind == 1:
+            value = str(i)
+        else:
+            value = 'true'
+        lines.append(f"Key{i} = {value} ; Synthetic setting number {i}")
+    with open(os.path.join(ini_dir, 'default_values.ini'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+
+def write_preset_library(handler, presets_dir):
+    """Write PRESET_LIBRARY_SIZE presets in chains of PRESET_CHAIN_DEPTH, each overriding a few settings; return the leaves"""
+    os.makedirs(presets_dir, exist_ok=True)
+    settings = [(section, key) for section, values in handler.default_config.items()
+                for key, value in values.items() if not isinstance(value, bool)]
+    leaves = []
+    for i in range(PRESET_LIBRARY_SIZE):
+        depth = i % PRESET_CHAIN_DEPTH
+        config = {}
+        if depth:
+            config['Preset'] = {'base': f'preset{i - 1}'}
+        else:
+            config['Preset'] = {'base': 'v3fish_recommended'}
+        for j in range(3):
+            section, key = settings[(i * 3 + j) % len(settings)]
+            config.setdefault(section, {})[key] = i + j
+        handler.save_ini_file(config, os.path.join(presets_dir, f'preset{i}.ini'))
+        if depth == PRESET_CHAIN_DEPTH - 1:
+            leaves.append(f'preset{i}')
+    return leaves
+
+
+def core_cases(handler, mod_creator, preset_paths, label):
+    """Benchmark cases for one schema, names prefixed with label"""
+    full_config = {section: dict(values) for section, values in handler.default_config.items()}
+    cases = []
+    for name, path in preset_paths:
+        cases.append((f'{label}/load_ini_file/{name}', lambda path=path: handler.load_ini_file(path)))
+    cases.append((f'{label}/generate_cfg/small', lambda: mod_creator._generate_cfg_content(SMALL_CONFIG)))
+    cases.append((f'{label}/generate_cfg/full', lambda: mod_creator._generate_cfg_content(full_config)))
+
+    def round_trip():
+        handler.set_last_settings(full_config)
+        return handler.get_last_settings()
+
+    cases.append((f'{label}/preferences_round_trip', round_trip))
+    return cases
+
+
+def main(argv=None):
+    args = build_parser(__doc__.strip().splitlines()[0]).parse_args(argv)
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_core')
+    try:
+        mod_creator = ModCreator(REPO_ROOT)
+        handler = ConfigHandler(REPO_ROOT, work_dir)
+        cases = []
+
+        # Default config of every language, selected through app_preferences.json like the app does
+        for lang in LANGUAGES:
+            cases.append((f'shipped/load_default_config/{lang}', handler.load_default_config,
+                          lambda lang=lang: write_preferences(handler, language=lang)))
+
+        write_preferences(handler, language='en')
+        handler.load_default_config()
+        full_preset = os.path.join(work_dir, 'full_preset.ini')
+        handler.save_ini_file(handler.default_config, full_preset)
+        presets = [(name, os.path.join(REPO_ROOT, 'default_ini', f'{name}.ini'))
+                   for name in ('v3fish_recommended', 'xysensitivityfix')]
+        presets.append(('full_preset', full_preset))
+        cases.extend(core_cases(handler, mod_creator, presets, 'shipped'))
+
+        # Resolving every chain's leaf: from the files (cold), then from the cache (warm)
+        resolver = PresetResolver(handler, os.path.join(work_dir, 'Presets'))
+        leaves = write_preset_library(handler, resolver.presets_dir)
+
+        def resolve_leaves():
+            for leaf in leaves:
+                resolver.resolve(leaf)
+
+        cases.append(('presets/resolve_chains/cold', resolve_leaves, resolver._cache.clear))
+        cases.append(('presets/resolve_chains/warm', resolve_leaves, resolve_leaves))
+
+        for size in SYNTHETIC_SIZES:
+            label = f'synthetic_{size // 1000}k'
+            base_path = os.path.join(work_dir, label)
+            write_synthetic_schema(base_path, size)
+            synthetic = ConfigHandler(base_path, base_path)
+            cases.append((f'{label}/load_default_config', synthetic.load_default_config))
+            preset = os.path.join(base_path, 'preset.ini')
+            synthetic.save_ini_file(synthetic.default_config, preset)
+            cases.extend(core_cases(synthetic, mod_creator, [('preset', preset)], label))
+
+        benchmarks = run_benchmarks(cases, args)
+        return finish('core', benchmarks, args)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
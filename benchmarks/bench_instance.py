@@ -0,0 +1,81 @@
+# benchmarks/bench_instance.py
+"""
+Single-instance handoff benchmark.
+
+Starts stand_in_instance.py as the running window, then measures how long a
+second launch of the app takes to hand its preset over and exit (a whole new
+interpreter, as when a preset file is opened with SCAM) and the round trip of
+SingleInstance.forward() alone. Every forwarded message is checked against
+what the stand-in received.
+
+    python benchmarks/bench_instance.py --output instance.json
+    python benchmarks/bench_instance.py --baseline instance.json
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from harness import REPO_ROOT, build_parser, finish, summarize
+
+from modules.single_instance import SingleInstance
+
+STAND_IN_INSTANCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stand_in_instance.py')
+
+# A second launch that uses work_dir as its user data folder, like the frozen exe next to its data
+_SECOND_LAUNCH = '''
+import sys
+sys.path.insert(0, {repo!r})
+import modules.config
+modules.config.get_app_paths = lambda: ({repo!r}, {user_data!r})
+from modules.cli import main
+sys.exit(main(['--preset', {preset!r}]))
+'''
+
+
+def main(argv=None):
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.set_defaults(repeat=20)
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_instance')
+    stand_in = subprocess.Popen([sys.executable, STAND_IN_INSTANCE, work_dir],
+                                stdout=subprocess.PIPE, text=True)
+    try:
+        if stand_in.stdout.readline().strip() != 'ready':
+            raise SystemExit("Stand-in instance did not start")
+        samples = {'second_launch': [], 'forward': []}
+        for i in range(args.repeat):
+            preset = os.path.join(work_dir, f'preset{i}.ini')
+            code = _SECOND_LAUNCH.format(repo=REPO_ROOT, user_data=work_dir, preset=preset)
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True)
+            samples['second_launch'].append((time.perf_counter() - start) * 1000)
+            if json.loads(stand_in.stdout.readline()) != {'command': 'activate', 'preset': preset}:
+                raise SystemExit("Stand-in instance received the wrong preset")
+
+            instance = SingleInstance(work_dir)
+            start = time.perf_counter()
+            instance.forward({'command': 'activate', 'preset': None})
+            samples['forward'].append((time.perf_counter() - start) * 1000)
+            stand_in.stdout.readline()
+
+        benchmarks = {}
+        for name, stage_samples in samples.items():
+            if args.filter not in name:
+                continue
+            stats = benchmarks[f'instance/{name}'] = summarize(stage_samples)
+            print(f"{name:<14} median {stats['median_ms']:>9.3f} ms  p95 {stats['p95_ms']:>9.3f} ms",
+                  file=sys.stderr)
+        return finish('instance', benchmarks, args)
+    finally:
+        SingleInstance(work_dir).forward({'command': 'quit'}, timeout=1.0)
+        stand_in.wait(timeout=5)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
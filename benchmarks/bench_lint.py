@@ -0,0 +1,107 @@
+# benchmarks/bench_lint.py
+"""
+Preset lint benchmark.
+
+Writes a synthetic community dump of N presets in nested folders (a mix of
+clean presets, presets with unknown keys, bad numbers, max and relation
+violations, broken formulas, and copies of the same file) and times linting
+it: in one process and in the process pool without the cache (cold), then
+with the cache filled by a previous run (warm). Every run's report must
+match the serial one.
+
+    python benchmarks/bench_lint.py --presets 2000 --output lint.json
+    python benchmarks/bench_lint.py --baseline lint.json
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from harness import REPO_ROOT, build_parser, finish, summarize
+
+from modules.config import ConfigHandler
+from modules.preset_lint import PresetLinter
+
+PROBLEMS = [
+    '',
+    'NotASetting = 5\n',
+    'WalkSpeed = fast\n',
+    'BaseTurnRate = 500\n',
+    'WalkSpeed = -20\n',
+]
+
+
+def write_dump(root, handler, count):
+    """Write count presets below root, every fifth one a copy of an earlier file"""
+    numbers = [(section, key) for section, values in handler.default_config.items()
+               for key, value in values.items() if not isinstance(value, bool)]
+    for i in range(count):
+        folder = os.path.join(root, f'author{i % 40}')
+        os.makedirs(folder, exist_ok=True)
+        if i % 5 == 4:
+            with open(os.path.join(root, f'author{(i - 1) % 40}', f'preset{i - 1}.ini'), 'rb') as src:
+                data = src.read()
+            with open(os.path.join(folder, f'preset{i}.ini'), 'wb') as dst:
+                dst.write(data)
+            continue
+        lines = []
+        by_section = {}
+        for j in range(12):
+            section, key = numbers[(i * 7 + j) % len(numbers)]
+            by_section.setdefault(section, []).append(f'{key} = {(i + j) % 90 + 1}')
+        for section, entries in by_section.items():
+            problem = PROBLEMS[i % len(PROBLEMS)] if section == 'MovementParams' else ''
+            lines.append(f'[{section}]\n' + '\n'.join(entries) + '\n' + problem)
+        if i % 50 == 0:
+            lines.append('[Formulas]\nRunSpeed = WalkSpeed * \n')
+        with open(os.path.join(folder, f'preset{i}.ini'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+
+
+def main(argv=None):
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument('--presets', type=int, default=2000, help="Presets in the synthetic dump")
+    parser.add_argument('--jobs', type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.set_defaults(repeat=5)
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_lint')
+    try:
+        handler = ConfigHandler(REPO_ROOT, work_dir)
+        root = os.path.join(work_dir, 'dump')
+        write_dump(root, handler, args.presets)
+
+        runs = {
+            'serial_cold': (PresetLinter(handler, None, jobs=1), False),
+            'parallel_cold': (PresetLinter(handler, None, jobs=args.jobs), False),
+            'parallel_warm': (PresetLinter(handler, work_dir, jobs=args.jobs), True),
+        }
+        expected = None
+        benchmarks = {}
+        for name, (linter, use_cache) in runs.items():
+            if args.filter not in name:
+                continue
+            if use_cache:
+                linter.lint(root)
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                report = linter.lint(root, use_cache=use_cache)
+                samples.append((time.perf_counter() - start) * 1000)
+            issues = [entry['issues'] for entry in report['files']]
+            if expected is None:
+                expected = issues
+            elif issues != expected:
+                raise SystemExit(f"{name} report differs from the first run")
+            stats = benchmarks[f'lint/{name}'] = summarize(samples)
+            stats.update(report['summary'])
+            print(f"{name:<14} median {stats['median_ms']:>10.1f} ms  {report['summary']['files']} presets, "
+                  f"{report['summary']['linted']} linted, {report['summary']['errors']} errors", file=sys.stderr)
+        return finish('lint', benchmarks, args)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
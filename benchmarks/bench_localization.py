@@ -0,0 +1,112 @@
+# benchmarks/bench_localization.py
+"""
+Localization benchmarks: cold start import time and memory of the language
+manager, measured in a fresh interpreter per run so module caching does not
+hide the cost, and lookups per second of t(), get_text() and the Localization
+getters. Run `python -m compileall .` first so bytecode compilation is not part
+of the measurement.
+
+    python benchmarks/bench_localization.py --output localization.json
+    python benchmarks/bench_localization.py --baseline localization.json
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from harness import REPO_ROOT, build_parser, finish, measure, summarize
+
+from modules.localization.language_manager import get_current_localization, get_text, t
+
+# Runs in a fresh interpreter: import the language manager and load the saved language.
+# tkinter and the other modules the whole app needs anyway are imported first so only
+# the localization cost is measured.
+_COLD_START = '''
+import json, sys, time, tracemalloc
+sys.path.insert(0, {repo!r})
+import tkinter, tkinter.ttk, tkinter.messagebox, modules.timing, modules.diagnostics_log
+if {trace!r}:
+    tracemalloc.start()
+start = time.perf_counter()
+from modules.localization.language_manager import LanguageManager
+LanguageManager({repo!r}, {user_data!r})
+elapsed = time.perf_counter() - start
+current, peak = tracemalloc.get_traced_memory()
+modules = sorted(name for name in sys.modules if name.startswith('modules.localization.'))
+print(json.dumps({{'ms': elapsed * 1000, 'current_bytes': current, 'peak_bytes': peak, 'modules': modules}}))
+'''
+
+COLD_START_LANGUAGES = ['en', 'korean']
+
+
+def cold_start(user_data_path, language, trace=False):
+    """Time one cold start; with trace=True measure its memory instead (tracing slows it down)"""
+    with open(os.path.join(user_data_path, 'app_preferences.json'), 'w', encoding='utf-8') as f:
+        json.dump({'language': language}, f)
+    code = _COLD_START.format(repo=REPO_ROOT, user_data=user_data_path, trace=trace)
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def cold_start_benchmarks(args, work_dir):
+    benchmarks = {}
+    for language in COLD_START_LANGUAGES:
+        name = f'localization/cold_start/{language}'
+        if args.filter not in name:
+            continue
+        stats = summarize([cold_start(work_dir, language)['ms'] for _ in range(args.repeat)])
+        traced = cold_start(work_dir, language, trace=True)
+        stats['traced_bytes'] = traced['current_bytes']
+        stats['peak_traced_bytes'] = traced['peak_bytes']
+        stats['imported_modules'] = traced['modules']
+        print(f"{name:<40} {stats['median_ms']:>10.3f} ms {stats['traced_bytes'] / 1024:>10.1f} KiB "
+              f"{len(stats['imported_modules'])} modules", file=sys.stderr)
+        benchmarks[name] = stats
+    return benchmarks
+
+
+def lookup_cases():
+    loc = get_current_localization()
+    return [
+        ('t/button', lambda: t('create_mod')),
+        ('t/label', lambda: t('default_value', value=1.5)),
+        ('t/missing', lambda: t('no_such_key')),
+        ('get_text/title', lambda: get_text('title', 'error')),
+        ('get_text/error_formatted', lambda: get_text('error', 'failed_to_run_repak', error='exit status 1')),
+        ('get_text/error_data_folder', lambda: get_text('error', 'repak_not_found', repak_path='data/repak')),
+        ('get_label/no_args', lambda: loc.get_label('mods_column_pak')),
+        ('get_label/formatted', lambda: loc.get_label('mods_summary', count=3, size=1.5, entries=12)),
+        ('get_success/no_args', lambda: loc.get_success('mod_created')),
+    ]
+
+
+def lookup_benchmarks(args):
+    benchmarks = {}
+    for case, func in lookup_cases():
+        name = f'localization/lookup/{case}'
+        if args.filter not in name:
+            continue
+        stats = measure(func, args.repeat)
+        stats['lookups_per_sec'] = round(1000 / stats['median_ms'])
+        print(f"{name:<50} {stats['lookups_per_sec']:>12,} lookups/s", file=sys.stderr)
+        benchmarks[name] = stats
+    return benchmarks
+
+
+def main(argv=None):
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.set_defaults(repeat=10)
+    args = parser.parse_args(argv)
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_localization')
+    try:
+        benchmarks = cold_start_benchmarks(args, work_dir)
+        benchmarks.update(lookup_benchmarks(args))
+        return finish('localization', benchmarks, args)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+# benchmarks/bench_ui.py
+"""
+Display-free UI interaction benchmarks for ConfigInterface.
+
+ConfigInterface runs against the fake widget backend and scripted scenarios
+drive it: typing into every field, loading each built-in preset, toggling
+sync sensitivity, undoing/redoing edits and typing a game directory. Each scenario reports the latency
+distribution per interaction plus the callbacks fired and configure() calls
+made; the undo scenario also reports the memory of a long undo history.
+
+    python benchmarks/bench_ui.py --output ui.json
+    python benchmarks/bench_ui.py --baseline ui.json
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from harness import REPO_ROOT, build_parser, finish, summarize
+from fake_widgets import FakeCheckbutton, FakeWidgets
+
+from modules.config import ConfigHandler, get_mods_path
+from modules.config_interface import ConfigInterface
+from modules.settings_model import History, SettingsModel
+
+
+def create_interface(user_data_path):
+    """Build ConfigInterface with all setting tabs on the fake backend, like the GUI does"""
+    widgets = FakeWidgets()
+    handler = ConfigHandler(REPO_ROOT, user_data_path)
+    interface = ConfigInterface(widgets.Frame(), handler, widgets=widgets)
+    notebook = widgets.Notebook()
+    interface.create_setting_tabs(notebook)
+    interface.update_all_default_button_states()
+    interface.update_tab_colors()
+    return interface, widgets.recorder
+
+
+def typing_interactions(interface, recorder):
+    """Retype every entry with a changed value, one interaction per keystroke"""
+    for entry in interface.entries.values():
+        original = entry.text
+        new_value = str(int(float(original) * 2) if original.replace('.', '', 1).isdigit() else original)
+        for _ in original:
+            yield entry.backspace
+        for char in new_value:
+            yield lambda entry=entry, char=char: entry.type_key(char)
+
+
+def preset_interactions(interface, recorder, rounds=5):
+    """Load each built-in preset, as the preset buttons do"""
+    handler = interface.config_handler
+    presets = [handler.v3fish_config, handler.xy_fix_config, handler.default_config]
+    for _ in range(rounds):
+        for preset in presets:
+            yield lambda preset=preset: interface.update_entries(preset)
+
+
+def sync_toggle_interactions(interface, recorder, toggles=40):
+    """Click the sync turn/look rate checkbox"""
+    sync_check = next(widget for widget in recorder.created if isinstance(widget, FakeCheckbutton)
+                      and widget.options.get('variable') is interface.sync_sensitivity)
+    for _ in range(toggles):
+        yield sync_check.invoke
+
+
+def undo_redo_interactions(interface, recorder, rounds=5):
+    """Edit a value in every tab and load each preset, then undo and redo all of it"""
+    handler = interface.config_handler
+    for _ in range(rounds):
+        history = interface.history
+        for section, values in handler.default_config.items():
+            key, value = next(iter(values.items()))
+            interface.model.set(section, key, not value if isinstance(value, bool) else value * 2)
+        for preset in [handler.v3fish_config, handler.xy_fix_config]:
+            interface.update_entries(preset)
+        history_steps = len(history._undo)
+        for _ in range(history_steps):
+            yield history.undo
+        for _ in range(history_steps):
+            yield history.redo
+        history.clear()
+        interface.update_entries(handler.default_config)
+
+
+# Speeds follow walking speed and every backward coefficient scales with WalkBackCoef
+LINKED_FORMULAS = {
+    'RunSpeed': 'WalkSpeed * 2.3',
+    'SprintSpeed': 'RunSpeed * 2.2',
+    'CrouchSpeed': 'WalkSpeed * 1.2',
+    'LowCrouchSpeed': 'CrouchSpeed * 0.7',
+    'RunBackCoef': 'WalkBackCoef * 0.86',
+    'RunDiagonalBackCoef': 'WalkBackCoef * 1.43',
+    'WalkDiagonalBackCoef': 'WalkBackCoef * 1.5',
+    'MoveBackCrouchCoef': 'WalkBackCoef * 0.95',
+    'MoveBackLowCrouchCoef': 'WalkBackCoef * 1.08',
+}
+
+
+def formula_interactions(interface, recorder):
+    """Retype the formula inputs and an unlinked entry, with LINKED_FORMULAS set"""
+    interface.model.set_formulas(LINKED_FORMULAS)
+    for key in ['WalkSpeed', 'WalkBackCoef', 'ClimbSpeedCoef']:
+        entry = interface.entries[('MovementParams', key)]
+        original = entry.text
+        for _ in original:
+            yield entry.backspace
+        for char in original[::-1]:
+            yield lambda entry=entry, char=char: entry.type_key(char)
+
+
+def bulk_interactions(interface, recorder, rounds=5):
+    """Scale every tab up and down by 10%, clamp it and reset it, as the bulk buttons do"""
+    tabs = [tab for tab in interface.tab_settings if tab != 'Aiming']
+    for _ in range(rounds):
+        for tab in tabs:
+            yield lambda tab=tab: interface.model.bulk_update(interface.tab_settings[tab], 'scale', 1.1)
+            yield lambda tab=tab: interface.model.bulk_update(interface.tab_settings[tab], 'scale', 0.9)
+            yield lambda tab=tab: interface.model.bulk_update(interface.tab_settings[tab], 'clamp')
+            yield lambda tab=tab: interface.model.bulk_update(interface.tab_settings[tab], 'reset')
+
+
+def game_dir_interactions(interface, recorder, rounds=5):
+    """Type a game directory path one key at a time, then let the debounced check run, as in the entry"""
+    game_dir = os.path.join(interface.user_data_path, 'bench_game', 'S.T.A.L.K.E.R. 2 Heart of Chornobyl')
+    os.makedirs(get_mods_path(game_dir), exist_ok=True)
+    # The ~mods folder itself, which the check corrects to the game directory
+    path = get_mods_path(game_dir)
+    for _ in range(rounds):
+        yield lambda: interface.game_dir.set('')
+        for end in range(1, len(path) + 1):
+            yield lambda end=end: interface.game_dir.set(path[:end])
+        yield recorder.run_timers
+    interface.close()
+
+
+def history_memory(handler, steps=5000):
+    """Traced bytes of an undo history of single-setting edits, as left by typing in different fields"""
+    model = SettingsModel.from_handler(handler)
+    numeric = [setting for setting in model.keys if type(model.defaults[setting]) in (int, float)]
+    history = History(model, coalesce_seconds=0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(steps):
+        model.set(*numeric[i % len(numeric)], i % 100 + 1)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return {'history_steps': len(history._undo), 'history_bytes': used,
+            'history_bytes_per_step': round(used / steps, 1)}
+
+
+SCENARIOS = {
+    'typing': typing_interactions,
+    'load_presets': preset_interactions,
+    'sync_toggle': sync_toggle_interactions,
+    'undo_redo': undo_redo_interactions,
+    'formulas': formula_interactions,
+    'bulk': bulk_interactions,
+    'game_dir': game_dir_interactions,
+}
+
+
+def run_scenario(name, user_data_path):
+    interface, recorder = create_interface(user_data_path)
+    latencies = []
+    callbacks = configures = 0
+    for interaction in SCENARIOS[name](interface, recorder):
+        before_callbacks, before_configures = recorder.snapshot()
+        start = time.perf_counter()
+        interaction()
+        latencies.append((time.perf_counter() - start) * 1000)
+        after_callbacks, after_configures = recorder.snapshot()
+        callbacks += after_callbacks - before_callbacks
+        configures += after_configures - before_configures
+    stats = summarize(latencies)
+    stats.update({
+        'interactions': len(latencies),
+        'callbacks': callbacks,
+        'configure_calls': configures,
+        'callbacks_per_interaction': round(callbacks / len(latencies), 2),
+        'configure_calls_per_interaction': round(configures / len(latencies), 2),
+    })
+    return stats
+
+
+def main(argv=None):
+    args = build_parser(__doc__.strip().splitlines()[0]).parse_args(argv)
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_ui')
+    try:
+        benchmarks = {}
+        for name in SCENARIOS:
+            if args.filter not in name:
+                continue
+            # Keep the fastest of the repeats so one-off hiccups do not skew comparisons
+            runs = [run_scenario(name, work_dir) for _ in range(args.repeat)]
+            stats = min(runs, key=lambda run: run['median_ms'])
+            if name == 'undo_redo':
+                stats.update(history_memory(ConfigHandler(REPO_ROOT, work_dir)))
+            print(f"{name:<20} {stats['interactions']:>6} interactions {stats['median_ms']:>10.4f} ms median "
+                  f"{stats['callbacks_per_interaction']:>8} callbacks {stats['configure_calls_per_interaction']:>8} "
+                  f"configure() per interaction", file=sys.stderr)
+            if 'history_bytes' in stats:
+                print(f"{'':<20} {stats['history_steps']} undo steps in {stats['history_bytes'] / 1024:.1f} KiB",
+                      file=sys.stderr)
+            benchmarks[f'ui/{name}'] = stats
+        return finish('ui', benchmarks, args)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# benchmarks/bench_watch.py
+"""
+Watch mode benchmark: time from saving a preset to the mod being installed.
+
+Runs a PresetWatcher with a WatchBuilder over a preset file in a synthetic
+Presets folder, installing into a synthetic ~mods with stand_in_packer.py
+in place of repak.exe. Every save is a burst of writes, like an editor that
+truncates and then writes the file, and must be built once. Measures saves
+that change a value (rebuilt and installed) and saves that only change a
+comment (cfg hash unchanged, not rebuilt). Latency includes the debounce.
+
+    python benchmarks/bench_watch.py --latency 0.05 --output watch.json
+    python benchmarks/bench_watch.py --baseline watch.json
+"""
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import time
+
+from harness import REPO_ROOT, build_parser, finish, summarize
+
+from modules.build_queue import BuildQueue
+from modules.config import ConfigHandler, get_mods_path
+from modules.mod import ModCreator
+from modules.preset_watch import PresetWatcher, WatchBuilder
+
+STAND_IN_PACKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stand_in_packer.py')
+# Writes per save, and the pause between them
+BURST_WRITES = 3
+BURST_GAP = 0.02
+
+
+def save(path, text):
+    """Write a preset the way editors often do: empty it, then write it in pieces"""
+    for i in range(BURST_WRITES):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text[:len(text) * i // (BURST_WRITES - 1)])
+        if i < BURST_WRITES - 1:
+            time.sleep(BURST_GAP)
+
+
+def main(argv=None):
+    parser = build_parser(__doc__.strip().splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help="Stand-in packer latency in seconds (default: 0.05)")
+    parser.set_defaults(repeat=10)
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix='scam_bench_watch')
+    try:
+        mods_path = get_mods_path(os.path.join(work_dir, 'game'))
+        os.makedirs(mods_path)
+        presets_dir = os.path.join(work_dir, 'Presets')
+        os.makedirs(presets_dir)
+        preset_path = os.path.join(presets_dir, 'watched.ini')
+        with open(preset_path, 'w', encoding='utf-8') as f:
+            f.write('[MovementParams]\nWalkSpeed = 200\n')
+
+        handler = ConfigHandler(REPO_ROOT, work_dir)
+        build_queue = BuildQueue(ModCreator(REPO_ROOT, interactive=False, packer_command=[
+            sys.executable, STAND_IN_PACKER, '--latency', str(args.latency)]))
+        builder = WatchBuilder(handler, build_queue, mods_path, presets_dir=presets_dir)
+        results = queue.Queue()
+
+        def on_change(path):
+            result = builder.build(path)
+            results.put((time.perf_counter(), result))
+
+        watcher = PresetWatcher(preset_path, on_change)
+        watcher.start()
+
+        edits = {
+            # A new value every save, so every save is installed
+            'value_change': ('installed', lambda i: f'[MovementParams]\nWalkSpeed = {300 + i}\n'),
+            # Same value, different comment: the generated cfg does not change
+            'comment_only': ('unchanged', lambda i: f'[MovementParams]\nWalkSpeed = 300 ; take {i}\n'),
+        }
+        benchmarks = {}
+        try:
+            for name, (expected, text) in edits.items():
+                if args.filter not in name:
+                    continue
+                if expected == 'unchanged':
+                    # Install the value the comment edits keep first
+                    save(preset_path, text(-1))
+                    results.get(timeout=30)
+                samples = []
+                builds = []
+                for i in range(args.repeat):
+                    saved = time.perf_counter()
+                    save(preset_path, text(i))
+                    done, result = results.get(timeout=30)
+                    # Anything else queued means one save was built more than once
+                    time.sleep(watcher.debounce + 2 * watcher.poll_interval)
+                    extra = results.qsize()
+                    if result['status'] != expected or extra:
+                        raise SystemExit(f"{name}: save {i} gave {result['status']} and {extra} extra builds")
+                    samples.append((done - saved) * 1000)
+                    builds.append(result.get('duration_ms', 0))
+                stats = benchmarks[f'watch/{name}'] = summarize(samples)
+                stats['build_median_ms'] = summarize(builds)['median_ms']
+                print(f"{name:<14} save to {expected} median {stats['median_ms']:>8.1f} ms  "
+                      f"max {stats['max_ms']:>8.1f} ms  (build {stats['build_median_ms']:.1f} ms)", file=sys.stderr)
+        finally:
+            watcher.stop()
+            build_queue.stop()
+        return finish('watch', benchmarks, args, {'parameters': {
+            'latency_s': args.latency, 'debounce_s': watcher.debounce, 'poll_interval_s': watcher.poll_interval}})
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+# benchmarks/fake_widgets.py
+"""
+Display-free stand-ins for the Tk widgets ConfigInterface creates.
+
+Pass FakeWidgets() as the widgets backend of ConfigInterface. Every widget
+records its method calls and every fired callback (key bindings, variable
+traces, commands) in the backend's CallRecorder, so scenarios can count the
+work one interaction causes.
+"""
+import functools
+from collections import Counter
+
+
+class CallRecorder:
+    def __init__(self):
+        self.calls = Counter()
+        self.callbacks = 0
+        self.created = []
+        self.timers = {}  # after() id -> callback, until run or cancelled
+        self._next_timer = 0
+
+    def record(self, widget, method):
+        self.calls[(type(widget).__name__, method)] += 1
+
+    def fire(self, callback, *args):
+        self.callbacks += 1
+        return callback(*args)
+
+    def count(self, method):
+        """Total calls of a method over every widget type"""
+        return sum(n for (_widget, name), n in self.calls.items() if name == method)
+
+    def snapshot(self):
+        return self.callbacks, self.count('configure')
+
+    def run_timers(self):
+        """Run the after() callbacks scheduled so far, as if their delay had passed"""
+        timers, self.timers = self.timers, {}
+        for callback in timers.values():
+            self.fire(callback)
+
+
+class FakeEvent:
+    def __init__(self, widget):
+        self.widget = widget
+
+
+class FakeWidget:
+    def __init__(self, recorder, master=None, **options):
+        self.recorder = recorder
+        self.master = master
+        self.options = dict(options)
+        self.bindings = {}
+        recorder.created.append(self)
+        recorder.record(self, '__init__')
+
+    def configure(self, **options):
+        self.recorder.record(self, 'configure')
+        self.options.update(options)
+
+    config = configure
+
+    def cget(self, option):
+        return self.options.get(option)
+
+    def __getitem__(self, option):
+        return self.options.get(option)
+
+    def __setitem__(self, option, value):
+        self.configure(**{option: value})
+
+    def grid(self, **options):
+        self.recorder.record(self, 'grid')
+
+    def pack(self, **options):
+        self.recorder.record(self, 'pack')
+
+    def bind(self, sequence, func):
+        self.recorder.record(self, 'bind')
+        self.bindings.setdefault(sequence, []).append(func)
+
+    def after(self, ms, func, *args):
+        self.recorder.record(self, 'after')
+        self.recorder._next_timer += 1
+        timer = f'after#{self.recorder._next_timer}'
+        self.recorder.timers[timer] = functools.partial(func, *args)
+        return timer
+
+    def after_cancel(self, timer):
+        self.recorder.record(self, 'after_cancel')
+        self.recorder.timers.pop(timer, None)
+
+    def event_generate(self, sequence):
+        for func in self.bindings.get(sequence, []):
+            self.recorder.fire(func, FakeEvent(self))
+
+
+class FakeFrame(FakeWidget):
+    pass
+
+
+class FakeLabel(FakeWidget):
+    pass
+
+
+class FakeButton(FakeWidget):
+    def invoke(self):
+        command = self.options.get('command')
+        if command and self.options.get('state') != 'disabled':
+            return self.recorder.fire(command)
+
+
+class FakeCheckbutton(FakeWidget):
+    def invoke(self):
+        variable = self.options.get('variable')
+        if variable is not None:
+            variable.set(not variable.get())
+        command = self.options.get('command')
+        if command:
+            return self.recorder.fire(command)
+
+
+class FakeEntry(FakeWidget):
+    def __init__(self, recorder, master=None, **options):
+        super().__init__(recorder, master, **options)
+        self.text = ''
+
+    def _index(self, index):
+        return len(self.text) if index == 'end' else int(index)
+
+    def get(self):
+        self.recorder.record(self, 'get')
+        variable = self.options.get('textvariable')
+        return variable.get() if variable is not None else self.text
+
+    def insert(self, index, string):
+        self.recorder.record(self, 'insert')
+        index = self._index(index)
+        self.text = self.text[:index] + string + self.text[index:]
+
+    def delete(self, first, last=None):
+        self.recorder.record(self, 'delete')
+        first = self._index(first)
+        last = first + 1 if last is None else self._index(last)
+        self.text = self.text[:first] + self.text[last:]
+
+    def type_key(self, char):
+        """Insert a character at the end and fire the key release bindings, like a keystroke"""
+        self.insert('end', char)
+        self.event_generate('<KeyRelease>')
+
+    def backspace(self):
+        if self.text:
+            self.delete(len(self.text) - 1)
+        self.event_generate('<KeyRelease>')
+
+
+class FakeNotebook(FakeWidget):
+    def __init__(self, recorder, master=None, **options):
+        super().__init__(recorder, master, **options)
+        self.tabs = []
+
+    def add(self, child, **options):
+        self.recorder.record(self, 'add')
+        self.tabs.append(dict(options, child=child))
+
+    def index(self, tab_id):
+        return len(self.tabs) if tab_id == 'end' else int(tab_id)
+
+    def tab(self, tab_id, option=None, **options):
+        self.recorder.record(self, 'tab')
+        tab = self.tabs[self.index(tab_id)]
+        if option is not None:
+            return tab.get(option)
+        if options:
+            self.recorder.record(self, 'configure')
+            tab.update(options)
+        return dict(tab)
+
+
+class FakeStyle(FakeWidget):
+    def map(self, style, **options):
+        self.recorder.record(self, 'map')
+
+
+class FakeVariable:
+    def __init__(self, recorder, master=None, value=None):
+        self.recorder = recorder
+        self.value = value
+        self.traces = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in list(self.traces):
+            self.recorder.fire(callback, 'PY_VAR', '', 'write')
+
+    def trace_add(self, mode, callback):
+        self.traces.append(callback)
+        return f'trace{len(self.traces)}'
+
+
+class FakeBooleanVar(FakeVariable):
+    def __init__(self, recorder, master=None, value=False):
+        super().__init__(recorder, master, bool(value))
+
+    def set(self, value):
+        super().set(bool(value))
+
+
+class FakeStringVar(FakeVariable):
+    def __init__(self, recorder, master=None, value=''):
+        super().__init__(recorder, master, value)
+
+
+_WIDGET_CLASSES = {
+    'Frame': FakeFrame,
+    'Label': FakeLabel,
+    'Entry': FakeEntry,
+    'Button': FakeButton,
+    'Checkbutton': FakeCheckbutton,
+    'Notebook': FakeNotebook,
+    'Style': FakeStyle,
+    'BooleanVar': FakeBooleanVar,
+    'StringVar': FakeStringVar,
+}
+
+
+class FakeWidgets:
+    """Widget backend with the same names as config_interface.TkWidgets, sharing one recorder"""
+
+    def __init__(self):
+        self.recorder = CallRecorder()
+        for name, cls in _WIDGET_CLASSES.items():
+            setattr(self, name, functools.partial(cls, self.recorder))
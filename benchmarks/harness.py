@@ -0,0 +1,138 @@
+# benchmarks/harness.py
+"""
+Shared helpers for the benchmark scripts: timing, JSON results and regression checks.
+
+Every benchmark script accepts:
+    --output FILE       write results as JSON (default: print them)
+    --baseline FILE     compare against an earlier results file
+    --threshold 0.20    fail when a median gets slower than baseline by more than this fraction
+    --repeat N          timing repeats per benchmark
+    --filter TEXT       only run benchmarks whose name contains TEXT
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.20
+# Aim for at least this much time per repeat so fast calls are not dominated by timer noise
+MIN_REPEAT_SECONDS = 0.05
+
+
+def summarize(samples_ms):
+    """Return distribution stats of a list of millisecond samples"""
+    ordered = sorted(samples_ms)
+    return {
+        'runs': len(ordered),
+        'min_ms': round(ordered[0], 6),
+        'median_ms': round(statistics.median(ordered), 6),
+        'mean_ms': round(statistics.fmean(ordered), 6),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 6),
+        'max_ms': round(ordered[-1], 6),
+        'stdev_ms': round(statistics.stdev(ordered), 6) if len(ordered) > 1 else 0.0,
+    }
+
+
+def measure(func, repeat=DEFAULT_REPEAT, setup=None):
+    """
+    Time func() with timeit and return per-call stats in milliseconds.
+
+    setup, when given, runs before every repeat (outside the timed region).
+    """
+    timer = timeit.Timer(func, timer=time.perf_counter)
+    if setup:
+        setup()
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_REPEAT_SECONDS or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < MIN_REPEAT_SECONDS / 10 else 2
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        samples.append(timer.timeit(number) / number * 1000)
+    stats = summarize(samples)
+    stats['loops'] = number
+    return stats
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return [(name, baseline median, current median, ratio)] for benchmarks slower than allowed"""
+    regressions = []
+    previous = baseline.get('benchmarks', {})
+    for name, stats in results['benchmarks'].items():
+        if name not in previous:
+            continue
+        before = previous[name]['median_ms']
+        after = stats['median_ms']
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append((name, before, after, after / before))
+    return regressions
+
+
+def build_parser(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Results file of an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed median slowdown as a fraction (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f"Timing repeats per benchmark (default: {DEFAULT_REPEAT})")
+    parser.add_argument('--filter', default='', help="Only run benchmarks whose name contains this text")
+    return parser
+
+
+def finish(suite, benchmarks, args, extra=None):
+    """Write or print the results, compare them with the baseline and return the exit code"""
+    results = {'suite': suite, 'environment': environment(), 'benchmarks': benchmarks}
+    if extra:
+        results.update(extra)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: {before:.4f} ms -> {after:.4f} ms ({ratio:.2f}x)", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}", file=sys.stderr)
+    return 0
+
+
+def run_benchmarks(cases, args):
+    """Measure every (name, func[, setup]) case that matches the filter, logging progress to stderr"""
+    benchmarks = {}
+    for name, func, *setup in cases:
+        if args.filter not in name:
+            continue
+        stats = measure(func, args.repeat, setup[0] if setup else None)
+        print(f"{name:<50} {stats['median_ms']:>12.4f} ms", file=sys.stderr)
+        benchmarks[name] = stats
+    return benchmarks
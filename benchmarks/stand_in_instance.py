@@ -0,0 +1,43 @@
+# benchmarks/stand_in_instance.py
+"""
+Stand-in for a running SCAM window, so single-instance handoff can be tested
+without a display.
+
+Takes the instance lock for a user data folder exactly like the GUI does,
+prints "ready" once later launches can reach it, then prints every message it
+receives as a JSON line until it is stopped or gets a {'command': 'quit'}.
+
+    python benchmarks/stand_in_instance.py [<user data folder>]
+    python "Stalker Character Adjustment Manager.py" --preset Presets/mine.ini
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.config import get_app_paths
+from modules.single_instance import SingleInstance
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    instance = SingleInstance(argv[0] if argv else get_app_paths()[1])
+    if not instance.acquire():
+        print("SCAM is already running", file=sys.stderr)
+        return 1
+    try:
+        print('ready', flush=True)
+        while True:
+            message = instance.messages.get()
+            print(json.dumps(message), flush=True)
+            if message.get('command') == 'quit':
+                return 0
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        instance.release()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
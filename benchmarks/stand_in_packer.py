@@ -0,0 +1,101 @@
+# benchmarks/stand_in_packer.py
+"""
+Stand-in for repak.exe so the mod build pipeline can be benchmarked anywhere.
+
+Accepts the same command line SCAM uses, `pack <folder>`, sleeps for the
+configured latency to model repak's own run time, then writes <folder>.pak
+next to the folder. The pak is an uncompressed V11 archive with the same
+mount point and entry paths repak produces, so SCAM's install verification
+reads it like the real thing.
+
+    python benchmarks/stand_in_packer.py --latency 0.2 pack z_SCAM_P
+"""
+import argparse
+import hashlib
+import os
+import struct
+import sys
+import time
+
+PAK_MAGIC = 0x5A6F12E1
+PAK_VERSION = 11
+MOUNT_POINT = '../../../'
+COMPRESSION_SLOTS = 5
+COMPRESSION_NAME_SIZE = 32
+
+
+def _fstring(text):
+    data = text.encode('utf-8') + b'\0'
+    return struct.pack('<i', len(data)) + data
+
+
+def write_pak(path, files, mount_point=MOUNT_POINT):
+    """Write {entry path: bytes} as an uncompressed V11 pak with path hash and full directory indexes"""
+    data = bytearray()
+    encoded_entries = bytearray()
+    directories = {}
+    for entry_path, content in files.items():
+        offset = len(data)
+        # In-data record: offset, sizes, compression, SHA1, encrypted flag, block size
+        data += struct.pack('<QQQI', 0, len(content), len(content), 0)
+        data += hashlib.sha1(content).digest() + struct.pack('<BI', 0, 0)
+        data += content
+        directory, _, name = entry_path.rpartition('/')
+        directories.setdefault(directory + '/', []).append((name, len(encoded_entries)))
+        # Encoded entry: 32-bit offset and sizes, no compression, no blocks
+        flags = (1 << 31) | (1 << 30)
+        encoded_entries += struct.pack('<III', flags, offset, len(content))
+
+    directory_index = bytearray(struct.pack('<I', len(directories)))
+    for directory, names in directories.items():
+        directory_index += _fstring(directory) + struct.pack('<I', len(names))
+        for name, entry_offset in names:
+            directory_index += _fstring(name) + struct.pack('<i', entry_offset)
+    path_hash_index = struct.pack('<I', 0)
+
+    index_offset = len(data)
+    header = _fstring(mount_point) + struct.pack('<IQ', len(files), 0)
+    index_size = (len(header) + 2 * (4 + 8 + 8 + 20) + 4 + len(encoded_entries) + 4)
+    path_hash_offset = index_offset + index_size
+    directory_index_offset = path_hash_offset + len(path_hash_index)
+
+    index = bytearray(header)
+    index += struct.pack('<IQQ', 1, path_hash_offset, len(path_hash_index)) + hashlib.sha1(path_hash_index).digest()
+    index += struct.pack('<IQQ', 1, directory_index_offset, len(directory_index)) + hashlib.sha1(directory_index).digest()
+    index += struct.pack('<I', len(encoded_entries)) + encoded_entries + struct.pack('<I', 0)
+
+    footer = bytes(16) + b'\0' + struct.pack('<IIQQ', PAK_MAGIC, PAK_VERSION, index_offset, len(index))
+    footer += hashlib.sha1(index).digest() + bytes(COMPRESSION_SLOTS * COMPRESSION_NAME_SIZE)
+
+    with open(path, 'wb') as f:
+        f.write(data + index + path_hash_index + directory_index + footer)
+
+
+def collect_files(folder):
+    """Return {path relative to folder with / separators: bytes} for every file below folder"""
+    files = {}
+    for root, _dirs, names in os.walk(folder):
+        for name in sorted(names):
+            file_path = os.path.join(root, name)
+            entry_path = os.path.relpath(file_path, folder).replace(os.sep, '/')
+            with open(file_path, 'rb') as f:
+                files[entry_path] = f.read()
+    return files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in for repak.exe pack")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds to sleep before packing")
+    commands = parser.add_subparsers(dest='command', required=True)
+    pack = commands.add_parser('pack')
+    pack.add_argument('folder')
+    args = parser.parse_args(argv)
+
+    time.sleep(args.latency)
+    folder = args.folder.rstrip('/\\')
+    write_pak(f'{folder}.pak', collect_files(folder))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
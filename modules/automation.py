@@ -0,0 +1,385 @@
+# modules/automation.py
+"""
+Local automation API.
+
+Scripts can drive SCAM through a JSON-RPC 2.0 endpoint instead of the GUI,
+either in the running window (started with --automation or
+SCAM_AUTOMATION=1) or in a headless daemon (the serve command). Like the
+single-instance handoff, the endpoint is a Unix socket on Linux/macOS and a
+named pipe on Windows, only reachable by clients that know the random auth
+key written with its address to scam_automation.json in the user data
+folder. Each message is one JSON-RPC request or batch, as UTF-8 JSON in one
+multiprocessing.connection frame; AutomationClient (and the rpc command)
+does this for you:
+
+    with AutomationClient(user_data_path) as client:
+        client.call('load_preset', name='MyPreset')
+        client.call('set_values', values={'WalkSpeed': 250})
+        client.call('build_mod')
+
+Methods:
+    status()                                    version, mods folder, mod installed, builds
+    get_config(include_defaults=False)          changed settings, prototype overrides, invalid settings
+    set_values(values)                          {"Section.Key" or "Key": value} or {"Section": {"Key": value}}
+    load_preset(name=None, path=None)           a preset from the Presets folder, a built-in one or a file
+    build_mod(include_defaults=False, wait=True)
+
+Requests are served concurrently, one thread per connection. Reads and
+edits run one at a time where the model lives (on the Tk thread in the
+GUI). Builds go to a BuildQueue, so a burst of build_mod calls from many
+clients builds the newest settings once instead of once per call.
+"""
+import inspect
+import json
+import os
+import threading
+
+from .diagnostics_log import diagnostics_log
+from .formulas import FormulaError
+from .presets import PresetError, PresetResolver
+from .settings_model import InvalidSettingError, parse_value
+from .single_instance import IPC_FAMILY
+from . import VERSION
+
+INFO_FILE_NAME = 'scam_automation.json'
+AUTOMATION_ENV_VAR = 'SCAM_AUTOMATION'
+# How long a build_mod call waits for its build
+BUILD_TIMEOUT = 300.0
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+APP_ERROR = -32000
+
+
+class AutomationError(Exception):
+    def __init__(self, code, message, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+    def to_json(self):
+        error = {'code': self.code, 'message': str(self)}
+        if self.data is not None:
+            error['data'] = self.data
+        return error
+
+
+def automation_enabled():
+    return os.environ.get(AUTOMATION_ENV_VAR) == '1'
+
+
+class AutomationService:
+    """
+    The API methods, over a SettingsModel and a BuildQueue. call(func) runs func where the model may be
+    changed and returns its result; by default under a lock, the GUI passes one that runs it on the Tk thread.
+    A loaded preset's prototype overrides go to prototype_overrides of editor (the GUI), or of the service.
+    """
+
+    METHODS = ('status', 'get_config', 'set_values', 'load_preset', 'build_mod')
+
+    def __init__(self, config_handler, model, build_queue, get_mods_path, call=None, editor=None,
+                 presets_dir='Presets', mode='daemon'):
+        self.config_handler = config_handler
+        self.model = model
+        self.build_queue = build_queue
+        self.get_mods_path = get_mods_path
+        self.mode = mode
+        self.resolver = PresetResolver(config_handler, presets_dir)
+        self.editor = editor or self
+        self.prototype_overrides = {}
+        self.preset = None
+        self._lock = threading.Lock()
+        self.call = call or self._call_locked
+
+    def _call_locked(self, func):
+        with self._lock:
+            return func()
+
+    def _resolve(self, name):
+        """(section, key) of "Section.Key", or of "Key" when only one section has it"""
+        if '.' in name:
+            setting = tuple(name.split('.', 1))
+            if setting in self.model:
+                return setting
+        else:
+            matches = [setting for setting in self.model.defaults if setting[1] == name]
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                raise AutomationError(INVALID_PARAMS, f"'{name}' is in several sections; write it as Section.{name}")
+        raise AutomationError(INVALID_PARAMS, f"Unknown setting '{name}'")
+
+    def _typed_values(self, values):
+        """{(section, key): value} of set_values params, typed like the defaults"""
+        if not isinstance(values, dict):
+            raise AutomationError(INVALID_PARAMS, "values must be an object")
+        flat = {}
+        for name, value in values.items():
+            if isinstance(value, dict):
+                flat.update({f'{name}.{key}': inner for key, inner in value.items()})
+            else:
+                flat[name] = value
+        typed = {}
+        for name, value in flat.items():
+            setting = self._resolve(name)
+            default = self.model.defaults[setting]
+            if setting in self.model.formulas:
+                raise AutomationError(INVALID_PARAMS, f"'{name}' is computed by a formula")
+            if isinstance(default, bool):
+                if not isinstance(value, bool):
+                    raise AutomationError(INVALID_PARAMS, f"'{name}' must be true or false")
+                typed[setting] = value
+                continue
+            # Numbers are read like the editor reads typed text, so 250 stays an int and 1.5 a float
+            value = parse_value(str(value), default) if not isinstance(value, bool) else str(value)
+            if isinstance(value, str):
+                raise AutomationError(INVALID_PARAMS, f"'{name}' must be a number")
+            typed[setting] = value
+        return typed
+
+    def _changes_of(self, func):
+        """Run func on the model; return the names of the settings it changed and what is invalid afterwards"""
+        changed = []
+
+        def observe(changes):
+            changed.extend(f'{section}.{key}' for section, key in changes)
+
+        self.model.subscribe(observe)
+        try:
+            func()
+        finally:
+            self.model.unsubscribe(observe)
+        return {'changed': changed, 'invalid': self.model.invalid_settings()}
+
+    def status(self):
+        def read():
+            mods_path = self.get_mods_path()
+            mod_file = f"{self.build_queue.mod_creator.mod_config.get('mod_folder_name', 'z_SCAM_P')}.pak"
+            return {
+                'version': VERSION,
+                'mode': self.mode,
+                'preset': self.preset,
+                'changed_settings': sum(not self.model.is_default(*setting) for setting in self.model.keys),
+                'mods_path': mods_path,
+                'mod_installed': bool(mods_path) and os.path.exists(os.path.join(mods_path, mod_file)),
+            }
+        status = self.call(read)
+        status['builds'] = self.build_queue.status()
+        return status
+
+    def get_config(self, include_defaults=False):
+        def read():
+            try:
+                config = self.model.to_config(bool(include_defaults))
+            except InvalidSettingError as e:
+                raise AutomationError(APP_ERROR, str(e)) from None
+            return {'config': config, 'prototypes': self.editor.prototype_overrides,
+                    'invalid': self.model.invalid_settings()}
+        return self.call(read)
+
+    def set_values(self, values):
+        def write():
+            typed = self._typed_values(values)
+            return self._changes_of(lambda: self.model.update(typed))
+        return self.call(write)
+
+    def load_preset(self, name=None, path=None):
+        if (name is None) == (path is None):
+            raise AutomationError(INVALID_PARAMS, "Give either name or path")
+
+        def load():
+            try:
+                config = self.resolver.resolve(name) if name is not None else self.resolver.resolve_file(path)
+            except PresetError as e:
+                raise AutomationError(APP_ERROR, str(e)) from None
+            config, prototypes = self.config_handler.split_prototype_sections(config)
+            try:
+                result = self._changes_of(lambda: self.model.load(config))
+            except FormulaError as e:
+                raise AutomationError(APP_ERROR, str(e)) from None
+            self.editor.prototype_overrides = prototypes
+            self.preset = name if name is not None else os.path.abspath(path)
+            result['preset'] = self.preset
+            return result
+        return self.call(load)
+
+    def build_mod(self, include_defaults=False, wait=True):
+        def snapshot():
+            issues = self.model.invalid_settings()
+            if issues:
+                raise AutomationError(APP_ERROR, "Invalid settings", issues)
+            mods_path = self.get_mods_path()
+            if not mods_path:
+                raise AutomationError(APP_ERROR, "No valid game directory set")
+            return self.model.to_config(bool(include_defaults)), dict(self.editor.prototype_overrides), mods_path
+        config, prototypes, mods_path = self.call(snapshot)
+        # Queued outside call(), so edits and other requests go on while it builds
+        future = self.build_queue.submit(config, prototypes, mods_path, source='automation')
+        if not wait:
+            return {'status': 'queued'}
+        result = future.result(BUILD_TIMEOUT)
+        if result['status'] == 'failed':
+            raise AutomationError(APP_ERROR, result['error'], result)
+        return result
+
+    def dispatch(self, method, params):
+        if method not in self.METHODS:
+            raise AutomationError(METHOD_NOT_FOUND, f"Unknown method '{method}'")
+        func = getattr(self, method)
+        try:
+            if isinstance(params, dict):
+                arguments = inspect.signature(func).bind(**params)
+            else:
+                arguments = inspect.signature(func).bind(*params)
+        except TypeError as e:
+            raise AutomationError(INVALID_PARAMS, str(e)) from None
+        return func(*arguments.args, **arguments.kwargs)
+
+
+class AutomationServer:
+    """Serves an AutomationService on a local endpoint whose address is published in the user data folder"""
+
+    def __init__(self, service, user_data_path):
+        self.service = service
+        self.info_path = os.path.join(user_data_path, INFO_FILE_NAME)
+        self._listener = None
+
+    def start(self):
+        from multiprocessing.connection import Listener
+
+        authkey = os.urandom(16)
+        self._listener = Listener(family=IPC_FAMILY, authkey=authkey)
+        info = {'pid': os.getpid(), 'family': IPC_FAMILY, 'mode': self.service.mode,
+                'address': self._listener.address, 'authkey': authkey.hex()}
+        temp_path = self.info_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(info, f)
+        os.replace(temp_path, self.info_path)
+        threading.Thread(target=self._serve, name='AutomationServer', daemon=True).start()
+        diagnostics_log.info('automation.started', mode=self.service.mode, address=str(self._listener.address))
+        return self._listener.address
+
+    def _serve(self):
+        from multiprocessing.connection import AuthenticationError
+
+        listener = self._listener
+        while True:
+            try:
+                conn = listener.accept()
+            except AuthenticationError as e:
+                diagnostics_log.warning('automation.rejected_client', error=str(e))
+                continue
+            except OSError:
+                # Listener closed by stop()
+                return
+            threading.Thread(target=self._handle_connection, args=(conn,), name='AutomationClient',
+                             daemon=True).start()
+
+    def _handle_connection(self, conn):
+        with conn:
+            while True:
+                try:
+                    data = conn.recv_bytes()
+                except (EOFError, OSError):
+                    return
+                response = self.handle_message(data)
+                if response is not None:
+                    try:
+                        conn.send_bytes(response)
+                    except OSError as e:
+                        diagnostics_log.warning('automation.send_failed', error=str(e))
+                        return
+
+    def handle_message(self, data):
+        """Response bytes to a JSON-RPC request or batch, or None if it only held notifications"""
+        try:
+            message = json.loads(data.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError) as e:
+            return self._encode(self._error(None, AutomationError(PARSE_ERROR, f"Parse error: {e}")))
+        if isinstance(message, list):
+            if not message:
+                return self._encode(self._error(None, AutomationError(INVALID_REQUEST, "Empty batch")))
+            responses = [response for response in map(self.handle_request, message) if response is not None]
+            return self._encode(responses) if responses else None
+        return self._encode(self.handle_request(message))
+
+    def handle_request(self, request):
+        """Response dict to one request, or None for a notification"""
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' \
+                or not isinstance(request.get('method'), str) \
+                or not isinstance(request.get('params', {}), (dict, list)):
+            return self._error(None, AutomationError(INVALID_REQUEST, "Invalid request"))
+        request_id = request.get('id')
+        try:
+            result = self.service.dispatch(request['method'], request.get('params', {}))
+        except AutomationError as e:
+            response = self._error(request_id, e)
+        except Exception as e:
+            diagnostics_log.exception('automation.request_failed', e, method=request['method'])
+            response = self._error(request_id, AutomationError(APP_ERROR, str(e)))
+        else:
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        return response if 'id' in request else None
+
+    @staticmethod
+    def _error(request_id, error):
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': error.to_json()}
+
+    @staticmethod
+    def _encode(response):
+        return json.dumps(response).encode('utf-8')
+
+    def stop(self):
+        if self._listener is None:
+            return
+        self._listener.close()
+        self._listener = None
+        try:
+            os.remove(self.info_path)
+        except OSError as e:
+            diagnostics_log.debug('automation.info_remove_failed', error=str(e))
+
+
+class AutomationClient:
+    """Calls a running endpoint; found through scam_automation.json in the user data folder"""
+
+    def __init__(self, user_data_path):
+        self.info_path = os.path.join(user_data_path, INFO_FILE_NAME)
+        self._conn = None
+        self._next_id = 0
+
+    def connect(self):
+        from multiprocessing.connection import Client
+
+        try:
+            with open(self.info_path, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ConnectionError(f"SCAM automation is not running ({self.info_path}: {e})") from None
+        self._conn = Client(info['address'], family=info['family'], authkey=bytes.fromhex(info['authkey']))
+        return self
+
+    def call(self, method, **params):
+        """Result of a method; raises AutomationError with the endpoint's error"""
+        self._next_id += 1
+        request = {'jsonrpc': '2.0', 'id': self._next_id, 'method': method, 'params': params}
+        self._conn.send_bytes(json.dumps(request).encode('utf-8'))
+        response = json.loads(self._conn.recv_bytes().decode('utf-8'))
+        if 'error' in response:
+            error = response['error']
+            raise AutomationError(error['code'], error['message'], error.get('data'))
+        return response['result']
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self.connect()
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,187 @@
+# modules/build_queue.py
+"""
+Background mod builds.
+
+ModInstaller builds and installs the mod through ModCreator, but first
+hashes the cfg files it would generate: when the hash matches the last
+install (or what the installed pak already holds), repak is not run. The
+pak is re-read when its size or mtime changed since, e.g. after the editor
+or another SCAM installed a different config.
+
+BuildQueue runs installs one at a time on a worker thread. The GUI sends
+every build through one queue (Create/Update, watch mode and the automation
+API), so they never write the same ~mods folder at once. Requests that
+arrive while another build is running wait for it. A request is merged into
+a build that is already waiting when both go to the same ~mods folder and
+come from the same source (e.g. 'automation', whose clients all edit one
+model), or send an equal config; the merged build installs the latest
+config. Anything else waits as a build of its own, so a burst from one
+source costs at most two builds and never installs another source's config.
+Every request gets a Future with the result of the build that covered it.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from .diagnostics_log import diagnostics_log
+from .file_watch import file_signature
+from .formulas import FORMULAS_SECTION
+from .pak import PakError, PakReader
+
+
+def cfg_hash(payloads):
+    """Hash of the generated files, {path in pak: bytes}"""
+    digest = hashlib.sha256()
+    for path in sorted(payloads):
+        digest.update(path.encode('utf-8') + b'\0')
+        digest.update(hashlib.sha256(payloads[path]).digest())
+    return digest.hexdigest()
+
+
+class ModInstaller:
+    """Installs configs into one ~mods folder, skipping builds that would not change the cfg files"""
+
+    def __init__(self, mod_creator, mods_path):
+        self.mod_creator = mod_creator
+        self.mods_path = mods_path
+        self.installed_hash = None
+        self.installed_signature = None  # file_signature of the pak installed_hash was taken from
+
+    @property
+    def pak_path(self):
+        mod_folder = self.mod_creator.mod_config.get('mod_folder_name', 'z_SCAM_P')
+        return os.path.join(self.mods_path, f'{mod_folder}.pak')
+
+    def _read_installed_hash(self, pak_path, entry_paths):
+        try:
+            with PakReader(pak_path) as pak:
+                if set(pak.entries) != set(entry_paths):
+                    return None
+                return cfg_hash({path: pak.read_entry(path) for path in entry_paths})
+        except (PakError, OSError) as e:
+            diagnostics_log.debug('build.installed_unreadable', path=pak_path, error=str(e))
+            return None
+
+    def install(self, config, prototypes=None):
+        """Build and install config ({section: {key: value}}); returns a result dict with a 'status'"""
+        start = time.perf_counter()
+        # create_mod drops these sections from the dict it is given; leave the caller's alone
+        config = {section: dict(values) for section, values in config.items()
+                  if section not in ('Aiming', FORMULAS_SECTION)}
+        prototypes = prototypes or {}
+        payloads = self.mod_creator.build_payloads(config, prototypes)
+        digest = cfg_hash(payloads)
+        result = {'status': None, 'cfg_hash': digest}
+        pak_path = self.pak_path
+        signature = file_signature(pak_path)
+        if self.installed_hash is None or signature != self.installed_signature:
+            # Not read yet, or rewritten or removed since
+            self.installed_hash = self._read_installed_hash(pak_path, payloads) if signature else None
+            self.installed_signature = signature
+        if digest == self.installed_hash:
+            result.update(status='unchanged', duration_ms=round((time.perf_counter() - start) * 1000, 1))
+            return result
+
+        try:
+            result['report'] = self.mod_creator.create_mod(config, self.mods_path, prototypes)
+        except Exception as e:
+            diagnostics_log.exception('build.failed', e, mods_path=self.mods_path)
+            result.update(status='failed', error=str(e))
+            # Whatever is installed now is unknown
+            self.installed_hash = None
+            return result
+        self.installed_hash = digest
+        self.installed_signature = file_signature(pak_path)
+        result.update(status='installed', duration_ms=round((time.perf_counter() - start) * 1000, 1))
+        return result
+
+
+class BuildQueue:
+    """Runs installs one at a time on a worker thread, merging requests that wait together"""
+
+    def __init__(self, mod_creator, profiler=None):
+        self.mod_creator = mod_creator
+        # An ActionProfiler; builds are profiled as 'build_mod' on the worker thread
+        self.profiler = profiler
+        self._installers = {}  # mods_path -> ModInstaller
+        self._condition = threading.Condition()
+        self._pending = deque()  # [config, prototypes, mods_path, source, futures] of the next builds
+        self._running = False
+        self._stopped = False
+        self.last_result = None
+        self.counts = {'requested': 0, 'merged': 0, 'installed': 0, 'unchanged': 0, 'failed': 0}
+        self._thread = threading.Thread(target=self._run, name='BuildQueue', daemon=True)
+        self._thread.start()
+
+    def submit(self, config, prototypes, mods_path, source=None):
+        """
+        Queue a build of config into mods_path; returns a Future of its result dict.
+
+        Requests with the same source may replace each other's config while they wait;
+        with source None only an equal config is merged.
+        """
+        future = Future()
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("Build queue is stopped")
+            self.counts['requested'] += 1
+            for pending in self._pending:
+                if pending[2] == mods_path and ((source is not None and pending[3] == source)
+                                                or pending[:2] == [config, prototypes]):
+                    # The waiting build has not started: it builds the newest config, once, for all of them
+                    pending[:2] = config, prototypes
+                    pending[4].append(future)
+                    self.counts['merged'] += 1
+                    break
+            else:
+                self._pending.append([config, prototypes, mods_path, source, [future]])
+            self._condition.notify()
+        return future
+
+    def status(self):
+        with self._condition:
+            return {
+                'running': self._running,
+                'waiting': sum(len(pending[4]) for pending in self._pending),
+                'counts': dict(self.counts),
+                'last_result': self.last_result,
+            }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                config, prototypes, mods_path, _source, futures = self._pending.popleft()
+                self._running = True
+            installer = self._installers.get(mods_path)
+            if installer is None:
+                installer = self._installers[mods_path] = ModInstaller(self.mod_creator, mods_path)
+            install = installer.install
+            if self.profiler is not None:
+                install = self.profiler.wrap('build_mod', install)
+            try:
+                result = install(config, prototypes)
+            except Exception as e:
+                # install() reports build failures itself; this is a bug in generating the payloads
+                diagnostics_log.exception('build.queue_failed', e)
+                result = {'status': 'failed', 'error': str(e)}
+            result['requests'] = len(futures)
+            with self._condition:
+                self._running = False
+                self.counts[result['status']] += 1
+                self.last_result = result
+            for future in futures:
+                future.set_result(result)
+
+    def stop(self):
+        """Finish the waiting builds, if any, and stop the worker"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
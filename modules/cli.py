@@ -0,0 +1,269 @@
+# modules/cli.py
+"""
+Command line interface for SCAM.
+
+Running the application with a command executes it instead of opening the
+GUI, e.g.:
+    "Stalker Character Adjustment Manager.py" analyze-mods --json
+Options given without a command are passed on to the GUI. Only one GUI
+window runs at a time: launching again (e.g. opening a preset file with SCAM)
+hands the request to the running window and exits.
+"""
+import argparse
+import json
+import os
+import shlex
+import signal
+import sys
+import time
+
+from .config import get_app_paths, get_mods_path, load_saved_game_directory
+from .diagnostics_log import diagnostics_log, LOG_DIR_NAME
+from .profiling import DEFAULT_PROFILE_MODE, PROFILE_MODES
+from .single_instance import SingleInstance
+from .stall_monitor import DEFAULT_THRESHOLD_MS
+from . import VERSION
+
+
+def _resolve_mods_path(args, user_data_path):
+    if args.mods_dir:
+        return os.path.abspath(args.mods_dir)
+    game_dir = load_saved_game_directory(user_data_path)
+    if not game_dir:
+        raise SystemExit("No game directory saved; pass the ~mods directory explicitly")
+    return get_mods_path(game_dir)
+
+
+def cmd_analyze_mods(args):
+    from .mod import ModCreator
+    from .mods_analyzer import ModsAnalyzer, format_report
+
+    base_path, user_data_path = get_app_paths()
+    analyzer = ModsAnalyzer(ModCreator(base_path), user_data_path)
+    report = analyzer.analyze(_resolve_mods_path(args, user_data_path))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+    return 0
+
+
+def cmd_lint(args):
+    from .config import ConfigHandler
+    from .preset_lint import PresetLinter, format_report
+
+    base_path, user_data_path = get_app_paths()
+    linter = PresetLinter(ConfigHandler(base_path, user_data_path), user_data_path, jobs=args.jobs)
+    report = linter.lint(args.presets_dir, use_cache=not args.no_cache)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report, show_info=args.show_unchanged))
+    return 1 if report['summary']['errors'] else 0
+
+
+def cmd_watch(args):
+    from .build_queue import BuildQueue
+    from .config import ConfigHandler
+    from .mod import ModCreator
+    from .preset_watch import PresetWatcher, WatchBuilder
+
+    base_path, user_data_path = get_app_paths()
+    if not os.path.exists(args.preset):
+        raise SystemExit(f"{args.preset} does not exist")
+    mods_path = _resolve_mods_path(args, user_data_path)
+    os.makedirs(mods_path, exist_ok=True)
+    packer_command = shlex.split(args.packer) if args.packer else None
+    # Bases are looked up next to the watched presets
+    presets_dir = args.preset if os.path.isdir(args.preset) else os.path.dirname(os.path.abspath(args.preset))
+    build_queue = BuildQueue(ModCreator(base_path, packer_command, interactive=False))
+    builder = WatchBuilder(ConfigHandler(base_path, user_data_path), build_queue, mods_path,
+                           include_defaults=args.force_defaults, presets_dir=presets_dir)
+
+    def on_change(path):
+        result = builder.build(path)
+        name = os.path.basename(path)
+        if result['status'] == 'installed':
+            print(f"{name}: installed in {result['duration_ms']:.0f} ms", flush=True)
+        elif result['status'] == 'unchanged':
+            print(f"{name}: no changes to the generated files, not rebuilt", flush=True)
+        elif result['status'] == 'invalid':
+            print(f"{name}: not built, " + "; ".join(result['issues']), flush=True)
+        else:
+            print(f"{name}: build failed, {result['error']}", flush=True)
+
+    watcher = PresetWatcher(args.preset, on_change)
+    print(f"Watching {watcher.target}, installing into {mods_path} (Ctrl+C to stop)", flush=True)
+    watcher.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+        build_queue.stop()
+    return 0
+
+
+def cmd_serve(args):
+    from .automation import AutomationServer, AutomationService
+    from .build_queue import BuildQueue
+    from .config import ConfigHandler
+    from .mod import ModCreator
+    from .settings_model import SettingsModel
+
+    base_path, user_data_path = get_app_paths()
+    mods_path = _resolve_mods_path(args, user_data_path)
+    os.makedirs(mods_path, exist_ok=True)
+    config_handler = ConfigHandler(base_path, user_data_path)
+    packer_command = shlex.split(args.packer) if args.packer else None
+    build_queue = BuildQueue(ModCreator(base_path, packer_command, interactive=False))
+    service = AutomationService(config_handler, SettingsModel.from_handler(config_handler), build_queue,
+                                lambda: mods_path)
+    server = AutomationServer(service, user_data_path)
+    address = server.start()
+    print(f"Serving automation on {address}, installing into {mods_path} (Ctrl+C to stop)", flush=True)
+    # Stopped by a service manager: clean up like Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        build_queue.stop()
+    return 0
+
+
+def cmd_rpc(args):
+    from .automation import AutomationClient, AutomationError
+
+    try:
+        params = json.loads(args.params) if args.params else {}
+    except ValueError as e:
+        raise SystemExit(f"PARAMS is not valid JSON: {e}")
+    if not isinstance(params, dict):
+        raise SystemExit("PARAMS must be a JSON object")
+    try:
+        with AutomationClient(get_app_paths()[1]) as client:
+            result = client.call(args.method, **params)
+    except (ConnectionError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    except AutomationError as e:
+        print(json.dumps(e.to_json(), indent=2), file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+def cmd_build_language_manifest(args):
+    from .localization.language_manager import write_language_manifest
+    print(f"Wrote {write_language_manifest()}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='scam',
+                                     description=f"SCAM - Stalker Character Adjustment Manager v{VERSION}")
+    parser.add_argument('--trace-startup', action='store_true',
+                        help="Record startup phase timings to startup_trace.json")
+    parser.add_argument('--profile-actions', nargs='?', const=DEFAULT_PROFILE_MODE, choices=PROFILE_MODES,
+                        help="Profile GUI commands into the profiles folder (default: cprofile)")
+    parser.add_argument('--monitor-stalls', nargs='?', const=DEFAULT_THRESHOLD_MS, type=int, metavar='THRESHOLD_MS',
+                        help=f"Record event-loop stalls longer than THRESHOLD_MS (default: {DEFAULT_THRESHOLD_MS})")
+    parser.add_argument('--preset', metavar='PATH',
+                        help="Load a preset file, in the running window if there is one")
+    parser.add_argument('--new-instance', action='store_true',
+                        help="Open another window even if SCAM is already running")
+    parser.add_argument('--automation', action='store_true',
+                        help="Serve the automation API from the window (see the serve and rpc commands)")
+    commands = parser.add_subparsers(dest='command')
+
+    analyze = commands.add_parser('analyze-mods', help="Report pak count, size and override order of ~mods")
+    analyze.add_argument('mods_dir', nargs='?', help="~mods directory (defaults to the saved game directory)")
+    analyze.add_argument('--json', action='store_true', help="Print the report as JSON")
+    analyze.set_defaults(func=cmd_analyze_mods)
+
+    lint = commands.add_parser('lint', help="Check preset files against the settings schema")
+    lint.add_argument('presets_dir', nargs='?', default='Presets',
+                      help="Preset file or folder, searched recursively (default: Presets)")
+    lint.add_argument('--json', action='store_true', help="Print the report as JSON")
+    lint.add_argument('--output', metavar='PATH', help="Also write the JSON report to PATH")
+    lint.add_argument('--jobs', type=int, help="Worker processes (default: one per CPU)")
+    lint.add_argument('--no-cache', action='store_true', help="Lint every file even if it was linted before")
+    lint.add_argument('--show-unchanged', action='store_true',
+                      help="Also list values that are the same as the default")
+    lint.set_defaults(func=cmd_lint)
+
+    watch = commands.add_parser('watch', help="Rebuild and reinstall the mod whenever a preset file is saved")
+    watch.add_argument('preset', nargs='?', default='Presets',
+                       help="Preset file, or folder of presets, to watch (default: Presets)")
+    watch.add_argument('--mods-dir', help="~mods directory (defaults to the saved game directory)")
+    watch.add_argument('--force-defaults', action='store_true',
+                       help="Write every setting to the mod, not only the changed ones")
+    watch.add_argument('--packer', metavar='COMMAND', help="Command to pack with instead of repak")
+    watch.set_defaults(func=cmd_watch)
+
+    serve = commands.add_parser('serve', help="Run the automation API without a window")
+    serve.add_argument('--mods-dir', help="~mods directory (defaults to the saved game directory)")
+    serve.add_argument('--packer', metavar='COMMAND', help="Command to pack with instead of repak")
+    serve.set_defaults(func=cmd_serve)
+
+    rpc = commands.add_parser('rpc', help="Call a method of the running automation API and print the result")
+    rpc.add_argument('method', help="status, get_config, set_values, load_preset or build_mod")
+    rpc.add_argument('params', nargs='?', help='Parameters as a JSON object, e.g. \'{"values": {"WalkSpeed": 250}}\'')
+    rpc.set_defaults(func=cmd_rpc)
+
+    manifest = commands.add_parser('build-language-manifest',
+                                   help="Regenerate the language manifest after adding or renaming a language")
+    manifest.set_defaults(func=cmd_build_language_manifest)
+
+    return parser
+
+
+def run_gui(args):
+    preset_path = os.path.abspath(args.preset) if args.preset else None
+    instance = None
+    if not args.new_instance:
+        instance = SingleInstance(get_app_paths()[1])
+        if not instance.acquire():
+            # Hand over to the running window before paying for Tk and the GUI modules
+            if instance.forward({'command': 'activate', 'preset': preset_path}):
+                return 0
+            print("SCAM is already running but did not respond; use --new-instance to open another window",
+                  file=sys.stderr)
+            return 1
+
+    from .gui import MovementConfigEditor
+    try:
+        app = MovementConfigEditor(trace_startup=args.trace_startup, profile_actions=args.profile_actions,
+                                   stall_threshold_ms=args.monitor_stalls, preset_path=preset_path,
+                                   instance=instance, automation=args.automation)
+        app.run()
+    finally:
+        if instance is not None:
+            instance.release()
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0].lower().endswith('.ini'):
+        # "Open with" passes the preset file on its own
+        argv = ['--preset'] + argv
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        # Only GUI options were given
+        return run_gui(args)
+    diagnostics_log.configure(os.path.join(get_app_paths()[1], LOG_DIR_NAME))
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,11 +2,74 @@
 import configparser
 import os
 import json
+import re
 import sys
 import sqlite3
+import time
+
+from .constraints import CONSTRAINTS_SECTION
+from .diagnostics_log import diagnostics_log
 
 DATA_FOLDER_NAME = "data"
 
+def get_app_paths():
+    """Return (base_path, user_data_path) for bundled resources and user files"""
+    if getattr(sys, 'frozen', False):
+        # For reading bundled resources (INI files, icons, etc.) and writing user data next to the exe
+        return sys._MEIPASS, os.path.dirname(sys.executable)
+    # For development, use the same path for both
+    base_path = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+    return base_path, base_path
+
+def get_mods_path(game_dir):
+    """Return the ~mods folder of a game directory"""
+    return os.path.join(game_dir, "Stalker2", "Content", "Paks", "~mods")
+
+def get_game_config_dirs():
+    """Return the game's user config folders under LOCALAPPDATA (Steam: Windows, Xbox: WinGDK)"""
+    local_app_data = os.getenv('LOCALAPPDATA')
+    if not local_app_data:
+        return []
+    config_root = os.path.join(local_app_data, 'Stalker2', 'Saved', 'Config')
+    return [os.path.join(config_root, 'Windows'), os.path.join(config_root, 'WinGDK')]
+
+def resolve_game_config_dir(game_dir=None, config_dirs=None):
+    """
+    Return the user config folder the installed game uses, or None if it cannot be told.
+
+    The game directory tells the versions apart (Binaries/WinGDK for Xbox, Win64 for Steam);
+    without it, the folder is only known when the game has created exactly one.
+    """
+    config_dirs = get_game_config_dirs() if config_dirs is None else config_dirs
+    by_platform = {os.path.basename(path): path for path in config_dirs}
+    if game_dir:
+        binaries = os.path.join(game_dir, 'Stalker2', 'Binaries')
+        for binaries_name, config_name in (('WinGDK', 'WinGDK'), ('Win64', 'Windows')):
+            if config_name in by_platform and os.path.isdir(os.path.join(binaries, binaries_name)):
+                return by_platform[config_name]
+    existing = [path for path in config_dirs if os.path.isdir(path)]
+    return existing[0] if len(existing) == 1 else None
+
+def load_saved_game_directory(user_data_path):
+    """Return the game directory saved in stalker_location.ini, or None"""
+    config = configparser.ConfigParser()
+    config.read(os.path.join(user_data_path, 'stalker_location.ini'))
+    if 'Directory' in config and 'path' in config['Directory']:
+        saved_dir = config['Directory']['path']
+        if saved_dir and os.path.exists(saved_dir):
+            return saved_dir
+    return None
+
+# Preset sections with this prefix hold overrides for other ObjPrototypes entries, e.g. [Prototype:NPCBase]
+PROTOTYPE_SECTION_PREFIX = "Prototype:"
+# A refkey names the generated <RefKey>Custom.cfg inside the pak, so it may not hold path characters
+PROTOTYPE_REFKEY_PATTERN = re.compile(r'[A-Za-z0-9_]+')
+
+def check_prototype_refkey(refkey):
+    """Raise ValueError unless refkey is letters, digits and underscores only"""
+    if not PROTOTYPE_REFKEY_PATTERN.fullmatch(refkey):
+        raise ValueError(f"Invalid prototype refkey '{refkey}': only letters, digits and _ are allowed")
+
 class ConfigHandler:
     def __init__(self, base_path, user_data_path=None):
         self.base_path = base_path
@@ -15,6 +78,8 @@ class ConfigHandler:
         self.default_config = {}
         self.descriptions = {}
         self.max_values = {}
+        # [Constraints] rules of the defaults file, {"Section.Key" or "Section.*": rule}
+        self.constraints = {}
         self.preferences_file = os.path.join(self.user_data_path, 'app_preferences.json')
         
         # For development fallback only - database is primary method
@@ -32,8 +97,8 @@ class ConfigHandler:
             try:
                 with open(self.preferences_file, 'r') as f:
                     return json.load(f)
-            except:
-                pass
+            except Exception as e:
+                diagnostics_log.warning('preferences.load_failed', path=self.preferences_file, error=str(e))
         return {}
 
     def save_preferences(self, preferences):
@@ -41,8 +106,8 @@ class ConfigHandler:
         try:
             with open(self.preferences_file, 'w', encoding='utf-8') as f:
                 json.dump(preferences, f, indent=2)
-        except:
-            pass
+        except Exception as e:
+            diagnostics_log.error('preferences.save_failed', path=self.preferences_file, error=str(e))
 
     def get_last_selected_preset(self):
         """Get the last selected preset from preferences"""
@@ -137,6 +202,7 @@ class ConfigHandler:
                     config.read(os.path.join(self.default_ini_path, 'default_values.ini'), encoding='utf-8')
         except Exception as e:
             # Fall back to default if any error occurs
+            diagnostics_log.exception('config.language_defaults_failed', e, level='warning')
             default_content = self.load_from_database('default_values.ini')
             if default_content:
                 config.read_string(default_content)
@@ -144,6 +210,10 @@ class ConfigHandler:
                 config.read(os.path.join(self.default_ini_path, 'default_values.ini'), encoding='utf-8')
         
         for section in config.sections():
+            if section == CONSTRAINTS_SECTION:
+                self.constraints = {key: value.split(';', 1)[0].strip() for key, value in config.items(section)
+                                    if not key.startswith(';')}
+                continue
             self.default_config[section] = {}
             self.descriptions[section] = {}
             self.max_values[section] = {}
@@ -199,6 +269,7 @@ class ConfigHandler:
     
     def load_from_database(self, filename):
         """Load file content from SQLite database"""
+        start = time.perf_counter()
         try:
             # Determine database path
             if getattr(sys, 'frozen', False):
@@ -224,9 +295,13 @@ class ConfigHandler:
             
             if result:
                 return result[0]
+            diagnostics_log.warning('config.database_missing_file', filename=filename, db_path=db_path)
             return None
             
         except Exception as e:
+            # Callers fall back to reading the INI file from disk
+            diagnostics_log.warning('config.database_unavailable', filename=filename, error=str(e),
+                                    duration_ms=round((time.perf_counter() - start) * 1000, 3))
             return None
 
     def load_ini_file(self, filename):
@@ -252,6 +327,26 @@ class ConfigHandler:
                     result[section][key] = value
         return result
 
+    def split_prototype_sections(self, config):
+        """Split a loaded preset into player settings and extra ObjPrototypes overrides"""
+        player_config = {}
+        prototypes = {}
+        for section, values in config.items():
+            if section.startswith(PROTOTYPE_SECTION_PREFIX):
+                refkey = section[len(PROTOTYPE_SECTION_PREFIX):]
+                check_prototype_refkey(refkey)
+                prototypes[refkey] = values
+            else:
+                player_config[section] = values
+        return player_config, prototypes
+
+    def join_prototype_sections(self, config, prototypes):
+        """Add extra ObjPrototypes overrides back to a config as preset sections"""
+        merged = dict(config)
+        for refkey, values in prototypes.items():
+            merged[f"{PROTOTYPE_SECTION_PREFIX}{refkey}"] = values
+        return merged
+
     def save_ini_file(self, config, filename):
         ini = configparser.ConfigParser()
         ini.optionxform = str
@@ -5,31 +5,86 @@ import os
 import configparser
 import shutil
 import json
+import queue
+import time
 from .localization.language_manager import get_current_localization, t, font
+from .config import load_saved_game_directory, get_game_config_dirs, get_mods_path
+from .ini_document import IniDocument
+from .diagnostics_log import diagnostics_log
+from .settings_model import SettingsModel, History, InvalidSettingError, SYNC_KEY, SYNCED_RATES, parse_value, format_value
+from .formulas import FORMULAS_SECTION, FormulaError
+from .file_watch import ModsWatcher
 import sys
 
+INPUT_SETTINGS_SECTION = '/Script/Engine.InputSettings'
+
+# Wait this long after the last keystroke in the game directory entry before checking the path
+GAME_DIR_DEBOUNCE_MS = 400
+# A path found not to be a game directory is searched again after this long
+INVALID_DIR_CACHE_SECONDS = 5
+# How often ~mods install/remove events from the watcher thread are picked up
+MODS_EVENT_POLL_MS = 250
+OLD_MOD_FILE_NAME = 'z_SCAMMovementAiming_P.pak'
+
+# Input.ini values that disable mouse smoothing and acceleration
+MOUSE_SETTINGS = {
+    'bViewAccelerationEnabled': 'False',
+    'bEnableMouseSmoothing': 'False'
+}
+
+class TkWidgets:
+    """Widget classes ConfigInterface creates; swap in stand-ins to run it without a display"""
+    Frame = ttk.Frame
+    Label = ttk.Label
+    Entry = ttk.Entry
+    Button = ttk.Button
+    Checkbutton = ttk.Checkbutton
+    Notebook = ttk.Notebook
+    Style = ttk.Style
+    BooleanVar = tk.BooleanVar
+    StringVar = tk.StringVar
+
 class ConfigInterface:
-    def __init__(self, parent, config_handler):
+    """Settings tabs and game directory controls; setting values live in a SettingsModel"""
+
+    def __init__(self, parent, config_handler, widgets=None, model=None):
         self.parent = parent
         self.config_handler = config_handler
+        self.widgets = widgets or TkWidgets
+        self.model = model or SettingsModel.from_handler(config_handler)
+        self.model.subscribe(self._on_model_change)
+        self.history = History(self.model)
         # Use the same user_data_path as the config_handler for consistency
         self.user_data_path = config_handler.user_data_path
         self.entries = {}
         self.checkboxes = {}
         self.labels = {}  # Store label references for color changes
         self.default_buttons = {}  # Track default buttons for each setting
+        self.formula_targets = set()  # Settings computed by a formula, whose entries are read-only
         self.notebook = None  # Reference to the notebook widget for tab color updates
-        self.sync_sensitivity = tk.BooleanVar(value=False)
-        self.game_dir = tk.StringVar()
+        self.tab_settings = {}  # Tab name -> (section, key) settings shown on it
+        self.setting_tabs = {}  # (section, key) -> name of the tab showing it
+        self.sync_sensitivity = self.widgets.BooleanVar(value=self.model.get(*SYNC_KEY))
+        self.sync_sensitivity.trace_add('write', lambda *args: self.model.set(*SYNC_KEY, self.sync_sensitivity.get()))
+        self.game_dir = self.widgets.StringVar()
         self.dir_entry = None
         self.mouse_btn = None
         self.mod_exists = False
+        # Whether game_dir is a valid game directory, as of its last (debounced) check
+        self.game_dir_valid = False
+        # Called after mod_exists or game_dir_valid may have changed
+        self.on_mod_status_change = None
+        self._game_dir_check = None  # Pending debounced check
+        self._found_game_dirs = {}  # Selected path -> (corrected path or None, time found)
+        self._saved_directory = None
+        self.mods_watcher = None
+        self.mods_events = queue.Queue()
         
         # Load mod configuration
         self.mod_config = self._load_mod_config()
         
         # Initialize style object (may be used for other styling)
-        self.style = ttk.Style()
+        self.style = self.widgets.Style()
         
         # Add trace to game_dir
         self.game_dir.trace_add('write', self._on_game_dir_change)
@@ -125,8 +180,8 @@ class ConfigInterface:
                 # Limit search depth to avoid going too deep
                 if root.count(os.sep) - selected_path.count(os.sep) >= 2:
                     break
-        except (PermissionError, OSError):
-            pass
+        except OSError as e:
+            diagnostics_log.debug('game_dir.search_failed', path=selected_path, error=str(e))
         
         # Search in parent directories (user might have selected subfolder)
         current_path = selected_path
@@ -161,68 +216,60 @@ class ConfigInterface:
         
         return None
 
+    def _find_game_directory(self, path):
+        """find_correct_game_directory with its results cached; a found directory is re-checked with one stat"""
+        cached = self._found_game_dirs.get(path)
+        if cached is not None:
+            corrected, found_at = cached
+            if corrected is not None and os.path.isdir(os.path.join(corrected, "Stalker2")):
+                return corrected
+            if corrected is None and time.monotonic() - found_at < INVALID_DIR_CACHE_SECONDS:
+                return None
+        corrected = self.find_correct_game_directory(path)
+        self._found_game_dirs[path] = (corrected, time.monotonic())
+        return corrected
+
     def set_notebook_reference(self, notebook):
         """Set reference to the notebook widget for tab color updates"""
         self.notebook = notebook
 
+    def create_setting_tabs(self, notebook):
+        """Add a tab per config section, then MovementParams and Aiming, to the notebook"""
+        # Set the notebook reference so tab colors can be updated
+        self.set_notebook_reference(notebook)
+        
+        for section in self.config_handler.default_config:
+            if section not in ['MovementParams', 'Aiming']:
+                frame = self.widgets.Frame(notebook)
+                notebook.add(frame, text=section)
+                self.setup_section_frame(frame, section)
+                self.tab_settings[section] = [(section, key) for key in self.config_handler.default_config[section]]
+
+        if 'MovementParams' in self.config_handler.default_config:
+            frame = self.widgets.Frame(notebook)
+            # Keep MovementParams in English - don't translate
+            notebook.add(frame, text="MovementParams")
+            self.setup_movement_frame(frame)
+            self.tab_settings['MovementParams'] = [('MovementParams', key) for key in self.config_handler.default_config['MovementParams']
+                                                   if ('MovementParams', key) not in SYNCED_RATES]
+        
+        frame = self.widgets.Frame(notebook)
+        # Keep Aiming in English - don't translate
+        notebook.add(frame, text="Aiming")
+        self.setup_aiming_section(frame)
+        # The sync flag only counts as a change when the defaults define it
+        self.tab_settings['Aiming'] = [setting for setting in (SYNC_KEY,) + SYNCED_RATES if setting in self.model.keys]
+        self.setting_tabs = {setting: tab for tab, settings in self.tab_settings.items() for setting in settings}
+
     def has_category_changes(self, section):
         """Check if a specific category has any changes from defaults"""
-        # Special case for Aiming section - check aiming-related MovementParams
-        if section == 'Aiming':
-            # Check sync sensitivity setting
-            if 'Aiming' in self.config_handler.default_config and 'SyncTurnRate' in self.config_handler.default_config['Aiming']:
-                if self.sync_sensitivity.get() != self.config_handler.default_config['Aiming']['SyncTurnRate']:
-                    return True
-            
-            # Check BaseTurnRate and BaseLookUpRate (displayed in Aiming tab but stored as MovementParams)
-            for aiming_key in ['BaseTurnRate', 'BaseLookUpRate']:
-                if ('MovementParams', aiming_key) in self.entries:
-                    entry = self.entries[('MovementParams', aiming_key)]
-                    current_value = entry.get().strip()
-                    default_value = str(self.config_handler.default_config['MovementParams'][aiming_key])
-                    if current_value != default_value:
-                        return True
-            return False
-        
-        # Special case for MovementParams - exclude aiming-related settings that are shown in Aiming tab
-        if section == 'MovementParams':
-            for (sec, key), entry in self.entries.items():
-                if sec == section and key not in ['BaseTurnRate', 'BaseLookUpRate']:
-                    current_value = entry.get().strip()
-                    default_value = str(self.config_handler.default_config[section][key])
-                    if current_value != default_value:
-                        return True
-            
-            for (sec, key), checkbox in self.checkboxes.items():
-                if sec == section:
-                    current_value = checkbox.get()
-                    default_value = self.config_handler.default_config[section][key]
-                    if current_value != default_value:
-                        return True
-            
-            return False
-        
-        # General case for all other sections
-        # Check entries
-        for (sec, key), entry in self.entries.items():
-            if sec == section:
-                current_value = entry.get().strip()
-                default_value = str(self.config_handler.default_config[section][key])
-                if current_value != default_value:
-                    return True
-        
-        # Check checkboxes
-        for (sec, key), checkbox in self.checkboxes.items():
-            if sec == section:
-                current_value = checkbox.get()
-                default_value = self.config_handler.default_config[section][key]
-                if current_value != default_value:
-                    return True
-        
-        return False
+        settings = self.tab_settings.get(section)
+        if settings is None:
+            settings = [(section, key) for key in self.config_handler.default_config.get(section, {})]
+        return self.model.has_changes(settings)
 
-    def update_tab_colors(self):
-        """Update tab colors based on category changes"""
+    def update_tab_colors(self, tabs=None):
+        """Update tab colors based on category changes, of the named tabs only if tabs is given"""
         if not self.notebook:
             return
             
@@ -230,6 +277,8 @@ class ConfigInterface:
             tab_text = self.notebook.tab(i, "text")
             # Remove any existing indicator
             clean_text = tab_text.replace("● ", "").replace("* ", "")
+            if tabs is not None and clean_text not in tabs:
+                continue
             has_changes = self.has_category_changes(clean_text)
             
             if has_changes:
@@ -244,50 +293,71 @@ class ConfigInterface:
 
     def reset_to_default(self, section, key):
         """Reset a specific setting to its default value"""
-        default_value = self.config_handler.default_config[section][key]
-        
-        # Special case: if resetting BaseTurnRate or BaseLookUpRate to default, uncheck sync
-        if section == 'MovementParams' and key in ['BaseTurnRate', 'BaseLookUpRate']:
-            self.sync_sensitivity.set(False)
-        
-        if isinstance(default_value, bool):
+        self.model.reset(section, key)
+
+    def _on_model_change(self, changes):
+        """Show changed model values in their widgets, then refresh the tab indicators once"""
+        if any(section == FORMULAS_SECTION for section, key in changes):
+            self.update_formula_targets()
+        for (section, key), (old, new) in changes.items():
+            if section == FORMULAS_SECTION:
+                continue
+            if (section, key) == SYNC_KEY:
+                if self.sync_sensitivity.get() != new:
+                    self.sync_sensitivity.set(new)
+                continue
             if (section, key) in self.checkboxes:
-                self.checkboxes[(section, key)].set(default_value)
-        else:
-            if (section, key) in self.entries:
+                var = self.checkboxes[(section, key)]
+                if var.get() != new:
+                    var.set(new)
+            elif (section, key) in self.entries:
                 entry = self.entries[(section, key)]
-                entry.delete(0, tk.END)
-                entry.insert(0, str(default_value))
-                entry.configure(foreground='black')
-        
-        # Update default button state and label color
+                # Leave the text alone when it already reads as the new value, e.g. while typing "1.50"
+                current = parse_value(entry.get(), self.model.defaults[(section, key)])
+                if type(current) is not type(new) or current != new:
+                    readonly = (section, key) in self.formula_targets
+                    if readonly:
+                        entry.configure(state='normal')
+                    entry.delete(0, tk.END)
+                    entry.insert(0, format_value(new))
+                    if readonly:
+                        entry.configure(state='readonly')
+            self.refresh_setting(section, key)
+        # Settings compared with a changed one may have become valid or invalid too
+        related = {watcher for setting in changes for watcher in self.model.constraints.watchers(setting)}
+        for section, key in related.difference(changes):
+            self.refresh_setting(section, key)
+        self.update_tab_colors({self.setting_tabs.get(setting) for setting in changes})
+
+    def update_formula_targets(self):
+        """Make the entries of settings a formula computes read-only, and editable again once it is gone"""
+        targets = set(self.model.formulas.order)
+        for setting in targets.symmetric_difference(self.formula_targets):
+            if setting in self.entries:
+                self.entries[setting].configure(state='readonly' if setting in targets else 'normal')
+        previous, self.formula_targets = self.formula_targets, targets
+        for setting in targets.symmetric_difference(previous):
+            self.update_default_button_state(*setting)
+
+    def refresh_setting(self, section, key):
+        """Update the entry color, default button and label of a setting from the model"""
+        if (section, key) in self.entries:
+            if self.model.validate(section, key):
+                color = 'red'
+            else:
+                color = 'black' if self.model.is_default(section, key) else 'green'
+            self.entries[(section, key)].configure(foreground=color)
         self.update_default_button_state(section, key)
         self.update_label_color(section, key)
-        
-        # Update tab colors
-        self.update_tab_colors()
 
     def update_default_button_state(self, section, key):
         """Update the state of default button for a specific setting"""
         if (section, key) not in self.default_buttons:
             return
         
-        default_value = self.config_handler.default_config[section][key]
-        
-        is_default = False
-        
-        if isinstance(default_value, bool):
-            if (section, key) in self.checkboxes:
-                current_value = self.checkboxes[(section, key)].get()
-                is_default = current_value == default_value
-        else:
-            if (section, key) in self.entries:
-                current_value = self.entries[(section, key)].get().strip()
-                is_default = current_value == str(default_value)
-        
         # Enable/disable button based on whether value is at default
         button = self.default_buttons[(section, key)]
-        if is_default:
+        if self.model.is_default(section, key) or (section, key) in self.formula_targets:
             button.configure(state='disabled')
         else:
             button.configure(state='normal')
@@ -298,83 +368,98 @@ class ConfigInterface:
             self.update_default_button_state(section, key)
             self.update_label_color(section, key)
 
-    def _on_checkbox_change(self, section, key):
-        """Called when a checkbox value changes"""
-        self.update_default_button_state(section, key)
-        self.update_label_color(section, key)
-        self.update_tab_colors()
-
     def update_label_color(self, section, key):
         """Update the label color based on whether the value is different from default or invalid"""
         if (section, key) not in self.labels:
             return
-            
-        label = self.labels[(section, key)]
         
-        default_value = self.config_handler.default_config[section][key]
-        
-        if isinstance(default_value, bool):
-            if (section, key) in self.checkboxes:
-                current_value = self.checkboxes[(section, key)].get()
-                is_default = current_value == default_value
-                # Boolean values can't be invalid, so just green if changed, black if default
-                if is_default:
-                    label.configure(foreground='black', font=font('bold'))
-                else:
-                    label.configure(foreground='green', font=font('bold'))
+        # Set label color based on validity and whether it's changed
+        label = self.labels[(section, key)]
+        if self.model.validate(section, key):
+            label.configure(foreground='red', font=font('bold'))
+        elif self.model.is_default(section, key):
+            label.configure(foreground='black', font=font('bold'))
         else:
-            if (section, key) in self.entries:
-                current_value = self.entries[(section, key)].get().strip()
-                is_default = current_value == str(default_value)
-                
-                # Check if value is invalid
-                is_invalid = False
-                if isinstance(default_value, (int, float)):
-                    # Empty value is invalid
-                    if not current_value:
-                        is_invalid = True
-                    else:
-                        try:
-                            if '.' in current_value:
-                                value = float(current_value)
-                            else:
-                                value = int(current_value)
-                            
-                            # Check if exceeds maximum
-                            if section in self.config_handler.max_values and key in self.config_handler.max_values[section]:
-                                if value > self.config_handler.max_values[section][key]:
-                                    is_invalid = True
-                        except ValueError:
-                            is_invalid = True
-                
-                # Set label color based on validity and whether it's changed
-                if is_invalid:
-                    label.configure(foreground='red', font=font('bold'))
-                elif is_default:
-                    label.configure(foreground='black', font=font('bold'))
-                else:
-                    label.configure(foreground='green', font=font('bold'))
+            label.configure(foreground='green', font=font('bold'))
 
     def _on_game_dir_change(self, *args):
-        """Called whenever game_dir StringVar changes"""
+        """Called whenever game_dir StringVar changes; checks the path once typing pauses"""
+        if self._game_dir_check is not None:
+            self.parent.after_cancel(self._game_dir_check)
+        self._game_dir_check = self.parent.after(GAME_DIR_DEBOUNCE_MS, self.refresh_game_dir)
+
+    def refresh_game_dir(self):
+        """Check game_dir now: correct and save it if valid, watch its ~mods and notify the GUI"""
+        if self._game_dir_check is not None:
+            self.parent.after_cancel(self._game_dir_check)
+            self._game_dir_check = None
         path = self.game_dir.get()
-        if path and os.path.exists(path) and os.path.exists(os.path.join(path, "Stalker2")):
-            self._check_mod_exists()
-            # Notify parent GUI to update buttons
-            if hasattr(self.parent, 'update_mod_buttons'):
-                self.parent.update_mod_buttons()
+        self.game_dir_valid = self.validate_game_directory(path, show_error=False)
+        if self.game_dir_valid:
+            self._watch_mods(self.current_mods_path())
+        else:
+            self.mod_exists = False
+            self._stop_mods_watcher()
+        self._notify_mod_status()
+
+    def _notify_mod_status(self):
+        if self.on_mod_status_change is not None:
+            self.on_mod_status_change()
+
+    def current_mods_path(self):
+        return get_mods_path(self.game_dir.get())
+
+    def get_mod_file_names(self):
+        """Names of the paks the mod is installed as: the current one and the one of old versions"""
+        return [f"{self.mod_config.get('mod_folder_name', 'z_SCAM_P')}.pak", OLD_MOD_FILE_NAME]
+
+    def _watch_mods(self, mods_path):
+        """Keep mod_exists up to date with installs and removals in mods_path"""
+        if self.mods_watcher is not None and self.mods_watcher.mods_path == mods_path:
+            return
+        self._stop_mods_watcher()
+        self.mods_events = queue.Queue()
+        self.mods_watcher = ModsWatcher(mods_path, self.get_mod_file_names(), self.mods_events.put)
+        self.mods_watcher.start()
+        self.parent.after(MODS_EVENT_POLL_MS, self._poll_mods_events, self.mods_watcher)
+
+    def _stop_mods_watcher(self):
+        if self.mods_watcher is not None:
+            self.mods_watcher.stop()
+            self.mods_watcher = None
+
+    def _poll_mods_events(self, watcher):
+        if watcher is not self.mods_watcher:
+            # Stopped, or replaced by a watcher of another ~mods folder with its own polling
+            return
+        changed = False
+        while True:
+            try:
+                installed = self.mods_events.get_nowait()
+            except queue.Empty:
+                break
+            diagnostics_log.info('mods.mod_installed' if installed else 'mods.mod_removed', mods_path=watcher.mods_path)
+            self.mod_exists = installed
+            changed = True
+        if changed:
+            self._notify_mod_status()
+        self.parent.after(MODS_EVENT_POLL_MS, self._poll_mods_events, watcher)
+
+    def close(self):
+        """Stop the ~mods watcher and any pending check, e.g. before the interface is replaced"""
+        if self._game_dir_check is not None:
+            self.parent.after_cancel(self._game_dir_check)
+            self._game_dir_check = None
+        self._stop_mods_watcher()
 
     def _check_mod_exists(self):
         """Internal method to check if mod exists"""
         self.mod_exists = False
         path = self.game_dir.get()
-        if path and os.path.exists(path) and os.path.exists(os.path.join(path, "Stalker2")):
-            mods_path = os.path.join(path, "Stalker2", "Content", "Paks", "~mods")
+        if path and os.path.exists(os.path.join(path, "Stalker2")):
+            mods_path = self.current_mods_path()
             # Check for both old and new mod file names
-            old_mod_file = os.path.join(mods_path, 'z_SCAMMovementAiming_P.pak')
-            mod_folder = self.mod_config.get('mod_folder_name', 'z_SCAM_P')
-            new_mod_file = os.path.join(mods_path, f'{mod_folder}.pak')
-            self.mod_exists = os.path.exists(old_mod_file) or os.path.exists(new_mod_file)
+            self.mod_exists = any(os.path.exists(os.path.join(mods_path, name)) for name in self.get_mod_file_names())
 
     def update_mod_status(self):
         """Public method to check mod status"""
@@ -386,11 +471,12 @@ class ConfigInterface:
             return False
         
         # Try to find the correct directory
-        corrected_path = self.find_correct_game_directory(path)
+        corrected_path = self._find_game_directory(path)
         
         if corrected_path:
             # Found a valid path (either original or corrected), use it
-            self.game_dir.set(corrected_path)
+            if self.game_dir.get() != corrected_path:
+                self.game_dir.set(corrected_path)
             self.save_directory(corrected_path)
             self._check_mod_exists()
             return True
@@ -405,20 +491,19 @@ class ConfigInterface:
 
     def load_saved_directory(self):
         try:
-            config = configparser.ConfigParser()
-            stalker_location_path = os.path.join(self.user_data_path, 'stalker_location.ini')
-            config.read(stalker_location_path)
-            if 'Directory' in config and 'path' in config['Directory']:
-                saved_dir = config['Directory']['path']
-                if saved_dir and os.path.exists(saved_dir):
-                    self.game_dir.set(saved_dir)
-                    # Initial mod check
-                    self._check_mod_exists()
-        except:
-            pass
+            saved_dir = load_saved_game_directory(self.user_data_path)
+            if saved_dir:
+                self._saved_directory = saved_dir
+                self.game_dir.set(saved_dir)
+                # Initial check right away, so the mod buttons start out right
+                self.refresh_game_dir()
+        except Exception as e:
+            diagnostics_log.exception('game_dir.load_saved_failed', e, level='warning')
 
     def save_directory(self, directory):
-        if directory:
+        # Only write stalker_location.ini when the directory changes
+        if directory and directory != self._saved_directory:
+            self._saved_directory = directory
             config = configparser.ConfigParser()
             config['Directory'] = {'path': directory}
             stalker_location_path = os.path.join(self.user_data_path, 'stalker_location.ini')
@@ -426,42 +511,43 @@ class ConfigInterface:
                 config.write(f)
 
     def setup_game_dir_frame(self, frame):
-        dir_frame = ttk.Frame(frame)
+        dir_frame = self.widgets.Frame(frame)
         dir_frame.pack(fill='x', padx=5, pady=5)
 
-        note_frame = ttk.Frame(dir_frame)
+        note_frame = self.widgets.Frame(dir_frame)
         note_frame.pack(fill='x', pady=(0, 5))
         
         loc = get_current_localization()
-        ttk.Label(note_frame, text=loc.get_label("set_game_directory_note"),
+        self.widgets.Label(note_frame, text=loc.get_label("set_game_directory_note"),
                  font=font('small')).pack(side='left', padx=5)
         
         # Example paths
-        label_frame = ttk.Frame(dir_frame)
+        label_frame = self.widgets.Frame(dir_frame)
         label_frame.pack(fill='x', pady=2)
         
-        ttk.Label(label_frame, text=loc.get_label("example_paths"), font=font('small')).pack(side='left')
-        ttk.Label(label_frame, text=loc.get_label("steam_path"),
+        self.widgets.Label(label_frame, text=loc.get_label("example_paths"), font=font('small')).pack(side='left')
+        self.widgets.Label(label_frame, text=loc.get_label("steam_path"),
                  font=font('small')).pack(side='left', padx=5)
-        ttk.Label(label_frame, text=loc.get_label("xbox_path"),
+        self.widgets.Label(label_frame, text=loc.get_label("xbox_path"),
                  font=font('small')).pack(side='left', padx=5)
         
         # Directory input
-        input_frame = ttk.Frame(dir_frame)
+        input_frame = self.widgets.Frame(dir_frame)
         input_frame.pack(fill='x', pady=2)
         
-        ttk.Label(input_frame, text=t("game_directory")).pack(side='left', padx=5)
-        self.dir_entry = ttk.Entry(input_frame, textvariable=self.game_dir, width=55)
+        self.widgets.Label(input_frame, text=t("game_directory")).pack(side='left', padx=5)
+        self.dir_entry = self.widgets.Entry(input_frame, textvariable=self.game_dir, width=55)
         self.dir_entry.pack(side='left', padx=5, fill='x', expand=True)
 
-        ttk.Button(input_frame, text=t("browse"), command=self.browse_directory).pack(side='left', padx=5)
-        ttk.Button(input_frame, text=t("open_mod_directory"), command=self.open_game_directory).pack(side='left', padx=5)
+        self.widgets.Button(input_frame, text=t("browse"), command=self.browse_directory).pack(side='left', padx=5)
+        self.widgets.Button(input_frame, text=t("open_mod_directory"), command=self.open_game_directory).pack(side='left', padx=5)
 
     def browse_directory(self):
         dir_path = filedialog.askdirectory(title="Select Stalker 2 Directory")
         if dir_path:
             # validate_game_directory now handles correction and setting the directory
-            self.validate_game_directory(dir_path, show_error=True)
+            if self.validate_game_directory(dir_path, show_error=True):
+                self.refresh_game_dir()
 
     def open_game_directory(self):
         if not self.game_dir.get():
@@ -474,7 +560,7 @@ class ConfigInterface:
         if not self.validate_game_directory(self.game_dir.get(), show_error=True):
             return
             
-        mods_path = os.path.join(self.game_dir.get(), "Stalker2", "Content", "Paks", "~mods")
+        mods_path = self.current_mods_path()
         if not os.path.exists(mods_path):
             os.makedirs(mods_path)
         os.startfile(mods_path)
@@ -490,7 +576,7 @@ class ConfigInterface:
         if not self.validate_game_directory(self.game_dir.get(), show_error=True):
             return False
             
-        mods_path = os.path.join(self.game_dir.get(), "Stalker2", "Content", "Paks", "~mods")
+        mods_path = self.current_mods_path()
         if not os.path.exists(mods_path):
             os.makedirs(mods_path)
             
@@ -500,19 +586,14 @@ class ConfigInterface:
         """Remove the mod file (handles both old and new file names)"""
         try:
             if self.game_dir.get() and self.validate_game_directory(self.game_dir.get(), show_error=False):
-                mods_path = os.path.join(self.game_dir.get(), "Stalker2", "Content", "Paks", "~mods")
+                mods_path = self.current_mods_path()
                 # Check for both old and new mod file names
-                old_mod_file = os.path.join(mods_path, 'z_SCAMMovementAiming_P.pak')
-                mod_folder = self.mod_config.get('mod_folder_name', 'z_SCAM_P')
-                new_mod_file = os.path.join(mods_path, f'{mod_folder}.pak')
-                
                 removed = False
-                if os.path.exists(old_mod_file):
-                    os.remove(old_mod_file)
-                    removed = True
-                if os.path.exists(new_mod_file):
-                    os.remove(new_mod_file)
-                    removed = True
+                for name in self.get_mod_file_names():
+                    mod_file = os.path.join(mods_path, name)
+                    if os.path.exists(mod_file):
+                        os.remove(mod_file)
+                        removed = True
                 
                 if removed:
                     self.mod_exists = False
@@ -525,110 +606,45 @@ class ConfigInterface:
             return False
 
     def get_mouse_smoothing_state(self):
-        config_paths = [
-            os.path.join(os.getenv('LOCALAPPDATA'), 'Stalker2', 'Saved', 'Config', 'Windows', 'Input.ini'),
-            os.path.join(os.getenv('LOCALAPPDATA'), 'Stalker2', 'Saved', 'Config', 'WinGDK', 'Input.ini')
-        ]
-        
-        mouse_settings = {
-            'bViewAccelerationEnabled': 'False',
-            'bEnableMouseSmoothing': 'False'
-        }
-        
-        for path in config_paths:
+        """Return True if mouse smoothing is still enabled (settings not applied in the game's Input.ini)"""
+        for config_dir in get_game_config_dirs():
+            path = os.path.join(config_dir, 'Input.ini')
             if os.path.exists(path):
                 try:
-                    with open(path, 'r') as f:
-                        content = f.read()
-                        if '[/Script/Engine.InputSettings]' in content:
-                            # Check if any settings are missing or have different values
-                            for setting, value in mouse_settings.items():
-                                setting_str = f"{setting}={value}"
-                                if setting_str not in content:
-                                    return True
-                            return False
-                except:
-                    pass
+                    doc = IniDocument.load(path)
+                    if doc.has_section(INPUT_SETTINGS_SECTION):
+                        # Check if any settings are missing or have different values
+                        return any(doc.get(INPUT_SETTINGS_SECTION, setting) != value
+                                   for setting, value in MOUSE_SETTINGS.items())
+                except OSError as e:
+                    diagnostics_log.warning('input_ini.read_failed', path=path, error=str(e))
         return True
 
     def get_mouse_smoothing_button_text(self):
         loc = get_current_localization()
         return loc.get_button("remove_mouse_smoothing") if self.get_mouse_smoothing_state() else loc.get_button("re_enable_mouse_smoothing")
 
+    def _apply_mouse_settings(self, doc, smoothing_enabled):
+        """Add or remove the mouse smoothing settings, leaving the rest of the file untouched"""
+        doc.ensure_section(INPUT_SETTINGS_SECTION)
+        for setting, value in MOUSE_SETTINGS.items():
+            if smoothing_enabled:
+                doc.remove(INPUT_SETTINGS_SECTION, setting)
+            else:
+                doc.set(INPUT_SETTINGS_SECTION, setting, value)
+
     def toggle_mouse_smoothing(self):
-        config_paths = [
-            os.path.join(os.getenv('LOCALAPPDATA'), 'Stalker2', 'Saved', 'Config', 'Windows'),
-            os.path.join(os.getenv('LOCALAPPDATA'), 'Stalker2', 'Saved', 'Config', 'WinGDK')
-        ]
-        
         input_ini_found = False
         current_state = self.get_mouse_smoothing_state()
         new_state = not current_state
         
-        mouse_settings = {
-            'bViewAccelerationEnabled': 'False',
-            'bEnableMouseSmoothing': 'False'
-        }
-        
-        for path in config_paths:
-            if not os.path.exists(path):
-                continue
-                
-            input_ini_path = os.path.join(path, 'Input.ini')
+        for config_dir in get_game_config_dirs():
+            input_ini_path = os.path.join(config_dir, 'Input.ini')
             if os.path.exists(input_ini_path):
                 try:
-                    with open(input_ini_path, 'r') as f:
-                        lines = f.readlines()
-                    
-                    new_content = []
-                    sections = {}
-                    current_section = None
-                    
-                    # First pass: organize content into sections
-                    for line in lines:
-                        stripped_line = line.strip()
-                        if stripped_line.startswith('['):
-                            current_section = stripped_line
-                            sections[current_section] = []
-                        elif current_section and stripped_line:
-                            if current_section == '[/Script/Engine.InputSettings]':
-                                if not any(setting in line for setting in mouse_settings.keys()):
-                                    sections[current_section].append(line)
-                            else:
-                                sections[current_section].append(line)
-                    
-                    # Second pass: reconstruct content
-                    input_settings = '[/Script/Engine.InputSettings]'
-                    
-                    # Handle InputSettings section
-                    if input_settings in sections and sections[input_settings]:
-                        new_content.append(f"{input_settings}\n")
-                        new_content.extend(sections[input_settings])
-                        if not new_state:
-                            if not new_content[-1].endswith('\n'):
-                                new_content.append('\n')
-                    elif not new_state:
-                        new_content.append(f"{input_settings}\n")
-                    
-                    # Add mouse settings if removing mouse smoothing
-                    if not new_state:
-                        for setting, value in mouse_settings.items():
-                            new_content.append(f"{setting}={value}\n")
-                    
-                    # Add other sections
-                    for section, content in sections.items():
-                        if section != input_settings:
-                            if new_content:
-                                new_content.append('\n')
-                            new_content.append(f"{section}\n")
-                            new_content.extend(content)
-                    
-                    # Remove trailing empty lines
-                    while new_content and new_content[-1].strip() == '':
-                        new_content.pop()
-                    
-                    with open(input_ini_path, 'w', encoding='utf-8') as f:
-                        f.writelines(new_content)
+                    doc = IniDocument.load(input_ini_path)
+                    self._apply_mouse_settings(doc, new_state)
+                    doc.save()
                     
                     self.mouse_btn.configure(text=self.get_mouse_smoothing_button_text())
                     loc = get_current_localization()
@@ -649,45 +665,10 @@ class ConfigInterface:
 
     def create_default_input_ini(self, smoothing_enabled):
         try:
-            # Read existing content if file exists
-            existing_content = {}
-            input_ini_path = os.path.join(self.user_data_path, 'Input.ini')
-            if os.path.exists(input_ini_path):
-                with open(input_ini_path, 'r') as f:
-                    current_section = None
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith('['):
-                            current_section = line
-                            existing_content[current_section] = []
-                        elif current_section and line:
-                            if not any(setting in line for setting in ['bViewAccelerationEnabled', 'bEnableMouseSmoothing']):
-                                existing_content[current_section].append(line)
-
-            # Create new content
-            content = ""
-            engine_settings = "[/Script/Engine.InputSettings]\n"
-            
-            if smoothing_enabled:
-                # Remove mouse smoothing settings
-                if existing_content.get('[/Script/Engine.InputSettings]'):
-                    engine_settings += "\n".join(existing_content['[/Script/Engine.InputSettings]']) + "\n"
-            else:
-                # Add mouse smoothing settings
-                engine_settings += "bViewAccelerationEnabled=False\n"
-                engine_settings += "bEnableMouseSmoothing=False\n"
-                if existing_content.get('[/Script/Engine.InputSettings]'):
-                    engine_settings += "\n".join(existing_content['[/Script/Engine.InputSettings]']) + "\n"
-            
-            content += engine_settings
-            
-            # Add other sections
-            for section, lines in existing_content.items():
-                if section != '[/Script/Engine.InputSettings]':
-                    content += f"\n{section}\n" + "\n".join(lines) + "\n"
-                    
-            with open(input_ini_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Edit the existing file in the current folder if there is one
+            doc = IniDocument.load(os.path.join(self.user_data_path, 'Input.ini'))
+            self._apply_mouse_settings(doc, smoothing_enabled)
+            doc.save()
                 
             loc = get_current_localization()
             messagebox.showinfo(loc.get_title("instructions"), 
@@ -701,34 +682,35 @@ class ConfigInterface:
     def setup_section_frame(self, frame, section):
         row = 0
         for key, value in self.config_handler.default_config[section].items():
-            label = ttk.Label(frame, text=key, font=font('bold'))
+            label = self.widgets.Label(frame, text=key, font=font('bold'))
             label.grid(row=row, column=0, padx=5, pady=2, sticky='e')
             self.labels[(section, key)] = label  # Store label reference
             
             if isinstance(value, bool):
-                var = tk.BooleanVar(value=value)
-                checkbox = ttk.Checkbutton(frame, variable=var)
+                var = self.widgets.BooleanVar(value=self.model.get(section, key))
+                checkbox = self.widgets.Checkbutton(frame, variable=var)
                 checkbox.grid(row=row, column=1, padx=5, pady=2, sticky='w')
                 self.checkboxes[(section, key)] = var
                 # Add trace to update default button state and tab colors when checkbox changes
                 var.trace_add('write', lambda *args, s=section, k=key: self._on_checkbox_change(s, k))
                 # Create default button for boolean settings
-                default_btn = ttk.Button(frame, text=t("default"), command=lambda s=section, k=key: self.reset_to_default(s, k))
+                default_btn = self.widgets.Button(frame, text=t("default"), command=lambda s=section, k=key: self.reset_to_default(s, k))
                 default_btn.grid(row=row, column=2, padx=5, pady=2, sticky='w')
                 self.default_buttons[(section, key)] = default_btn
             else:
-                entry = ttk.Entry(frame)
-                entry.insert(0, str(value))
+                entry = self.widgets.Entry(frame)
+                entry.insert(0, format_value(self.model.get(section, key)))
                 entry.grid(row=row, column=1, padx=5, pady=2, sticky='w')
                 entry.bind('<KeyRelease>', lambda e, s=section, k=key: self.validate_entry(s, k))
                 self.entries[(section, key)] = entry
                 # Create default button for non-boolean settings
-                default_btn = ttk.Button(frame, text=t("default"), command=lambda s=section, k=key: self.reset_to_default(s, k))
+                default_btn = self.widgets.Button(frame, text=t("default"), command=lambda s=section, k=key: self.reset_to_default(s, k))
                 default_btn.grid(row=row, column=2, padx=5, pady=2, sticky='w')
                 self.default_buttons[(section, key)] = default_btn
             
             self.add_value_labels(frame, section, key, value, row)
             row += 1
+        self.create_bulk_controls(frame, section, row)
 
     def add_value_labels(self, frame, section, key, value, row):
         loc = get_current_localization()
@@ -738,51 +720,85 @@ class ConfigInterface:
                 default_text = loc.get_label('default_on')
             else:
                 default_text = loc.get_label('default_off')
-            ttk.Label(frame, text=default_text, font=font('small')).grid(
+            self.widgets.Label(frame, text=default_text, font=font('small')).grid(
                 row=row, column=3, padx=5, pady=2, sticky='w')
         else:
             # For non-boolean values, show the actual value
             default_text = loc.get_label('default_value', value=value)
-            if section in self.config_handler.max_values and key in self.config_handler.max_values[section]:
-                default_text += f" | {loc.get_label('max_value', max=self.config_handler.max_values[section][key])}"
-            ttk.Label(frame, text=default_text, font=font('small')).grid(
+            low, high = self.model.constraints.bounds((section, key))
+            if low is not None:
+                default_text += f" | {loc.get_label('min_value', min=low)}"
+            if high is not None:
+                default_text += f" | {loc.get_label('max_value', max=high)}"
+            self.widgets.Label(frame, text=default_text, font=font('small')).grid(
                 row=row, column=3, padx=5, pady=2, sticky='w')
         
         if section in self.config_handler.descriptions and key in self.config_handler.descriptions[section]:
-            ttk.Label(frame, text=self.config_handler.descriptions[section][key], font=font('description')).grid(
+            self.widgets.Label(frame, text=self.config_handler.descriptions[section][key], font=font('description')).grid(
                 row=row, column=4, padx=5, pady=2, sticky='w')
 
+    def create_bulk_controls(self, frame, tab, row):
+        """Add a row of buttons that change every setting of the tab at once"""
+        bulk_frame = self.widgets.Frame(frame)
+        bulk_frame.grid(row=row, column=0, columnspan=5, padx=5, pady=(10, 2), sticky='w')
+        self.widgets.Label(bulk_frame, text=t("bulk_amount"), font=font('bold')).pack(side='left', padx=(0, 5))
+        amount_entry = self.widgets.Entry(bulk_frame, width=8)
+        amount_entry.insert(0, "10")
+        amount_entry.pack(side='left', padx=(0, 5))
+        for operation, text in [('scale', "bulk_scale"), ('offset', "bulk_offset"),
+                                ('clamp', "bulk_clamp"), ('reset', "bulk_reset")]:
+            self.widgets.Button(bulk_frame, text=t(text),
+                                command=lambda op=operation: self.apply_bulk(tab, op, amount_entry)).pack(side='left', padx=2)
+
+    def apply_bulk(self, tab, operation, amount_entry=None):
+        """Apply a bulk operation to every setting of a tab as one change and one undo step"""
+        amount = None
+        if operation in ('scale', 'offset'):
+            try:
+                amount = float(amount_entry.get().strip().rstrip('%'))
+            except ValueError:
+                loc = get_current_localization()
+                messagebox.showerror(loc.get_title("error"), loc.get_error("invalid_bulk_amount"))
+                return
+            if operation == 'scale':
+                # Entered as a percent change: 10 is +10%, -100 zeroes the tab
+                amount = 1 + amount / 100
+        self.history.checkpoint()
+        self.model.bulk_update(self.tab_settings.get(tab, []), operation, amount)
+        self.history.checkpoint()
+
     def setup_movement_frame(self, frame):
         row = 0
         for key, value in self.config_handler.default_config['MovementParams'].items():
             if key not in ['BaseTurnRate', 'BaseLookUpRate']:
                 self.create_movement_control(frame, key, value, row)
                 row += 1
+        self.create_bulk_controls(frame, 'MovementParams', row)
 
     def create_movement_control(self, frame, key, value, row):
-        label = ttk.Label(frame, text=key, font=font('bold'))
+        label = self.widgets.Label(frame, text=key, font=font('bold'))
         label.grid(row=row, column=0, padx=5, pady=2, sticky='e')
         self.labels[('MovementParams', key)] = label  # Store label reference
         
         if isinstance(value, bool):
-            var = tk.BooleanVar(value=value)
-            checkbox = ttk.Checkbutton(frame, variable=var)
+            var = self.widgets.BooleanVar(value=self.model.get('MovementParams', key))
+            checkbox = self.widgets.Checkbutton(frame, variable=var)
             checkbox.grid(row=row, column=1, padx=5, pady=2, sticky='w')
             self.checkboxes[('MovementParams', key)] = var
             # Add trace to update default button state and tab colors when checkbox changes
             var.trace_add('write', lambda *args, k=key: self._on_checkbox_change('MovementParams', k))
             # Create default button for boolean settings
-            default_btn = ttk.Button(frame, text=t("default"), command=lambda k=key: self.reset_to_default('MovementParams', k))
+            default_btn = self.widgets.Button(frame, text=t("default"), command=lambda k=key: self.reset_to_default('MovementParams', k))
             default_btn.grid(row=row, column=2, padx=5, pady=2, sticky='w')
             self.default_buttons[('MovementParams', key)] = default_btn
         else:
-            entry = ttk.Entry(frame)
-            entry.insert(0, str(value))
+            entry = self.widgets.Entry(frame)
+            entry.insert(0, format_value(self.model.get('MovementParams', key)))
             entry.grid(row=row, column=1, padx=5, pady=2, sticky='w')
             entry.bind('<KeyRelease>', lambda e, k=key: self.validate_entry('MovementParams', k))
             self.entries[('MovementParams', key)] = entry
             # Create default button for non-boolean settings
-            default_btn = ttk.Button(frame, text=t("default"), command=lambda k=key: self.reset_to_default('MovementParams', k))
+            default_btn = self.widgets.Button(frame, text=t("default"), command=lambda k=key: self.reset_to_default('MovementParams', k))
             default_btn.grid(row=row, column=2, padx=5, pady=2, sticky='w')
             self.default_buttons[('MovementParams', key)] = default_btn
             
@@ -790,25 +806,22 @@ class ConfigInterface:
         self.add_value_labels(frame, 'MovementParams', key, value, row)
 
     def setup_aiming_section(self, frame):
-        controls_frame = ttk.Frame(frame)
+        controls_frame = self.widgets.Frame(frame)
         controls_frame.grid(row=0, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
         
-        left_frame = ttk.Frame(controls_frame)
+        left_frame = self.widgets.Frame(controls_frame)
         left_frame.pack(side='left')
         
-        right_frame = ttk.Frame(controls_frame)
+        right_frame = self.widgets.Frame(controls_frame)
         right_frame.pack(side='right')
         
-        if 'Aiming' in self.config_handler.default_config and 'SyncTurnRate' in self.config_handler.default_config['Aiming']:
-            self.sync_sensitivity.set(self.config_handler.default_config['Aiming']['SyncTurnRate'])
-        
-        sync_check = ttk.Checkbutton(left_frame, 
+        # Toggling it reaches the model through the variable's trace
+        sync_check = self.widgets.Checkbutton(left_frame, 
                                    text=t("sync_turn_look_rate"), 
-                                   variable=self.sync_sensitivity,
-                                   command=self.sync_sensitivity_rates)
+                                   variable=self.sync_sensitivity)
         sync_check.pack(side='left')
         
-        self.mouse_btn = ttk.Button(right_frame, 
+        self.mouse_btn = self.widgets.Button(right_frame, 
                                   text=self.get_mouse_smoothing_button_text(),
                                   command=self.toggle_mouse_smoothing)
         self.mouse_btn.pack(side='right', padx=5)
@@ -817,236 +830,58 @@ class ConfigInterface:
 
     def create_aiming_controls(self, frame):
         for row, key in enumerate(['BaseTurnRate', 'BaseLookUpRate'], 1):
-            label = ttk.Label(frame, text=key, font=font('bold'))
+            label = self.widgets.Label(frame, text=key, font=font('bold'))
             label.grid(row=row, column=0, padx=5, pady=2, sticky='e')
             self.labels[('MovementParams', key)] = label  # Store label reference
             
             default_value = self.config_handler.default_config['MovementParams'][key]
             
-            entry = ttk.Entry(frame)
-            entry.insert(0, str(default_value))
+            entry = self.widgets.Entry(frame)
+            entry.insert(0, format_value(self.model.get('MovementParams', key)))
             entry.grid(row=row, column=1, padx=5, pady=2, sticky='w')
-            entry.bind('<KeyRelease>', lambda e, k=key: self.validate_aiming_entry(k))
+            entry.bind('<KeyRelease>', lambda e, k=key: self.validate_entry('MovementParams', k))
             self.entries[('MovementParams', key)] = entry
             
             # Create default button for aiming settings
-            default_btn = ttk.Button(frame, text=t("default"), command=lambda k=key: self.reset_to_default('MovementParams', k))
+            default_btn = self.widgets.Button(frame, text=t("default"), command=lambda k=key: self.reset_to_default('MovementParams', k))
             default_btn.grid(row=row, column=2, padx=5, pady=2, sticky='w')
             self.default_buttons[('MovementParams', key)] = default_btn
             
             self.add_value_labels(frame, 'MovementParams', key, default_value, row)
 
-    def sync_sensitivity_rates(self):
-        if self.sync_sensitivity.get():
-            try:
-                turn_value = self.entries[('MovementParams', 'BaseTurnRate')].get()
-                value = int(turn_value)
-                self.entries[('MovementParams', 'BaseLookUpRate')].delete(0, tk.END)
-                self.entries[('MovementParams', 'BaseLookUpRate')].insert(0, str(value))
-                # Use validate_aiming_entry instead of validate_entry for aiming controls
-                self.validate_aiming_entry('BaseLookUpRate')
-            except ValueError:
-                pass
-        
-        # Update label colors for both aiming controls
-        self.update_label_color('MovementParams', 'BaseTurnRate')
-        self.update_label_color('MovementParams', 'BaseLookUpRate')
-        
-        # Update tab colors as sync setting change affects aiming section
-        self.update_tab_colors()
-
-    def validate_aiming_entry(self, key):
-        entry = self.entries[('MovementParams', key)]
-        current_value = entry.get()
-        
-        try:
-            value = int(current_value)
-            
-            default_value = str(self.config_handler.default_config['MovementParams'][key])
-            
-            exceeds_max = False
-            if 'MovementParams' in self.config_handler.max_values and key in self.config_handler.max_values['MovementParams']:
-                if value > self.config_handler.max_values['MovementParams'][key]:
-                    exceeds_max = True
-            
-            if self.sync_sensitivity.get():
-                for rate_key in ['BaseTurnRate', 'BaseLookUpRate']:
-                    other_entry = self.entries[('MovementParams', rate_key)]
-                    other_entry.delete(0, tk.END)
-                    other_entry.insert(0, str(value))
-                    other_entry.configure(foreground='red' if exceeds_max else 
-                        ('green' if str(value) != default_value else 'black'))
-                    # Update default button state and label color for both entries
-                    self.update_default_button_state('MovementParams', rate_key)
-                    self.update_label_color('MovementParams', rate_key)
-            else:
-                entry.configure(foreground='red' if exceeds_max else 
-                    ('green' if current_value != default_value else 'black'))
-                # Update default button state and label color for this entry
-                self.update_default_button_state('MovementParams', key)
-                self.update_label_color('MovementParams', key)
-            
-            # Update tab colors
-            self.update_tab_colors()
-                    
-        except ValueError:
-            entry.configure(foreground='red')
-            self.update_default_button_state('MovementParams', key)
-            self.update_label_color('MovementParams', key)
-            self.update_tab_colors()
+    def _on_checkbox_change(self, section, key):
+        """Called when a checkbox value changes"""
+        self.model.set(section, key, self.checkboxes[(section, key)].get())
 
     def validate_entry(self, section, key):
+        """Store the text of an edited entry in the model; False if it is not a valid value"""
         entry = self.entries[(section, key)]
-        current_value = entry.get().strip()
-        default_value = str(self.config_handler.default_config[section][key])
-
-        try:
-            actual_default_value = self.config_handler.default_config[section][key]
-            
-            if not current_value and isinstance(actual_default_value, (int, float)):
-                entry.configure(foreground='red')
-                self.update_default_button_state(section, key)
-                self.update_label_color(section, key)
-                self.update_tab_colors()
-                return False
-
-            if isinstance(actual_default_value, (int, float)):
-                if '.' in current_value:
-                    value = float(current_value)
-                else:
-                    value = int(current_value)
-
-                exceeds_max = False
-                if section in self.config_handler.max_values and key in self.config_handler.max_values[section]:
-                    if value > self.config_handler.max_values[section][key]:
-                        exceeds_max = True
-
-                entry.configure(foreground='red' if exceeds_max else 
-                              ('green' if current_value != default_value else 'black'))
-                
-                # Update default button state, label color, and tab colors
-                self.update_default_button_state(section, key)
-                self.update_label_color(section, key)
-                self.update_tab_colors()
-                return not exceeds_max
-
-            entry.configure(foreground='black')
-            self.update_default_button_state(section, key)
-            self.update_label_color(section, key)
-            self.update_tab_colors()
-            return True
-
-        except ValueError:
-            entry.configure(foreground='red')
-            self.update_default_button_state(section, key)
-            self.update_label_color(section, key)
-            self.update_tab_colors()
-            return False
+        self.model.set(section, key, parse_value(entry.get(), self.model.defaults[(section, key)]))
+        return self.model.validate(section, key) is None
 
     def has_invalid_entries(self):
-        invalid_values = []
-        
-        for (section, key), entry in self.entries.items():
-            current_value = entry.get().strip()
-            default_value = self.config_handler.default_config[section][key]
-            
-            if isinstance(default_value, (int, float)):
-                if not current_value:
-                    invalid_values.append(f"{section} - {key}: Cannot be empty")
-                    continue
-                    
-                try:
-                    if '.' in current_value:
-                        value = float(current_value)
-                    else:
-                        value = int(current_value)
-                        
-                    if section in self.config_handler.max_values and key in self.config_handler.max_values[section]:
-                        max_val = self.config_handler.max_values[section][key]
-                        if value > max_val:
-                            invalid_values.append(f"{section} - {key}: Value {value} exceeds maximum of {max_val}")
-                except ValueError:
-                    invalid_values.append(f"{section} - {key}: Must be a valid number")
-            
+        invalid_values = self.model.invalid_settings()
         return bool(invalid_values), invalid_values
 
     def has_changes(self):
-        for (section, key), entry in self.entries.items():
-            current_value = entry.get().strip()
-            default_value = str(self.config_handler.default_config[section][key])
-            
-            if current_value != default_value:
-                return True
-                
-        for (section, key), checkbox in self.checkboxes.items():
-            default_value = self.config_handler.default_config[section][key]
-            
-            current_value = checkbox.get()
-            if current_value != default_value:
-                return True
-                
-        if 'Aiming' in self.config_handler.default_config and 'SyncTurnRate' in self.config_handler.default_config['Aiming']:
-            if self.sync_sensitivity.get() != self.config_handler.default_config['Aiming']['SyncTurnRate']:
-                return True
-        return False
+        return self.model.has_changes()
 
     def update_entries(self, config):
-        for (section, key), entry in self.entries.items():
-            default_value = str(self.config_handler.default_config[section][key])
-            entry.delete(0, tk.END)
-            entry.insert(0, default_value)
-            entry.configure(foreground='black')
-            
-        for (section, key), checkbox in self.checkboxes.items():
-            default_value = self.config_handler.default_config[section][key]
-            checkbox.set(default_value)
-
-        for section in config:
-            for key, value in config[section].items():
-                if section == 'Aiming' and key == 'SyncTurnRate':
-                    self.sync_sensitivity.set(value)
-                elif isinstance(value, bool):
-                    if (section, key) in self.checkboxes:
-                        self.checkboxes[(section, key)].set(value)
-                else:
-                    if (section, key) in self.entries:
-                        entry = self.entries[(section, key)]
-                        entry.delete(0, tk.END)
-                        entry.insert(0, str(value))
-                        self.validate_entry(section, key)
-        
-        # Update all default button states and tab colors after loading configuration
-        self.update_all_default_button_states()
-        self.update_tab_colors()
+        """Show config over the defaults, as one change; False if its formulas are invalid"""
+        try:
+            self.model.load(config)
+        except FormulaError as e:
+            diagnostics_log.warning('config.invalid_formula', error=str(e))
+            loc = get_current_localization()
+            messagebox.showerror(loc.get_title("error"), loc.get_error("invalid_formula", error=str(e)))
+            return False
+        return True
 
     def get_current_config(self, include_defaults=False):
-        config = {}
-        for section in self.config_handler.default_config:
-            if section != 'Aiming':
-                changed_values = {}
-                for key, value in self.config_handler.default_config[section].items():
-                    if isinstance(value, bool):
-                        current_value = self.checkboxes[(section, key)].get()
-                        if include_defaults or current_value != value:
-                            changed_values[key] = current_value
-                    else:
-                        current_value = self.entries[(section, key)].get()
-                        default_value = str(value)
-                        if include_defaults or current_value != default_value:
-                            try:
-                                if '.' in current_value:
-                                    changed_values[key] = float(current_value)
-                                else:
-                                    changed_values[key] = int(current_value)
-                            except ValueError:
-                                loc = get_current_localization()
-                                messagebox.showerror(loc.get_title("error"), 
-                                                    loc.get_error("invalid_value_for_key", key=key))
-                                return None
-                if changed_values:
-                    config[section] = changed_values
-
-        if self.sync_sensitivity.get():
-            config['Aiming'] = {'SyncTurnRate': True}
-
-        return config
\ No newline at end of file
+        try:
+            return self.model.to_config(include_defaults)
+        except InvalidSettingError as e:
+            loc = get_current_localization()
+            messagebox.showerror(loc.get_title("error"), 
+                                loc.get_error("invalid_value_for_key", key=e.key))
+            return None
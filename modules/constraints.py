@@ -0,0 +1,195 @@
+# modules/constraints.py
+"""
+Value constraints for settings.
+
+The defaults files declare them in a [Constraints] section, one rule per
+setting (or per section with Section.*), as comma separated clauses:
+
+    [Constraints]
+    MovementParams.* = min 0
+    VaultingParams.MinObstacleHeight = min 0, <= MaxObstacleHeight
+    VaultingParams.MaxLandingDetectionIterations = int, min 1
+
+Clauses are min N, max N, step N (a multiple of N), int (a whole number) and
+a comparison (<, <=, >, >=) with another setting, named like in formulas.
+The |max suffix of a default value is a max clause too. A comparison is
+checked on both settings, so both are flagged when it fails.
+
+ConstraintChecker compiles the rules into a list of checks per setting and
+caches each setting's result. A change invalidates only the setting and the
+settings whose comparisons read it.
+"""
+import math
+import operator
+
+from .diagnostics_log import diagnostics_log
+
+CONSTRAINTS_SECTION = 'Constraints'
+
+_COMPARISONS = {
+    '<=': (operator.le, "at most", '>='),
+    '>=': (operator.ge, "at least", '<='),
+    '<': (operator.lt, "less than", '>'),
+    '>': (operator.gt, "greater than", '<'),
+}
+
+
+class ConstraintError(ValueError):
+    pass
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _number(text):
+    try:
+        return float(text) if '.' in text else int(text)
+    except ValueError:
+        raise ConstraintError(f"'{text}' is not a number") from None
+
+
+class ConstraintChecker:
+    """Compiled constraints of every number setting, with a shared cache of their results"""
+
+    def __init__(self, defaults, max_values=None, rules=None):
+        self.defaults = defaults
+        self._checks = {}
+        self._bounds = {}
+        # Settings whose comparisons read a setting, by that setting
+        self._watchers = {}
+        self._results = {}
+        for setting, max_value in (max_values or {}).items():
+            if setting in defaults:
+                self._add_bound(setting, None, max_value)
+        for pattern, rule in (rules or {}).items():
+            try:
+                for setting in self._expand(pattern):
+                    self._compile_rule(setting, str(rule))
+            except ConstraintError as e:
+                diagnostics_log.warning('constraints.invalid_rule', rule=f'{pattern} = {rule}', error=str(e))
+        for setting, (low, high) in self._bounds.items():
+            self._checks.setdefault(setting, []).insert(0, self._bound_check(low, high))
+
+    def _expand(self, pattern):
+        pattern = pattern.strip()
+        if pattern.endswith('.*'):
+            section = pattern[:-2]
+            settings = [setting for setting, value in self.defaults.items()
+                        if setting[0] == section and _is_number(value)]
+            if not settings:
+                raise ConstraintError(f"No number settings in section '{section}'")
+            return settings
+        return [self._resolve(pattern)]
+
+    def _resolve(self, name, section=None):
+        """The (section, key) of "Section.Key", or of "Key" in section or the only section that has it"""
+        if '.' in name:
+            setting = tuple(name.split('.', 1))
+        elif section is not None and (section, name) in self.defaults:
+            setting = (section, name)
+        else:
+            matches = [setting for setting in self.defaults if setting[1] == name]
+            if len(matches) != 1:
+                raise ConstraintError(f"Unknown or ambiguous setting '{name}'")
+            setting = matches[0]
+        if not _is_number(self.defaults.get(setting)):
+            raise ConstraintError(f"'{name}' is not a number setting")
+        return setting
+
+    def _add_bound(self, setting, low, high):
+        current_low, current_high = self._bounds.get(setting, (None, None))
+        if low is not None and (current_low is None or low > current_low):
+            current_low = low
+        if high is not None and (current_high is None or high < current_high):
+            current_high = high
+        self._bounds[setting] = (current_low, current_high)
+
+    def _compile_rule(self, setting, rule):
+        for clause in rule.split(','):
+            clause = clause.strip()
+            if not clause:
+                continue
+            word, _, argument = clause.partition(' ')
+            argument = argument.strip()
+            if word == 'min':
+                self._add_bound(setting, _number(argument), None)
+            elif word == 'max':
+                self._add_bound(setting, None, _number(argument))
+            elif word == 'int' and not argument:
+                self._checks.setdefault(setting, []).append(
+                    lambda value, get: None if float(value).is_integer() else "Must be a whole number")
+            elif word == 'step':
+                self._checks.setdefault(setting, []).append(self._step_check(_number(argument)))
+            elif word in _COMPARISONS:
+                other = self._resolve(argument, setting[0])
+                compare, text, mirrored = _COMPARISONS[word]
+                self._add_comparison(setting, other, compare, text)
+                compare, text, _ = _COMPARISONS[mirrored]
+                self._add_comparison(other, setting, compare, text)
+            else:
+                raise ConstraintError(f"Unknown clause '{clause}'")
+
+    def _add_comparison(self, setting, other, compare, text):
+        def check(value, get):
+            other_value = get(*other)
+            if _is_number(other_value) and not compare(value, other_value):
+                return f"Must be {text} {other[1]} ({other_value})"
+            return None
+        self._checks.setdefault(setting, []).append(check)
+        self._watchers.setdefault(other, []).append(setting)
+
+    @staticmethod
+    def _bound_check(low, high):
+        def check(value, get):
+            if low is not None and value < low:
+                return f"Value {value} is below minimum of {low}"
+            if high is not None and value > high:
+                return f"Value {value} exceeds maximum of {high}"
+            return None
+        return check
+
+    @staticmethod
+    def _step_check(step):
+        if step <= 0:
+            raise ConstraintError(f"Step {step} must be positive")
+
+        def check(value, get):
+            steps = value / step
+            if not math.isclose(steps, round(steps), abs_tol=1e-9):
+                return f"Must be a multiple of {step}"
+            return None
+        return check
+
+    def bounds(self, setting):
+        """(min, max) of a setting, either None when it has none"""
+        return self._bounds.get(setting, (None, None))
+
+    def watchers(self, setting):
+        """Settings whose comparisons read a setting"""
+        return self._watchers.get(setting, ())
+
+    def invalidate(self, setting):
+        """Forget the results that depend on a setting's value"""
+        self._results.pop(setting, None)
+        for watcher in self._watchers.get(setting, ()):
+            self._results.pop(watcher, None)
+
+    def clear(self):
+        """Forget every result, e.g. before checking another set of values"""
+        self._results.clear()
+
+    def check(self, setting, get):
+        """Why a setting's number value breaks a constraint, or None; cached until invalidated"""
+        try:
+            return self._results[setting]
+        except KeyError:
+            pass
+        value = get(*setting)
+        problem = None
+        for check in self._checks.get(setting, ()):
+            problem = check(value, get)
+            if problem:
+                break
+        self._results[setting] = problem
+        return problem
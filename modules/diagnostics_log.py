@@ -0,0 +1,148 @@
+# modules/diagnostics_log.py
+"""
+Structured diagnostic log kept in an in-memory ring buffer.
+
+Records are small dicts (event name, level, wall clock time, uptime and any
+extra fields such as duration_ms) appended to a bounded deque, so logging from
+fallback paths costs next to nothing. Once configured with a folder, new
+records are written as JSON lines to a rotating diagnostics.log whenever an
+error is logged and when the application exits. The whole buffer can be
+exported as text for bug reports ("Copy diagnostics").
+
+Usage:
+    diagnostics_log.warning('config.database_unavailable', filename=filename, error=str(e))
+    with diagnostics_log.timed('config.load_ini_file', path=path):
+        ...
+"""
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+LOG_DIR_NAME = 'logs'
+LOG_FILE_NAME = 'diagnostics.log'
+DEFAULT_CAPACITY = 1000
+MAX_LOG_BYTES = 512 * 1024
+LOG_BACKUPS = 3
+
+
+class DiagnosticsLog:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.records = deque(maxlen=capacity)
+        self.origin = time.perf_counter()
+        self.log_path = None
+        self.max_bytes = MAX_LOG_BYTES
+        self.backups = LOG_BACKUPS
+        self._sequence = 0
+        self._flushed = 0
+        self._lock = threading.Lock()
+        self._exit_hook = False
+
+    def configure(self, log_dir, max_bytes=MAX_LOG_BYTES, backups=LOG_BACKUPS):
+        """Write records to log_dir/diagnostics.log from now on, flushing at exit"""
+        self.log_path = os.path.join(log_dir, LOG_FILE_NAME)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        if not self._exit_hook:
+            atexit.register(self.flush)
+            self._exit_hook = True
+
+    def log(self, level, event, **fields):
+        record = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'uptime_ms': round((time.perf_counter() - self.origin) * 1000, 3),
+            'level': level,
+            'event': event,
+        }
+        record.update(fields)
+        with self._lock:
+            self._sequence += 1
+            record['seq'] = self._sequence
+            self.records.append(record)
+        if level == 'error':
+            self.flush()
+        return record
+
+    def debug(self, event, **fields):
+        return self.log('debug', event, **fields)
+
+    def info(self, event, **fields):
+        return self.log('info', event, **fields)
+
+    def warning(self, event, **fields):
+        return self.log('warning', event, **fields)
+
+    def error(self, event, **fields):
+        return self.log('error', event, **fields)
+
+    def exception(self, event, error, level='error', **fields):
+        """Log an exception with its type, message and the last frames of its traceback"""
+        import traceback
+        fields['error'] = f'{type(error).__name__}: {error}'
+        fields['traceback'] = traceback.format_exception(type(error), error, error.__traceback__)[-4:]
+        return self.log(level, event, **fields)
+
+    @contextlib.contextmanager
+    def timed(self, event, level='debug', **fields):
+        """Log event with its duration_ms once the block ends; the yielded dict takes extra fields"""
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            fields['duration_ms'] = round((time.perf_counter() - start) * 1000, 3)
+            self.log(level, event, **fields)
+
+    def _rotate(self):
+        for index in range(self.backups - 1, 0, -1):
+            source = f'{self.log_path}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.log_path}.{index + 1}')
+        os.replace(self.log_path, f'{self.log_path}.1')
+
+    def flush(self):
+        """Append records not yet written to the log file, rotating it when it gets too big"""
+        if self.log_path is None:
+            return
+        with self._lock:
+            pending = [record for record in self.records if record['seq'] > self._flushed]
+            if not pending:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                if os.path.exists(self.log_path) and os.path.getsize(self.log_path) > self.max_bytes:
+                    self._rotate()
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    for record in pending:
+                        f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+                self._flushed = pending[-1]['seq']
+            except OSError:
+                # Nowhere left to report this; the records stay in the buffer for export
+                pass
+
+    def export_text(self, version=None, sections=None):
+        """Return the environment, extra JSON sections and every buffered record as text for a bug report"""
+        import platform
+        lines = [
+            f'SCAM {version or ""} diagnostics, {datetime.now().isoformat(timespec="seconds")}',
+            f'Python {platform.python_version()} on {platform.platform()}',
+            f'Frozen: {getattr(sys, "frozen", False)}',
+        ]
+        for name, data in (sections or {}).items():
+            lines.append('')
+            lines.append(f'[{name}]')
+            lines.append(json.dumps(data, indent=2, ensure_ascii=False, default=str))
+        lines.append('')
+        lines.append(f'[log] {len(self.records)} records')
+        with self._lock:
+            records = list(self.records)
+        lines.extend(json.dumps(record, ensure_ascii=False, default=str) for record in records)
+        return '\n'.join(lines)
+
+
+# Shared log for the whole application
+diagnostics_log = DiagnosticsLog()
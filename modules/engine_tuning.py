@@ -0,0 +1,275 @@
+# modules/engine_tuning.py
+"""
+Engine.ini performance tuning.
+
+Manages a curated set of [SystemSettings] cvars aimed at fewer traversal
+stutters and steadier frame times. Writes go through IniDocument so the rest of
+Engine.ini is left untouched, and the original values are backed up next to
+the file so every change can be reverted. Engine.ini files the game already
+has are updated; a missing one is only created in the config folder of the
+installed game version (see resolve_game_config_dir).
+"""
+import json
+import os
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from .config import get_game_config_dirs, resolve_game_config_dir
+from .ini_document import IniDocument
+from .localization.language_manager import get_current_localization, font
+
+ENGINE_SECTION = 'SystemSettings'
+BACKUP_SUFFIX = '.scam_backup.json'
+
+TIERS = ['low', 'medium', 'high', 'ultra']
+
+# cvar -> (description label key, values per tier in TIERS order)
+CURATED_CVARS = {
+    'r.Streaming.PoolSize': ("engine_cvar_pool_size", ('1024', '2048', '3072', '4096')),
+    'r.Streaming.LimitPoolSizeToVRAM': ("engine_cvar_limit_pool_to_vram", ('1', '1', '1', '0')),
+    'r.Streaming.FramesForFullUpdate': ("engine_cvar_frames_for_full_update", ('5', '5', '3', '3')),
+    'r.ShaderPipelineCache.Enabled': ("engine_cvar_pso_cache", ('1', '1', '1', '1')),
+    'r.ShaderPipelineCache.BatchSize': ("engine_cvar_pso_batch_size", ('25', '50', '50', '100')),
+    'r.ShaderPipelineCache.BackgroundBatchSize': ("engine_cvar_pso_background_batch_size", ('1', '2', '4', '8')),
+    's.AsyncLoadingThreadEnabled': ("engine_cvar_async_loading_thread", ('1', '1', '1', '1')),
+    's.LevelStreamingComponentsRegistrationGranularity': ("engine_cvar_components_registration",
+                                                          ('10', '10', '20', '50')),
+    's.ForceGCAfterLevelStreamedOut': ("engine_cvar_force_gc_after_streaming", ('0', '0', '0', '0')),
+    's.ContinuouslyIncrementalGCWhileLevelsPendingPurge': ("engine_cvar_incremental_gc_pending_purge",
+                                                           ('0', '0', '0', '0')),
+}
+
+
+def get_tier_values(tier):
+    """Return {cvar: value} for a tier preset"""
+    index = TIERS.index(tier)
+    return {cvar: values[index] for cvar, (_description, values) in CURATED_CVARS.items()}
+
+
+def invalid_values(values):
+    """Return the cvars of values ({cvar: text}) that are not numbers; every curated cvar is numeric"""
+    invalid = []
+    for cvar, value in values.items():
+        try:
+            float(value)
+        except (TypeError, ValueError):
+            invalid.append(cvar)
+    return invalid
+
+
+class EngineTuner:
+    def __init__(self, config_dirs=None, get_game_dir=None):
+        self.config_dirs = config_dirs if config_dirs is not None else get_game_config_dirs()
+        # Tells the Steam and Xbox config folders apart; the game directory can change while SCAM runs
+        self.get_game_dir = get_game_dir or (lambda: None)
+
+    def config_dir(self):
+        """Config folder of the installed game version, or None if it cannot be told"""
+        return resolve_game_config_dir(self.get_game_dir(), self.config_dirs)
+
+    def engine_ini_paths(self):
+        """Engine.ini files the game has, and the one of the resolved config folder if that folder exists"""
+        paths = []
+        config_dir = self.config_dir()
+        if config_dir and os.path.isdir(config_dir):
+            paths.append(os.path.join(config_dir, 'Engine.ini'))
+        for path in self.config_dirs:
+            ini_path = os.path.join(path, 'Engine.ini')
+            if ini_path not in paths and os.path.isfile(ini_path):
+                paths.append(ini_path)
+        return paths
+
+    def _backup_path(self, ini_path):
+        return ini_path + BACKUP_SUFFIX
+
+    def _load_backup(self, ini_path):
+        backup_path = self._backup_path(ini_path)
+        if os.path.exists(backup_path):
+            with open(backup_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def current_values(self, ini_path=None):
+        """Return the curated cvars currently set in Engine.ini (first found file by default)"""
+        paths = [ini_path] if ini_path else self.engine_ini_paths()[:1]
+        if not paths:
+            return {}
+        doc = IniDocument.load(paths[0])
+        return {cvar: value for cvar in CURATED_CVARS
+                if (value := doc.get(ENGINE_SECTION, cvar)) is not None}
+
+    def diff(self, values):
+        """Return [(ini_path, cvar, current value or None, new value)] for values that would change"""
+        changes = []
+        for ini_path in self.engine_ini_paths():
+            doc = IniDocument.load(ini_path)
+            for cvar, value in values.items():
+                current = doc.get(ENGINE_SECTION, cvar)
+                if current != str(value):
+                    changes.append((ini_path, cvar, current, str(value)))
+        return changes
+
+    def apply(self, values):
+        """Write values to every Engine.ini, backing up the originals first. Returns changed file count."""
+        invalid = invalid_values(values)
+        if invalid:
+            raise ValueError(f"Not a number: {', '.join(invalid)}")
+        changed_files = 0
+        for ini_path in self.engine_ini_paths():
+            doc = IniDocument.load(ini_path)
+            backup = self._load_backup(ini_path)
+            for cvar, value in values.items():
+                # Only the value from before SCAM's first change is worth keeping
+                if cvar not in backup:
+                    backup[cvar] = doc.get(ENGINE_SECTION, cvar)
+                doc.set(ENGINE_SECTION, cvar, value)
+            if doc.dirty:
+                with open(self._backup_path(ini_path), 'w', encoding='utf-8') as f:
+                    json.dump(backup, f, indent=2)
+                doc.save()
+                changed_files += 1
+        return changed_files
+
+    def has_backup(self):
+        return any(os.path.exists(self._backup_path(path)) for path in self.engine_ini_paths())
+
+    def revert(self):
+        """Restore the values recorded before SCAM's first change. Returns reverted file count."""
+        reverted = 0
+        for ini_path in self.engine_ini_paths():
+            backup_path = self._backup_path(ini_path)
+            if not os.path.exists(backup_path):
+                continue
+            doc = IniDocument.load(ini_path)
+            for cvar, original in self._load_backup(ini_path).items():
+                if original is None:
+                    doc.remove(ENGINE_SECTION, cvar)
+                else:
+                    doc.set(ENGINE_SECTION, cvar, original)
+            doc.save()
+            os.remove(backup_path)
+            reverted += 1
+        return reverted
+
+
+class EngineTuningFrame:
+    """Engine.ini tab: tier presets, per-cvar values, diff preview, apply and revert"""
+
+    def __init__(self, frame, tuner=None, get_game_dir=None):
+        self.frame = frame
+        self.tuner = tuner or EngineTuner(get_game_dir=get_game_dir)
+        self.entries = {}
+        self.current_labels = {}
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        loc = get_current_localization()
+
+        controls = ttk.Frame(self.frame)
+        controls.grid(row=0, column=0, columnspan=4, sticky='ew', padx=5, pady=5)
+
+        ttk.Label(controls, text=loc.get_label("engine_tier")).pack(side='left', padx=5)
+        self.tier_names = {loc.get_label(f"engine_tier_{tier}"): tier for tier in TIERS}
+        tier_combo = ttk.Combobox(controls, state='readonly', width=18, values=list(self.tier_names))
+        tier_combo.set(loc.get_label("engine_tier_medium"))
+        tier_combo.bind('<<ComboboxSelected>>', lambda e: self.load_tier(self.tier_names[tier_combo.get()]))
+        tier_combo.pack(side='left', padx=5)
+
+        ttk.Button(controls, text=loc.get_button("engine_revert"), command=self.revert).pack(side='right', padx=5)
+        ttk.Button(controls, text=loc.get_button("engine_apply"), command=self.apply).pack(side='right', padx=5)
+        ttk.Button(controls, text=loc.get_button("engine_show_changes"), command=self.show_diff).pack(side='right', padx=5)
+
+        self.status_label = ttk.Label(self.frame, font=font('small_italic'))
+        self.status_label.grid(row=1, column=0, columnspan=4, sticky='w', padx=10)
+
+        tier_values = get_tier_values('medium')
+        for row, (cvar, (description, _values)) in enumerate(CURATED_CVARS.items(), 2):
+            ttk.Label(self.frame, text=cvar, font=font('bold')).grid(row=row, column=0, padx=5, pady=2, sticky='e')
+            entry = ttk.Entry(self.frame, width=10)
+            entry.insert(0, tier_values[cvar])
+            entry.grid(row=row, column=1, padx=5, pady=2, sticky='w')
+            self.entries[cvar] = entry
+            current_label = ttk.Label(self.frame, font=font('small'))
+            current_label.grid(row=row, column=2, padx=5, pady=2, sticky='w')
+            self.current_labels[cvar] = current_label
+            ttk.Label(self.frame, text=loc.get_label(description), font=font('description')).grid(
+                row=row, column=3, padx=5, pady=2, sticky='w')
+
+    def refresh(self):
+        """Show the values currently in Engine.ini next to each cvar"""
+        loc = get_current_localization()
+        paths = self.tuner.engine_ini_paths()
+        if paths:
+            self.status_label.configure(text=loc.get_label("engine_ini_location", path=paths[0]))
+        else:
+            self.status_label.configure(text=self._missing_config_text())
+        current = self.tuner.current_values()
+        for cvar, label in self.current_labels.items():
+            label.configure(text=loc.get_label("engine_current_value", value=current.get(cvar, '-')))
+
+    def _missing_config_text(self):
+        loc = get_current_localization()
+        config_dir = self.tuner.config_dir()
+        if config_dir:
+            return loc.get_label("engine_config_dir_missing", path=config_dir)
+        return loc.get_label("engine_ini_not_found")
+
+    def load_tier(self, tier):
+        for cvar, value in get_tier_values(tier).items():
+            self.entries[cvar].delete(0, tk.END)
+            self.entries[cvar].insert(0, value)
+
+    def get_values(self):
+        return {cvar: entry.get().strip() for cvar, entry in self.entries.items() if entry.get().strip()}
+
+    def show_diff(self):
+        loc = get_current_localization()
+        changes = self.tuner.diff(self.get_values())
+        dialog = tk.Toplevel(self.frame)
+        dialog.title(loc.get_title("engine_changes"))
+        dialog.geometry("640x360")
+        text = tk.Text(dialog, wrap='none', font=font('default'))
+        text.pack(fill='both', expand=True, padx=5, pady=5)
+        if not changes:
+            text.insert(tk.END, loc.get_label("engine_no_changes"))
+        last_path = None
+        for ini_path, cvar, current, new in changes:
+            if ini_path != last_path:
+                text.insert(tk.END, f"{ini_path}\n")
+                last_path = ini_path
+            text.insert(tk.END, f"    {cvar}: {current if current is not None else '-'} -> {new}\n")
+        text.configure(state='disabled')
+        ttk.Button(dialog, text=loc.get_button("ok"), command=dialog.destroy).pack(pady=5)
+
+    def apply(self):
+        loc = get_current_localization()
+        if not self.tuner.engine_ini_paths():
+            messagebox.showerror(loc.get_title("error"), self._missing_config_text())
+            return
+        values = self.get_values()
+        invalid = invalid_values(values)
+        if invalid:
+            messagebox.showerror(loc.get_title("error"), loc.get_error(
+                "invalid_engine_value", cvar=invalid[0], value=values[invalid[0]]))
+            return
+        try:
+            self.tuner.apply(values)
+        except (OSError, ValueError) as e:
+            messagebox.showerror(loc.get_title("error"), loc.get_error("failed_to_update_engine_ini", error=str(e)))
+            return
+        self.refresh()
+        messagebox.showinfo(loc.get_title("success"), loc.get_success("engine_settings_applied"))
+
+    def revert(self):
+        loc = get_current_localization()
+        try:
+            reverted = self.tuner.revert()
+        except (OSError, ValueError) as e:
+            messagebox.showerror(loc.get_title("error"), loc.get_error("failed_to_update_engine_ini", error=str(e)))
+            return
+        self.refresh()
+        if reverted:
+            messagebox.showinfo(loc.get_title("success"), loc.get_success("engine_settings_reverted"))
+        else:
+            messagebox.showwarning(loc.get_title("warning"), loc.get_warning("engine_nothing_to_revert"))
@@ -0,0 +1,120 @@
+# modules/file_watch.py
+"""
+Polling file watchers.
+
+FileWatcher calls scan() on a background thread every poll interval and
+compares the {path: (mtime_ns, size)} it returns with the previous scan.
+Changed, added and removed paths are collected until nothing has changed
+for the debounce time, then reported together, so a file written in
+several steps is reported once. Polling costs a few stat() calls per
+interval, works the same on every platform and needs no extra dependency.
+
+ModsWatcher watches the mod paks in ~mods and reports when the mod is
+installed or removed, by SCAM, another SCAM window or by hand.
+"""
+import os
+import threading
+import time
+
+from .diagnostics_log import diagnostics_log
+
+MODS_POLL_INTERVAL = 0.5
+DEBOUNCE_SECONDS = 0.25
+
+
+def file_signature(path):
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileWatcher:
+    """Base for watchers: subclasses implement scan() and report(changed)"""
+
+    name = 'FileWatcher'
+
+    def __init__(self, poll_interval, debounce=DEBOUNCE_SECONDS, clock=time.monotonic):
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._clock = clock
+        self._files = self.scan()
+        self._changed = {}  # path -> time of its last change, until reported
+        self._stop = threading.Event()
+        self._thread = None
+
+    def scan(self):
+        """{path: signature} of the watched files that exist"""
+        raise NotImplementedError
+
+    def report(self, changed):
+        """Handle {path: time of its last change} once the files have settled"""
+        raise NotImplementedError
+
+    @property
+    def files(self):
+        """{path: signature} of the last scan"""
+        return self._files
+
+    def poll(self):
+        """Scan once; return the settled {path: time of its last change}, empty while changes are still coming"""
+        now = self._clock()
+        files = self.scan()
+        for path in files.keys() | self._files.keys():
+            if files.get(path) != self._files.get(path):
+                self._changed[path] = now
+        self._files = files
+        if not self._changed or now - max(self._changed.values()) < self.debounce:
+            return {}
+        changed, self._changed = self._changed, {}
+        return changed
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            changed = self.poll()
+            if changed:
+                try:
+                    self.report(changed)
+                except Exception as e:
+                    # Keep watching; the next change may work
+                    diagnostics_log.exception('watch.callback_failed', e, watcher=self.name)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+
+class ModsWatcher(FileWatcher):
+    """Calls on_change(installed) from a background thread when the mod appears in or disappears from ~mods"""
+
+    name = 'ModsWatcher'
+
+    def __init__(self, mods_path, file_names, on_change, poll_interval=MODS_POLL_INTERVAL, **kwargs):
+        self.mods_path = mods_path
+        self.paths = [os.path.join(mods_path, name) for name in file_names]
+        self.on_change = on_change
+        super().__init__(poll_interval, **kwargs)
+        self.installed = bool(self.files)
+
+    def scan(self):
+        files = {}
+        for path in self.paths:
+            signature = file_signature(path)
+            if signature is not None:
+                files[path] = signature
+        return files
+
+    def report(self, changed):
+        installed = bool(self.files)
+        # A reinstall rewrites the pak; only installs and removals are news
+        if installed != self.installed:
+            self.installed = installed
+            self.on_change(installed)
@@ -0,0 +1,226 @@
+# modules/formulas.py
+"""
+Formula-linked settings.
+
+A preset's [Formulas] section derives settings from other settings:
+
+    [Formulas]
+    RunSpeed = WalkSpeed * 2.3
+    MovementParams.RunBackCoef = WalkBackCoef * 0.86
+
+Targets and inputs are numeric settings, named "Section.Key" or just "Key"
+when only one section has it. Expressions are parsed with ast and compiled
+into closures; only numbers, settings, + - * / // % **, parentheses and the
+functions in FUNCTIONS are accepted, so nothing in a preset file can run code,
+and ** and round() refuse results too large to compute quickly, so a formula
+cannot stall the editor either.
+
+FormulaSet compiles a set of formulas into a dependency graph, rejecting
+loops, and orders the targets so each comes after the targets it reads.
+affected() returns only the targets that depend on the changed settings,
+directly or through other targets, so an edit re-evaluates just those.
+"""
+import ast
+import math
+import operator
+
+FORMULAS_SECTION = 'Formulas'
+MAX_FORMULA_LENGTH = 500
+MAX_EXPONENT = 100
+# Integer ** results are exact and could grow without bound; beyond this they are not a setting anyway
+MAX_POWER_BITS = 1024
+# round(value, digits) builds 10 ** digits
+MAX_ROUND_DIGITS = 15
+# Decimal places kept for float targets, so 600 * 2.3 is written as 1380.0
+FLOAT_DIGITS = 6
+
+FUNCTIONS = {
+    'min': min,
+    'max': max,
+    'abs': abs,
+    'round': lambda value, digits=None: _round(value, digits),
+    'clamp': lambda value, low, high: max(low, min(high, value)),
+}
+
+
+class FormulaError(ValueError):
+    pass
+
+
+def _power(base, exponent):
+    if abs(exponent) > MAX_EXPONENT:
+        raise FormulaError("Exponent of ** is too large")
+    if isinstance(base, int) and isinstance(exponent, int) and abs(base).bit_length() * exponent > MAX_POWER_BITS:
+        raise FormulaError("Result of ** is too large")
+    try:
+        return base ** exponent
+    except OverflowError:
+        # Float results beyond the float range
+        raise FormulaError("Result of ** is too large") from None
+
+
+def _round(value, digits):
+    if digits is None:
+        return round(value)
+    if abs(digits) > MAX_ROUND_DIGITS:
+        raise FormulaError(f"round() takes at most {MAX_ROUND_DIGITS} digits")
+    return round(value, digits)
+
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _power,
+}
+_UNARY_OPERATORS = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+
+
+def _dotted_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return f'{node.value.id}.{node.attr}'
+    return None
+
+
+class Formula:
+    """A compiled expression: inputs is the set of settings it reads"""
+
+    def __init__(self, text, resolve):
+        self.text = str(text).strip()
+        if len(self.text) > MAX_FORMULA_LENGTH:
+            raise FormulaError(f"Formula is longer than {MAX_FORMULA_LENGTH} characters")
+        try:
+            tree = ast.parse(self.text, mode='eval')
+        except SyntaxError as e:
+            raise FormulaError(f"Invalid formula '{self.text}': {e.msg}") from None
+        self.inputs = set()
+        self._resolve = resolve
+        self._evaluate = self._compile(tree.body)
+
+    def _compile(self, node):
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            value = node.value
+            return lambda get: value
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            op = _BINARY_OPERATORS[type(node.op)]
+            left, right = self._compile(node.left), self._compile(node.right)
+            return lambda get: op(left(get), right(get))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            op = _UNARY_OPERATORS[type(node.op)]
+            operand = self._compile(node.operand)
+            return lambda get: op(operand(get))
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS \
+                and not node.keywords and node.args:
+            function = FUNCTIONS[node.func.id]
+            args = [self._compile(arg) for arg in node.args]
+            return lambda get: function(*(arg(get) for arg in args))
+        name = _dotted_name(node)
+        if name is not None:
+            setting = self._resolve(name)
+            self.inputs.add(setting)
+            return lambda get: get(*setting)
+        raise FormulaError(f"Unsupported expression in formula '{self.text}': {ast.unparse(node)}")
+
+    def evaluate(self, get):
+        return self._evaluate(get)
+
+
+class FormulaSet:
+    """Compiled {target setting: Formula} over the numeric settings of a schema, in dependency order"""
+
+    def __init__(self, defaults, definitions=None):
+        self.defaults = defaults
+        self._names = {}
+        ambiguous = set()
+        for section, key in defaults:
+            self._names[f'{section}.{key}'] = (section, key)
+            if key in self._names:
+                ambiguous.add(key)
+            self._names[key] = (section, key)
+        for key in ambiguous:
+            del self._names[key]
+
+        self.formulas = {}
+        # Canonical text of every formula, {"Section.Key": expression}
+        self.definitions = {}
+        for target_name, text in (definitions or {}).items():
+            target = self.resolve(target_name)
+            formula = Formula(text, self.resolve)
+            self.formulas[target] = formula
+            self.definitions[f'{target[0]}.{target[1]}'] = formula.text
+
+        self.dependents = {}
+        for target, formula in self.formulas.items():
+            for setting in formula.inputs:
+                self.dependents.setdefault(setting, []).append(target)
+        self.order = self._sort()
+        self._position = {target: i for i, target in enumerate(self.order)}
+
+    def resolve(self, name):
+        """The (section, key) a name in a formula refers to"""
+        name = str(name).strip()
+        setting = self._names.get(name)
+        if setting is None:
+            if any(key == name for _, key in self.defaults):
+                raise FormulaError(f"'{name}' is in several sections; write it as Section.{name}")
+            raise FormulaError(f"Unknown setting '{name}'")
+        if isinstance(self.defaults[setting], bool):
+            raise FormulaError(f"'{name}' is not a number setting")
+        return setting
+
+    def _sort(self):
+        """Targets ordered so every target comes after the targets it reads; raises FormulaError on a loop"""
+        order = []
+        state = {}  # target -> 'visiting' or 'done'
+
+        def visit(target, path):
+            if state.get(target) == 'done':
+                return
+            if state.get(target) == 'visiting':
+                loop = path[path.index(target):] + [target]
+                raise FormulaError(f"Formula loop: {' -> '.join(key for _, key in loop)}")
+            state[target] = 'visiting'
+            for setting in self.formulas[target].inputs:
+                if setting in self.formulas:
+                    visit(setting, path + [target])
+            state[target] = 'done'
+            order.append(target)
+
+        for target in self.formulas:
+            visit(target, [])
+        return order
+
+    def __bool__(self):
+        return bool(self.formulas)
+
+    def __contains__(self, setting):
+        return setting in self.formulas
+
+    def affected(self, changed):
+        """Targets that depend on any of the changed settings, in evaluation order"""
+        found = set()
+        pending = [setting for setting in changed if setting in self.dependents]
+        while pending:
+            for target in self.dependents.get(pending.pop(), ()):
+                if target not in found:
+                    found.add(target)
+                    pending.append(target)
+        return sorted(found, key=self._position.__getitem__)
+
+    def evaluate(self, target, get):
+        """Value of a target typed like its default, or None if an input is not a number or the math fails"""
+        try:
+            value = self.formulas[target].evaluate(get)
+        except (ArithmeticError, TypeError, ValueError):
+            # An input is being typed (text) or the formula divides by zero; keep the last value
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            return None
+        if isinstance(self.defaults[target], int):
+            return int(round(value))
+        return round(float(value), FLOAT_DIGITS)
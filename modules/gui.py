@@ -1,15 +1,45 @@
 # modules/gui.py
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
 import sys
 import os
-from .config import ConfigHandler
+import time
+import queue
+from concurrent.futures import Future
+from .automation import AutomationError, AutomationServer, AutomationService, APP_ERROR, automation_enabled
+from .build_queue import BuildQueue
+from .config import ConfigHandler, get_app_paths, get_mods_path
 from .mod import ModCreator
 from .config_interface import ConfigInterface
+from .mods_analyzer import ModsAnalyzer
+from .presets import PresetResolver, PresetError
+from .preset_watch import PresetWatcher, WatchBuilder
+from .engine_tuning import EngineTuningFrame
+from .timing import startup_spans, TRACE_FILE_NAME
+from .profiling import ActionProfiler, PROFILE_DIR_NAME
+from .stall_monitor import StallMonitor, get_threshold_from_env
+from .diagnostics_log import diagnostics_log, LOG_DIR_NAME
 from .localization.language_manager import LanguageManager, get_current_localization, t, error, success, warning, confirm, font
 # Removed updater import to eliminate network functionality and potential AV false positives
 from . import VERSION
 
+# Command callbacks that can be profiled with --profile-actions (builds are profiled as build_mod)
+PROFILED_ACTIONS = [
+    'load_custom_preset', 'load_default', 'load_v3fish', 'load_xy_fix',
+    'save_preset', 'new_preset', 'create_mod', 'remove_mod',
+    'refresh_ui', 'show_language_selection', 'show_mods_analyzer', 'undo', 'redo',
+]
+
+# How often the window checks for requests from later launches
+INSTANCE_POLL_MS = 250
+# Watch results are shown as soon as a build finishes
+WATCH_POLL_MS = 100
+# Automation requests wait for the Tk thread, so they are picked up more often
+AUTOMATION_POLL_MS = 50
+# How often a Create/Update waiting for the build queue checks whether its build is done
+BUILD_POLL_MS = 50
+
 class PresetDialog(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent)
@@ -54,46 +84,182 @@ class PresetDialog(tk.Toplevel):
     def cancel(self):
         self.destroy()
         
+class ModsAnalyzerDialog(tk.Toplevel):
+    """Shows pak count, size and load order of the ~mods folder"""
+
+    def __init__(self, parent, analyzer, mods_path, prototypes=None):
+        super().__init__(parent)
+        loc = get_current_localization()
+        
+        self.title(loc.get_title("mods_analyzer"))
+        self.geometry("760x480")
+        self.transient(parent)
+        
+        report = analyzer.analyze(mods_path, prototypes)
+        
+        ttk.Label(self, text=loc.get_label("mods_summary",
+                                           count=report['pak_count'],
+                                           size=f"{report['total_bytes'] / (1024 * 1024):.1f}",
+                                           entries=report['total_entries']),
+                  font=font('bold')).pack(anchor='w', padx=10, pady=(10, 5))
+        
+        columns = ('order', 'pak', 'entries', 'size', 'notes')
+        tree_frame = ttk.Frame(self)
+        tree_frame.pack(fill='both', expand=True, padx=10)
+        tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=12)
+        for column, width in zip(columns, (50, 330, 70, 90, 180)):
+            tree.heading(column, text=loc.get_label(f"mods_column_{column}"))
+            tree.column(column, width=width, anchor='w')
+        scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y')
+        tree.pack(side='left', fill='both', expand=True)
+        
+        for pak in report['paks']:
+            notes = []
+            if pak['error']:
+                notes.append(pak['error'])
+            if pak['name'] in report['overriding_paks']:
+                notes.append(loc.get_label("mods_overrides_scam"))
+            if os.path.basename(pak['path']) in report['incompatible_mods']:
+                notes.append(loc.get_title("incompatible_mods"))
+            tree.insert('', 'end', values=(pak['order'], pak['name'], pak['entries'],
+                                           pak['size'], ", ".join(notes)))
+        
+        # Effective load order of every file SCAM writes
+        order_lines = []
+        for path, order in report['load_order'].items():
+            winner = order['winner'] or loc.get_label("mods_not_installed")
+            order_lines.append(f"{os.path.basename(path)}: {winner}")
+        ttk.Label(self, text="\n".join(order_lines), font=font('small')).pack(anchor='w', padx=10, pady=5)
+        
+        ttk.Button(self, text=loc.get_button("ok"), command=self.destroy).pack(pady=(0, 10))
+        self.bind('<Escape>', lambda e: self.destroy())
+
+class DiagnosticsDialog(tk.Toplevel):
+    """Shows startup phase timings and event-loop stalls, and copies them with the diagnostic log"""
+
+    def __init__(self, parent, stall_monitor=None):
+        super().__init__(parent)
+        loc = get_current_localization()
+        self.stall_monitor = stall_monitor
+        
+        self.title(loc.get_title("diagnostics"))
+        self.geometry("640x560")
+        self.transient(parent)
+        
+        ttk.Label(self, text=loc.get_label("startup_timings"), font=font('bold')).pack(anchor='w', padx=10, pady=(10, 5))
+        if startup_spans.spans:
+            columns = ('phase', 'start', 'duration', 'widgets')
+            tree = ttk.Treeview(self, columns=columns, show='headings', height=10)
+            for column, width in zip(columns, (230, 80, 90, 70)):
+                tree.heading(column, text=loc.get_label(f"startup_column_{column}"))
+                tree.column(column, width=width, anchor='w')
+            for span in startup_spans.spans:
+                widgets = span['widgets'] if span['widgets'] is not None else ''
+                tree.insert('', 'end', values=(span['name'], f"{span['start_ms']:.1f} ms",
+                                               f"{span['duration_ms']:.1f} ms", widgets))
+            tree.pack(fill='both', expand=True, padx=10)
+        else:
+            ttk.Label(self, text=loc.get_label("startup_tracing_disabled"),
+                      font=font('small_italic')).pack(anchor='w', padx=10)
+        
+        ttk.Label(self, text=loc.get_label("stall_events"), font=font('bold')).pack(anchor='w', padx=10, pady=(10, 5))
+        if stall_monitor is not None:
+            columns = ('time', 'duration', 'callback')
+            tree = ttk.Treeview(self, columns=columns, show='headings', height=6)
+            for column, width in zip(columns, (140, 90, 370)):
+                tree.heading(column, text=loc.get_label(f"stall_column_{column}"))
+                tree.column(column, width=width, anchor='w')
+            self.stall_stacks = {}
+            for event in reversed(stall_monitor.get_events()):
+                duration = f"{event['duration_ms']:.0f} ms" if event['duration_ms'] is not None else '...'
+                item = tree.insert('', 'end', values=(event['time'], duration, event['callback'] or ''))
+                self.stall_stacks[item] = ''.join(event['stack'])
+            tree.pack(fill='both', expand=True, padx=10)
+            # Stack of the selected stall, captured while the loop was blocked
+            stack_text = tk.Text(self, height=8, wrap='none', font=font('small'))
+            stack_text.pack(fill='both', expand=True, padx=10, pady=(5, 0))
+            
+            def show_stack(event):
+                stack_text.delete('1.0', tk.END)
+                for item in tree.selection():
+                    stack_text.insert(tk.END, self.stall_stacks.get(item, ''))
+            
+            tree.bind('<<TreeviewSelect>>', show_stack)
+        else:
+            ttk.Label(self, text=loc.get_label("stall_monitor_disabled"),
+                      font=font('small_italic')).pack(anchor='w', padx=10)
+        
+        button_frame = ttk.Frame(self)
+        button_frame.pack(pady=10)
+        ttk.Button(button_frame, text=loc.get_button("copy_diagnostics"), command=self.copy_diagnostics).pack(side='left', padx=5)
+        ttk.Button(button_frame, text=loc.get_button("ok"), command=self.destroy).pack(side='left', padx=5)
+        self.bind('<Escape>', lambda e: self.destroy())
+
+    def copy_diagnostics(self):
+        """Put startup timings, stalls and the diagnostic log on the clipboard for a bug report"""
+        sections = {'startup': startup_spans.to_dict()}
+        if self.stall_monitor is not None:
+            sections['stalls'] = self.stall_monitor.get_events()
+        self.clipboard_clear()
+        self.clipboard_append(diagnostics_log.export_text(VERSION, sections))
+        diagnostics_log.flush()
+        loc = get_current_localization()
+        messagebox.showinfo(loc.get_title("diagnostics"), loc.get_success("diagnostics_copied"), parent=self)
+
 class MovementConfigEditor:
-    def __init__(self):
-        self.window = tk.Tk()
+    def __init__(self, trace_startup=False, profile_actions=None, stall_threshold_ms=None, preset_path=None,
+                 instance=None, automation=False):
+        if trace_startup:
+            startup_spans.enable()
+        
+        with startup_spans.span('tk.Tk'):
+            self.window = tk.Tk()
+        startup_spans.widget_root = self.window
         self.window.geometry("1000x965")
 
-        if getattr(sys, 'frozen', False):
-            # For reading bundled resources (INI files, icons, etc.)
-            self.base_path = sys._MEIPASS
-            # For writing user data (preferences, etc.) - use exe directory
-            self.user_data_path = os.path.dirname(sys.executable)
-        else:
-            # For development, use the same path for both
-            self.base_path = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-            self.user_data_path = self.base_path
+        # Bundled resources (INI files, icons, etc.) and user data (preferences, etc.)
+        self.base_path, self.user_data_path = get_app_paths()
+        diagnostics_log.configure(os.path.join(self.user_data_path, LOG_DIR_NAME))
+        diagnostics_log.info('app.start', version=VERSION)
 
         # Set window icon
         try:
             icon_path = os.path.join(self.base_path, 'ico', 'icon2.ico')
             if os.path.exists(icon_path):
                 self.window.iconbitmap(icon_path)
-        except Exception:
-            pass  # If icon setting fails, continue without it
+        except Exception as e:
+            # If icon setting fails, continue without it
+            diagnostics_log.debug('window.icon_failed', error=str(e))
 
-        self.config_handler = ConfigHandler(self.base_path, self.user_data_path)
+        with startup_spans.span('ConfigHandler.__init__'):
+            self.config_handler = ConfigHandler(self.base_path, self.user_data_path)
+        self.preset_resolver = PresetResolver(self.config_handler)
         
         # Initialize mod_creator with error handling
         try:
-            self.mod_creator = ModCreator(self.base_path)
+            with startup_spans.span('ModCreator._load_mod_config'):
+                self.mod_creator = ModCreator(self.base_path)
         except FileNotFoundError as e:
             # Show error popup and exit
+            diagnostics_log.error('startup.missing_file', error=str(e))
             from tkinter import messagebox
             messagebox.showerror("Missing File", str(e))
             self.window.destroy()
             return
         
+        # Every build (Create/Update, watch mode, automation) goes through this queue, one at a time;
+        # its creator never opens windows since it runs on the queue's thread
+        self.build_queue = BuildQueue(ModCreator(self.base_path, interactive=False))
+        
         # Initialize config_interface with error handling
         try:
-            self.config_interface = ConfigInterface(self.window, self.config_handler)
+            with startup_spans.span('ConfigInterface.__init__'):
+                self.config_interface = ConfigInterface(self.window, self.config_handler)
         except FileNotFoundError as e:
             # Show error popup and exit
+            diagnostics_log.error('startup.missing_file', error=str(e))
             from tkinter import messagebox
             messagebox.showerror("Missing File", str(e))
             self.window.destroy()
@@ -107,26 +273,160 @@ class MovementConfigEditor:
         self.window.title(loc.get_app_title(VERSION))
         
         self.force_defaults = tk.BooleanVar(value=False)
+        # Watch mode: rebuild the mod whenever the selected preset file is saved
+        self.watch_preset = tk.BooleanVar(value=False)
+        self.preset_watcher = None
+        self.watch_results = queue.Queue()
+        self.watch_poll_id = None
+        # Extra ObjPrototypes overrides from the loaded preset, packed into the same mod
+        self.prototype_overrides = {}
         
         # Add window close handler to save current state
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        self.setup_gui()
+        # Wrap command callbacks before any widget binds them (no-op unless profiling is enabled)
+        self.action_profiler = ActionProfiler(os.path.join(self.user_data_path, PROFILE_DIR_NAME), profile_actions)
+        for action in PROFILED_ACTIONS:
+            setattr(self, action, self.action_profiler.wrap(action, getattr(self, action)))
+        # create_mod only queues the build; the build itself is profiled on the queue's thread
+        self.build_queue.profiler = self.action_profiler
+        
+        with startup_spans.span('setup_gui'):
+            self.setup_gui()
         
         # Restore last settings after GUI is set up
-        self.restore_last_settings()
+        with startup_spans.span('restore_last_settings'):
+            self.restore_last_settings()
+        # Restoring the last session is not something to undo
+        self.config_interface.history.clear()
+        self.update_undo_buttons()
+        
+        if startup_spans.enabled:
+            # Also measure until the event loop first goes idle, i.e. the window is drawn
+            self._first_idle_start = time.perf_counter()
+            self.window.after_idle(self._on_first_idle)
+        
+        # Event-loop stall watchdog, started once the loop runs so startup is not reported
+        self.stall_monitor = None
+        if stall_threshold_ms is None:
+            stall_threshold_ms = get_threshold_from_env()
+        if stall_threshold_ms is not None:
+            self.stall_monitor = StallMonitor(self.window, threshold_ms=stall_threshold_ms)
+            self.window.after_idle(self.stall_monitor.start)
+        
+        if preset_path:
+            self.open_preset_file(preset_path)
+        
+        # Requests forwarded by later launches of the app (see single_instance.py)
+        self.instance = instance
+        if instance is not None:
+            self.window.after(INSTANCE_POLL_MS, self._poll_instance_messages)
+        
+        # Local automation API (see automation.py); its requests run on the Tk thread
+        self.automation_server = None
+        self.automation_calls = queue.Queue()
+        if automation or automation_enabled():
+            self.start_automation()
         
         # Removed update functionality
 
+    def _on_first_idle(self):
+        """Finish startup tracing and write the timings to startup_trace.json"""
+        startup_spans.record('first_idle', self._first_idle_start, time.perf_counter())
+        try:
+            startup_spans.write_json(os.path.join(self.user_data_path, TRACE_FILE_NAME))
+        except OSError as e:
+            diagnostics_log.warning('startup_trace.write_failed', error=str(e))
+
+    def _poll_instance_messages(self):
+        while True:
+            try:
+                message = self.instance.messages.get_nowait()
+            except queue.Empty:
+                break
+            self.handle_instance_message(message)
+        self.window.after(INSTANCE_POLL_MS, self._poll_instance_messages)
+
+    def handle_instance_message(self, message):
+        """Bring the window to the front and open the preset another launch was given"""
+        diagnostics_log.info('instance.message', command=message.get('command'), preset=message.get('preset'))
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
+        if message.get('preset'):
+            self.open_preset_file(message['preset'])
+
+    def start_automation(self):
+        """Serve the automation API on the settings shown in this window"""
+        self.automation_service = AutomationService(
+            self.config_handler, self.config_interface.model, self.build_queue, self._automation_mods_path,
+            call=self._call_on_tk, editor=self, mode='gui')
+        self.automation_server = AutomationServer(self.automation_service, self.user_data_path)
+        try:
+            self.automation_server.start()
+        except OSError as e:
+            diagnostics_log.exception('automation.start_failed', e)
+            self.automation_server = None
+            return
+        self.window.after(AUTOMATION_POLL_MS, self._poll_automation_calls)
+
+    def _automation_mods_path(self):
+        if not self.config_interface.game_dir_valid:
+            return None
+        return self.config_interface.current_mods_path()
+
+    def _call_on_tk(self, func):
+        """Run func on the Tk thread and return its result; called from the server's threads"""
+        if self.automation_server is None:
+            raise AutomationError(APP_ERROR, "SCAM is closing")
+        future = Future()
+        self.automation_calls.put((func, future))
+        return future.result()
+
+    def _poll_automation_calls(self):
+        if self.automation_server is None:
+            return
+        while True:
+            try:
+                func, future = self.automation_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                future.set_result(func())
+            except Exception as e:
+                # Raised again in the server thread, which turns it into the error response
+                future.set_exception(e)
+        self.window.after(AUTOMATION_POLL_MS, self._poll_automation_calls)
+
+    def stop_automation(self):
+        if self.automation_server is None:
+            return
+        self.automation_server.stop()
+        self.automation_server = None
+        # Requests still waiting for the Tk thread would wait forever
+        while True:
+            try:
+                func, future = self.automation_calls.get_nowait()
+            except queue.Empty:
+                break
+            future.set_exception(AutomationError(APP_ERROR, "SCAM is closing"))
+
     def on_closing(self):
         """Handle window closing event to save current state"""
         try:
             # Save current preset selection if one is selected
             if hasattr(self, 'preset_var') and self.preset_var.get():
                 self.config_handler.set_last_selected_preset(self.preset_var.get())
-        except Exception:
+        except Exception as e:
             # Don't let saving errors prevent application from closing
-            pass
+            diagnostics_log.exception('window.close_save_failed', e)
+        
+        if self.stall_monitor is not None:
+            self.stall_monitor.stop()
+        self.stop_watch()
+        self.stop_automation()
+        self.build_queue.stop()
+        self.config_interface.close()
         
         # Close the application
         self.window.destroy()
@@ -147,6 +447,11 @@ class MovementConfigEditor:
                                 command=self.show_language_selection)
         language_btn.pack(side='left', padx=5)
         
+        ttk.Button(credits_frame, text=t("analyze_mods"),
+                   command=self.show_mods_analyzer).pack(side='left', padx=5)
+        ttk.Button(credits_frame, text=t("diagnostics"),
+                   command=lambda: DiagnosticsDialog(self.window, self.stall_monitor)).pack(side='left', padx=5)
+        
         loc = get_current_localization()
         credits_label = ttk.Label(credits_frame, 
                                 text=loc.get_credits_text(VERSION),
@@ -189,12 +494,14 @@ class MovementConfigEditor:
         self.remove_mod_btn = ttk.Button(self.mod_buttons_frame, text=t("remove_mod"),
                                        command=self.remove_mod)
         
-        # Update button states
-        self.config_interface.update_mod_status()
+        # Update button states, and again whenever the game directory is checked or the mod is installed or removed
         self.update_mod_buttons()
+        self.config_interface.on_mod_status_change = self.update_mod_buttons
         
-        # Add trace to game_dir for button updates
-        self.config_interface.game_dir.trace_add('write', lambda *args: self.update_mod_buttons())
+        # Widgets without a font of their own use the language's font family (see localization/manifest.py)
+        family = self.language_manager.get_font_family()
+        for name in ('TkDefaultFont', 'TkTextFont', 'TkMenuFont', 'TkHeadingFont', 'TkCaptionFont'):
+            tkfont.nametofont(name).configure(family=family)
         
         style = ttk.Style()
         style.configure('Big.TButton', font=font('button'))
@@ -210,10 +517,8 @@ class MovementConfigEditor:
         self.update_mod_btn.pack_forget()
         self.remove_mod_btn.pack_forget()
         
-        # Get fresh mod status
-        self.config_interface.update_mod_status()
-        
-        if self.config_interface.game_dir.get() and self.config_interface.validate_game_directory(self.config_interface.game_dir.get(), show_error=False):
+        # The game directory check and the ~mods watcher keep the status current, so no disk access here
+        if self.config_interface.game_dir.get() and self.config_interface.game_dir_valid:
             if self.config_interface.mod_exists:
                 # Show Update and Remove buttons
                 self.update_mod_btn.pack(side='right', padx=5, ipady=5, ipadx=10)
@@ -236,6 +541,29 @@ class MovementConfigEditor:
         ttk.Button(buttons_frame, text=loc.get_preset("default"), command=self.load_default).pack(side='left', padx=5)
         ttk.Button(buttons_frame, text=loc.get_preset("v3fish_recommended"), command=self.load_v3fish).pack(side='left', padx=5)
         ttk.Button(buttons_frame, text=loc.get_preset("xy_sensitivity_fix"), command=self.load_xy_fix).pack(side='left', padx=5)
+        
+        self.undo_btn = ttk.Button(buttons_frame, text=t("undo"), command=self.undo, state='disabled')
+        self.undo_btn.pack(side='left', padx=(20, 5))
+        self.redo_btn = ttk.Button(buttons_frame, text=t("redo"), command=self.redo, state='disabled')
+        self.redo_btn.pack(side='left', padx=5)
+        self.config_interface.model.subscribe(lambda changes: self.update_undo_buttons())
+        self.window.bind_all('<Control-z>', lambda e: self.undo())
+        self.window.bind_all('<Control-y>', lambda e: self.redo())
+        self.window.bind_all('<Control-Z>', lambda e: self.redo())
+
+    def update_undo_buttons(self):
+        history = self.config_interface.history
+        self.undo_btn.configure(state='normal' if history.can_undo else 'disabled')
+        self.redo_btn.configure(state='normal' if history.can_redo else 'disabled')
+
+    def undo(self):
+        """Revert the last settings change (typing in a field, preset load, reset...)"""
+        self.config_interface.history.undo()
+        self.update_undo_buttons()
+
+    def redo(self):
+        self.config_interface.history.redo()
+        self.update_undo_buttons()
 
     def setup_advanced_options(self, parent):
         advanced_frame = ttk.Frame(parent)
@@ -250,6 +578,81 @@ class MovementConfigEditor:
         ttk.Label(advanced_frame, 
                  text=loc.get_label("advanced_force_defaults"),
                  font=font('small_italic')).pack(side='left', padx=5)
+        
+        ttk.Checkbutton(advanced_frame, text=t("watch_preset"), variable=self.watch_preset,
+                        command=self.toggle_watch).pack(side='left', padx=(20, 5))
+        self.watch_status = ttk.Label(advanced_frame, text="", font=font('small_italic'))
+        self.watch_status.pack(side='left', padx=5)
+
+    def toggle_watch(self):
+        """Start or stop rebuilding the mod whenever the selected preset file is saved"""
+        if not self.watch_preset.get():
+            self.stop_watch()
+            return
+        loc = get_current_localization()
+        selected = self.preset_var.get()
+        if not selected or not os.path.exists(self.preset_resolver.preset_path(selected)):
+            self.watch_preset.set(False)
+            messagebox.showwarning(loc.get_title("warning"), loc.get_warning("watch_select_preset"))
+            return
+        mods_check = self.config_interface.validate_mods_directory()
+        if not mods_check:
+            self.watch_preset.set(False)
+            return
+        builder = WatchBuilder(self.config_handler, self.build_queue, mods_check[1],
+                               include_defaults=self.force_defaults.get())
+        self.watch_results = queue.Queue()
+        self.preset_watcher = PresetWatcher(self.preset_resolver.preset_path(selected),
+                                            lambda path: self.watch_results.put(builder.build(path)))
+        self.preset_watcher.start()
+        diagnostics_log.info('watch.started', preset=selected, mods_path=mods_check[1])
+        self.watch_status.configure(text=loc.get_label("watch_waiting", preset=selected))
+        self.watch_poll_id = self.window.after(WATCH_POLL_MS, self._poll_watch_results)
+
+    def stop_watch(self):
+        if self.preset_watcher is None:
+            return
+        self.preset_watcher.stop()
+        self.preset_watcher = None
+        # Otherwise turning watch back on before it fires would start a second poll loop
+        if self.watch_poll_id is not None:
+            self.window.after_cancel(self.watch_poll_id)
+            self.watch_poll_id = None
+        self.watch_preset.set(False)
+        if self.watch_status.winfo_exists():
+            self.watch_status.configure(text="")
+
+    def _poll_watch_results(self):
+        if self.preset_watcher is None:
+            return
+        while True:
+            try:
+                result = self.watch_results.get_nowait()
+            except queue.Empty:
+                break
+            self.handle_watch_result(result)
+        self.watch_poll_id = self.window.after(WATCH_POLL_MS, self._poll_watch_results)
+
+    def handle_watch_result(self, result):
+        """Show the outcome of a watch build and load what was installed into the editor"""
+        loc = get_current_localization()
+        status = result['status']
+        if status == 'installed':
+            config = self._resolve_preset(lambda: self.preset_resolver.resolve_file(result['path']))
+            if config is not None:
+                config, prototypes = self.config_handler.split_prototype_sections(config)
+                if self.config_interface.update_entries(config):
+                    self.prototype_overrides = prototypes
+            self.config_interface.update_mod_status()
+            self.update_mod_buttons()
+            text = loc.get_label("watch_installed", ms=round(result['duration_ms']))
+        elif status == 'unchanged':
+            text = loc.get_label("watch_unchanged")
+        elif status == 'invalid':
+            text = loc.get_label("watch_invalid", error=result['issues'][0])
+        else:
+            text = loc.get_label("watch_failed", error=result['error'])
+        self.watch_status.configure(text=f"{time.strftime('%H:%M:%S')} {text}")
 
     def setup_main_content(self):
         container = ttk.Frame(self.window)
@@ -287,30 +690,19 @@ class MovementConfigEditor:
         self.create_section_tabs(notebook)
 
     def create_section_tabs(self, notebook):
-        # Set the notebook reference in config_interface so it can update tab colors
-        self.config_interface.set_notebook_reference(notebook)
-        
-        for section in self.config_handler.default_config:
-            if section not in ['MovementParams', 'Aiming']:
-                frame = ttk.Frame(notebook)
-                notebook.add(frame, text=section)
-                self.config_interface.setup_section_frame(frame, section)
-
-        if 'MovementParams' in self.config_handler.default_config:
-            frame = ttk.Frame(notebook)
-            # Keep MovementParams in English - don't translate
-            notebook.add(frame, text="MovementParams")
-            self.config_interface.setup_movement_frame(frame)
+        self.config_interface.create_setting_tabs(notebook)
         
         frame = ttk.Frame(notebook)
-        # Keep Aiming in English - don't translate
-        notebook.add(frame, text="Aiming")
-        self.config_interface.setup_aiming_section(frame)
+        notebook.add(frame, text="Engine.ini")
+        self.engine_tuning = EngineTuningFrame(frame, get_game_dir=self._valid_game_dir)
         
         # Initialize default button states and tab colors
         self.config_interface.update_all_default_button_states()
         self.config_interface.update_tab_colors()
 
+    def _valid_game_dir(self):
+        return self.config_interface.game_dir.get() if self.config_interface.game_dir_valid else None
+
     def load_presets(self):
         if not os.path.exists('Presets'):
             return
@@ -323,19 +715,24 @@ class MovementConfigEditor:
             self.preset_var.set(last_preset)
 
     def load_default(self):
-        self.config_interface.sync_sensitivity.set(False)
+        # One undo step for the whole reset
+        with self.config_interface.model.transaction():
+            self.config_interface.sync_sensitivity.set(False)
+            self.config_interface.update_entries(self.config_handler.default_config)
         self.force_defaults.set(False)
-        self.config_interface.update_entries(self.config_handler.default_config)
+        self.prototype_overrides = {}
         # Clear last settings when loading default (but keep preset selection)
         self.config_handler.set_last_settings({})
 
     def load_xy_fix(self):
         self.config_interface.update_entries(self.config_handler.xy_fix_config)
+        self.prototype_overrides = {}
         # Clear last settings when loading XY fix (but keep preset selection)
         self.config_handler.set_last_settings({})
 
     def load_v3fish(self):
         self.config_interface.update_entries(self.config_handler.v3fish_config)
+        self.prototype_overrides = {}
         # Clear last settings when loading v3fish (but keep preset selection)
         self.config_handler.set_last_settings({})
 
@@ -343,11 +740,47 @@ class MovementConfigEditor:
         selected = self.preset_var.get()
         if not selected:
             return
-        config = self.config_handler.load_ini_file(os.path.join('Presets', f'{selected}.ini'))
-        self.config_interface.update_entries(config)
+        config = self._resolve_preset(lambda: self.preset_resolver.resolve(selected))
+        if config is None:
+            return
+        config, prototypes = self.config_handler.split_prototype_sections(config)
+        if not self.config_interface.update_entries(config):
+            return
+        self.prototype_overrides = prototypes
         # Save the selected preset (but don't clear settings since user might have customized after preset)
         self.config_handler.set_last_selected_preset(selected)
 
+    def open_preset_file(self, path):
+        """Load a preset file, selecting it in the preset list if it is in the Presets folder"""
+        path = os.path.abspath(path)
+        if not os.path.isfile(path):
+            loc = get_current_localization()
+            messagebox.showerror(loc.get_title("error"), loc.get_error("preset_file_not_found", path=path))
+            return
+        name = os.path.splitext(os.path.basename(path))[0]
+        if os.path.dirname(path) == os.path.abspath('Presets'):
+            self.load_presets()
+            self.preset_var.set(name)
+            self.load_custom_preset()
+            return
+        config = self._resolve_preset(lambda: self.preset_resolver.resolve_file(path))
+        if config is None:
+            return
+        config, prototypes = self.config_handler.split_prototype_sections(config)
+        if not self.config_interface.update_entries(config):
+            return
+        self.prototype_overrides = prototypes
+
+    def _resolve_preset(self, resolve):
+        """Return the resolved preset config, or None after showing why it could not be resolved"""
+        try:
+            return resolve()
+        except PresetError as e:
+            diagnostics_log.warning('preset.resolve_failed', error=str(e))
+            loc = get_current_localization()
+            messagebox.showerror(loc.get_title("error"), loc.get_error("failed_to_load_preset", error=str(e)))
+            return None
+
     def open_presets_folder(self):
         presets_path = os.path.abspath('Presets')
         if not os.path.exists(presets_path):
@@ -376,6 +809,7 @@ class MovementConfigEditor:
             return
             
         config = self.config_interface.get_current_config()
+        config = self.config_handler.join_prototype_sections(config, self.prototype_overrides)
             
         if not os.path.exists('Presets'):
             os.makedirs('Presets')
@@ -413,8 +847,22 @@ class MovementConfigEditor:
                                  loc.get_confirmation("overwrite_preset", preset=self.preset_var.get())):
             return
             
-        config = self.config_interface.get_current_config()
-        self.config_handler.save_ini_file(config, f'Presets/{self.preset_var.get()}.ini')
+        preset_path = os.path.join('Presets', f'{self.preset_var.get()}.ini')
+        try:
+            base = self.preset_resolver.base_of(preset_path)
+        except PresetError:
+            base = None
+        if base:
+            # Keep inheriting: store only what differs from the base preset
+            config = self.config_interface.get_current_config(include_defaults=True)
+            if config is None:
+                return
+            config = self.config_handler.join_prototype_sections(config, self.prototype_overrides)
+            config = self.preset_resolver.rebase(config, base)
+        else:
+            config = self.config_interface.get_current_config()
+            config = self.config_handler.join_prototype_sections(config, self.prototype_overrides)
+        self.config_handler.save_ini_file(config, preset_path)
         # Save the current preset as the last selected and clear last settings
         self.config_handler.set_last_selected_preset(self.preset_var.get())
         self.config_handler.set_last_settings({})
@@ -436,6 +884,9 @@ class MovementConfigEditor:
             # Restore force defaults state
             if 'force_defaults' in last_settings:
                 self.force_defaults.set(last_settings['force_defaults'])
+            
+            # Restore extra prototype overrides
+            self.prototype_overrides = last_settings.get('prototypes', {})
 
     def remove_mod(self):
         """Handle mod removal"""
@@ -459,7 +910,7 @@ class MovementConfigEditor:
                                 loc.get_error("invalid_values_fix", issues="\n".join(invalid_values)))
             return
 
-        if not self.config_interface.has_changes() and not self.force_defaults.get():
+        if not self.config_interface.has_changes() and not self.force_defaults.get() and not self.prototype_overrides:
             loc = get_current_localization()
             messagebox.showwarning(loc.get_title("warning"), 
                                  loc.get_warning("make_changes_before_creating"))
@@ -479,38 +930,74 @@ class MovementConfigEditor:
         if not config:
             return
         
-        try:
-            is_local, mod_path = mods_check
-            self.mod_creator.create_mod(config, mod_path)
-            
-            # Save current settings after successful mod creation
-            full_config = self.config_interface.get_current_config(include_defaults=True)
-            if full_config:
-                # Include sync sensitivity state and force defaults state
-                settings_to_save = {
-                    'config': full_config,
-                    'sync_sensitivity': self.config_interface.sync_sensitivity.get(),
-                    'force_defaults': self.force_defaults.get()
-                }
-                self.config_handler.set_last_settings(settings_to_save)
-            
-            # Update buttons after successful creation
-            self.config_interface.update_mod_status()
-            self.update_mod_buttons()
-            
-            loc = get_current_localization()
-            if self.config_interface.mod_exists and self.config_interface.game_dir.get():
-                messagebox.showinfo(loc.get_title("success"), 
-                                   loc.get_success("mod_updated"))
-            else:
-                success_msg = loc.get_success("mod_created")
-                if is_local:
-                    success_msg += f"\n{loc.get_success('mod_created_local')}"
-                messagebox.showinfo(loc.get_title("success"), success_msg)
-        except Exception as e:
-            loc = get_current_localization()
+        is_local, mod_path = mods_check
+        # Settings to restore next time, as they are when the build is requested
+        full_config = self.config_interface.get_current_config(include_defaults=True)
+        settings_to_save = None
+        if full_config:
+            # Include sync sensitivity state and force defaults state
+            settings_to_save = {
+                'config': full_config,
+                'sync_sensitivity': self.config_interface.sync_sensitivity.get(),
+                'force_defaults': self.force_defaults.get(),
+                'prototypes': self.prototype_overrides
+            }
+        # Warn about incompatible mods here; the queue's creator cannot show dialogs
+        self.mod_creator.check_incompatible_mods(mod_path)
+        future = self.build_queue.submit(config, dict(self.prototype_overrides), mod_path)
+        progress_window = self.mod_creator.show_progress_window()
+        
+        def wait():
+            # The build runs on the queue's thread, after any build already running (watch mode, automation)
+            if not future.done():
+                self.window.after(BUILD_POLL_MS, wait)
+                return
+            progress_window.destroy()
+            self.handle_mod_built(future.result(), is_local, settings_to_save)
+        wait()
+
+    def handle_mod_built(self, result, is_local, settings_to_save):
+        """Report the outcome of a Create/Update build"""
+        loc = get_current_localization()
+        if result['status'] == 'failed':
+            diagnostics_log.error('mod.create_failed', error=result['error'])
             messagebox.showerror(loc.get_title("error"), 
-                                loc.get_error("failed_to_create_mod", error=str(e)))
+                                loc.get_error("failed_to_create_mod", error=result['error']))
+            return
+        
+        # Save current settings after successful mod creation
+        if settings_to_save:
+            self.config_handler.set_last_settings(settings_to_save)
+        
+        # Update buttons after successful creation
+        self.config_interface.update_mod_status()
+        self.update_mod_buttons()
+        
+        # No report when the installed pak already held these files
+        report = result.get('report')
+        merged_msg = ""
+        if report and report['entries'] > 1:
+            merged_msg = "\n" + loc.get_success("overrides_merged",
+                count=report['entries'],
+                paks_saved=report['separate_pak_count'] - report['pak_count'],
+                bytes_saved=report['separate_pak_bytes'] - report['pak_bytes'])
+        if self.config_interface.mod_exists and self.config_interface.game_dir.get():
+            messagebox.showinfo(loc.get_title("success"), 
+                               loc.get_success("mod_updated") + merged_msg)
+        else:
+            success_msg = loc.get_success("mod_created")
+            if is_local:
+                success_msg += f"\n{loc.get_success('mod_created_local')}"
+            messagebox.showinfo(loc.get_title("success"), success_msg + merged_msg)
+
+    def show_mods_analyzer(self):
+        """Show the ~mods footprint and load order report"""
+        if not self.config_interface.validate_game_directory(self.config_interface.game_dir.get(), show_error=True):
+            return
+        if not hasattr(self, 'mods_analyzer'):
+            self.mods_analyzer = ModsAnalyzer(self.mod_creator, self.user_data_path)
+        mods_path = get_mods_path(self.config_interface.game_dir.get())
+        ModsAnalyzerDialog(self.window, self.mods_analyzer, mods_path, self.prototype_overrides)
 
     def show_language_selection(self):
         """Show language selection dialog"""
@@ -521,6 +1008,9 @@ class MovementConfigEditor:
         loc = get_current_localization()
         self.window.title(loc.get_app_title(VERSION))
         
+        # The watch builder was set up with the old defaults
+        self.stop_watch()
+        
         # Reload configuration with new language-specific INI file
         self.config_handler.load_default_config()
         
@@ -529,12 +1019,18 @@ class MovementConfigEditor:
             widget.destroy()
         
         # Recreate config interface with new config
+        self.config_interface.close()
         self.config_interface = ConfigInterface(self.window, self.config_handler)
         
         self.setup_gui()
+        if self.automation_server is not None:
+            self.automation_service.model = self.config_interface.model
         
         # Restore last settings after recreating the UI
         self.restore_last_settings()
+        # As at startup, restoring the session is not something to undo
+        self.config_interface.history.clear()
+        self.update_undo_buttons()
 
     def run(self):
         self.window.mainloop()
@@ -546,6 +1042,6 @@ class MovementConfigEditor:
             if selected_preset:
                 # Save the newly selected preset
                 self.config_handler.set_last_selected_preset(selected_preset)
-        except Exception:
+        except Exception as e:
             # Don't let saving errors cause issues
-            pass
\ No newline at end of file
+            diagnostics_log.exception('preset.save_selection_failed', e, level='warning')
\ No newline at end of file
@@ -0,0 +1,196 @@
+# modules/ini_document.py
+"""
+Line-preserving INI document model for the game's user config files.
+
+Unlike configparser, edits touch only the affected lines: comments, blank lines,
+section order and duplicate keys elsewhere in the file are kept as they are.
+Parsed files are cached by modification time and saved atomically.
+"""
+import os
+import tempfile
+
+# path -> (mtime_ns, size, lines, newline, bom)
+_parse_cache = {}
+
+
+def _line_ending(line):
+    if line.endswith('\r\n'):
+        return '\r\n'
+    if line.endswith('\n'):
+        return '\n'
+    return ''
+
+
+def _section_name(line):
+    stripped = line.strip()
+    if stripped.startswith('[') and stripped.endswith(']'):
+        return stripped[1:-1]
+    return None
+
+
+def _split_key(line):
+    """Return (key, value) for a key=value line, or None for comments and other lines"""
+    stripped = line.strip()
+    if not stripped or stripped[0] in ';#[' or '=' not in stripped:
+        return None
+    key, value = stripped.split('=', 1)
+    return key.strip(), value.strip()
+
+
+class IniDocument:
+    """
+    Usage:
+        doc = IniDocument.load(path)
+        doc.set('/Script/Engine.InputSettings', 'bEnableMouseSmoothing', 'False')
+        doc.save()
+    """
+
+    def __init__(self, path, lines=None, newline=os.linesep, bom=False):
+        self.path = path
+        self.lines = list(lines or [])
+        self.newline = newline
+        self.bom = bom
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path):
+        """Load path, reusing the cached parse when the file has not changed. Missing files load empty."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return cls(path)
+        cached = _parse_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cls(path, cached[2], cached[3], cached[4])
+
+        with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+            text = f.read()
+        bom = text.startswith('\ufeff')
+        if bom:
+            text = text[1:]
+        lines = text.splitlines(keepends=True)
+        newline = next((_line_ending(line) for line in lines if _line_ending(line)), os.linesep)
+        _parse_cache[path] = (stat.st_mtime_ns, stat.st_size, tuple(lines), newline, bom)
+        return cls(path, lines, newline, bom)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def _section_range(self, section):
+        """Return (header index, end index) of the first matching section, or None"""
+        start = None
+        for i, line in enumerate(self.lines):
+            name = _section_name(line)
+            if name is None:
+                continue
+            if start is not None:
+                return start, i
+            if name == section:
+                start = i
+        return (start, len(self.lines)) if start is not None else None
+
+    def sections(self):
+        return [name for name in map(_section_name, self.lines) if name is not None]
+
+    def has_section(self, section):
+        return self._section_range(section) is not None
+
+    def items(self, section):
+        """Return the key/value pairs of a section in file order"""
+        bounds = self._section_range(section)
+        if bounds is None:
+            return []
+        return [pair for pair in map(_split_key, self.lines[bounds[0] + 1:bounds[1]]) if pair]
+
+    def get(self, section, key, default=None):
+        """Return the effective (last) value of key in section"""
+        value = default
+        for item_key, item_value in self.items(section):
+            if item_key == key:
+                value = item_value
+        return value
+
+    def _key_lines(self, section, key):
+        bounds = self._section_range(section)
+        if bounds is None:
+            return None, []
+        matches = [i for i in range(bounds[0] + 1, bounds[1])
+                   if (_split_key(self.lines[i]) or (None,))[0] == key]
+        return bounds, matches
+
+    def ensure_section(self, section):
+        """Append an empty section if it does not exist yet"""
+        if self.has_section(section):
+            return
+        if self.lines and not _line_ending(self.lines[-1]):
+            self.lines[-1] += self.newline
+        if self.lines and self.lines[-1].strip():
+            self.lines.append(self.newline)
+        self.lines.append(f'[{section}]{self.newline}')
+        self.dirty = True
+
+    def set(self, section, key, value):
+        """Set key in section, editing the existing line in place when there is one"""
+        value = str(value)
+        bounds, matches = self._key_lines(section, key)
+        if matches:
+            first = matches[0]
+            line = self.lines[first]
+            new_line = f'{key}={value}{_line_ending(line) or self.newline}'
+            # Later duplicates would override the first one, drop them
+            changed = line != new_line or len(matches) > 1
+            if changed:
+                self.lines[first] = new_line
+                for i in reversed(matches[1:]):
+                    del self.lines[i]
+                self.dirty = True
+            return changed
+
+        if bounds is None:
+            self.ensure_section(section)
+            bounds = self._section_range(section)
+        # Insert after the last non-blank line of the section
+        insert_at = bounds[1]
+        while insert_at > bounds[0] + 1 and not self.lines[insert_at - 1].strip():
+            insert_at -= 1
+        if insert_at > 0 and not _line_ending(self.lines[insert_at - 1]):
+            self.lines[insert_at - 1] += self.newline
+        self.lines.insert(insert_at, f'{key}={value}{self.newline}')
+        self.dirty = True
+        return True
+
+    def remove(self, section, key):
+        """Remove every occurrence of key from section"""
+        _bounds, matches = self._key_lines(section, key)
+        for i in reversed(matches):
+            del self.lines[i]
+        if matches:
+            self.dirty = True
+        return bool(matches)
+
+    def save(self, force=False):
+        """Write the document atomically. Returns False when there was nothing to write."""
+        if not self.dirty and not force:
+            return False
+        directory = os.path.dirname(self.path) or '.'
+        temp_path = None
+        try:
+            # Unique name in the same folder, so two writers (another window, a script) never share it
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', dir=directory,
+                                             prefix=f'.{os.path.basename(self.path)}.', suffix='.tmp',
+                                             delete=False) as f:
+                temp_path = f.name
+                if self.bom:
+                    f.write('\ufeff')
+                f.writelines(self.lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        stat = os.stat(self.path)
+        _parse_cache[self.path] = (stat.st_mtime_ns, stat.st_size, tuple(self.lines), self.newline, self.bom)
+        self.dirty = False
+        return True
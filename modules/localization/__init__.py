@@ -1,3 +1,2 @@
 # modules/localization/__init__.py
-from .english import *
 from .language_manager import LanguageManager, get_current_localization 
\ No newline at end of file
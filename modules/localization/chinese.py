@@ -42,7 +42,10 @@ TITLES = {
     "success": "成功",
     "error": "错误",
     "warning": "警告",
-    "language_selection": "语言选择"
+    "language_selection": "语言选择",
+    "mods_analyzer": "模组分析",
+    "engine_changes": "Engine.ini 更改",
+    "diagnostics": "诊断"
 }
 
 # Button labels
@@ -61,7 +64,20 @@ BUTTONS = {
     "open_mod_directory": "打开模组目录",
     "remove_mouse_smoothing": "移除鼠标平滑",
     "re_enable_mouse_smoothing": "重新启用鼠标平滑",
-    "language": "语言"
+    "language": "语言",
+    "analyze_mods": "分析 ~mods",
+    "engine_show_changes": "显示更改",
+    "engine_apply": "应用",
+    "engine_revert": "还原",
+    "diagnostics": "诊断",
+    "copy_diagnostics": "复制诊断信息",
+    "undo": "撤销",
+    "redo": "重做",
+    "bulk_scale": "按 % 缩放",
+    "bulk_offset": "加上",
+    "bulk_clamp": "限制到范围内",
+    "bulk_reset": "重置标签页",
+    "watch_preset": "保存预设时重新构建"
 }
 
 # Form labels and text
@@ -82,7 +98,53 @@ LABELS = {
     "max_value": "最大值：{max}",
     "generated_by": "由 SCAM（潜行者角色调整管理器）v3fish 生成",
     "select_language": "选择语言：",
-    "language_restart_note": "语言将在重启应用程序后更改。"
+    "language_restart_note": "语言将在重启应用程序后更改。",
+    "mods_summary": "{count} 个 pak，{size} MB，{entries} 个文件",
+    "mods_column_order": "顺序",
+    "mods_column_pak": "Pak",
+    "mods_column_entries": "文件",
+    "mods_column_size": "字节",
+    "mods_column_notes": "备注",
+    "mods_overrides_scam": "在 SCAM 之后加载",
+    "mods_not_installed": "未安装",
+    "engine_tier": "预设：",
+    "engine_tier_low": "低（6 GB 显存）",
+    "engine_tier_medium": "中（8 GB 显存）",
+    "engine_tier_high": "高（12 GB 显存）",
+    "engine_tier_ultra": "极高（16+ GB 显存）",
+    "engine_ini_location": "Engine.ini：{path}",
+    "engine_ini_not_found": "未找到 Stalker 2 配置文件夹。请先运行一次游戏以创建它。",
+    "engine_current_value": "当前：{value}",
+    "engine_no_changes": "没有更改。",
+    "startup_timings": "启动耗时",
+    "startup_column_phase": "阶段",
+    "startup_column_start": "开始",
+    "startup_column_duration": "耗时",
+    "startup_column_widgets": "控件",
+    "startup_tracing_disabled": "启动跟踪已关闭。请使用 --trace-startup 或 SCAM_TRACE_STARTUP=1 启动 SCAM。",
+    "stall_events": "事件循环卡顿",
+    "stall_column_time": "时间",
+    "stall_column_duration": "持续时间",
+    "stall_column_callback": "阻塞的回调",
+    "stall_monitor_disabled": "卡顿监控已关闭。使用 --monitor-stalls 启动 SCAM 以记录卡顿。",
+    "bulk_amount": "整个标签页：",
+    "min_value": "最小值：{min}",
+    "watch_waiting": "正在监视 {preset}.ini",
+    "watch_installed": "模组已在 {ms} 毫秒内重新构建并安装",
+    "watch_unchanged": "预设已保存，模组文件未变化",
+    "watch_invalid": "未重新构建：{error}",
+    "watch_failed": "重新构建失败：{error}",
+    "engine_cvar_pool_size": "纹理流送池大小（MB），请与显存匹配",
+    "engine_cvar_limit_pool_to_vram": "不让流送池超过可用显存",
+    "engine_cvar_frames_for_full_update": "完整流送更新分摊的帧数",
+    "engine_cvar_pso_cache": "使用着色器管线（PSO）缓存",
+    "engine_cvar_pso_batch_size": "缓存预热时每帧编译的 PSO 数",
+    "engine_cvar_pso_background_batch_size": "后台每帧编译的 PSO 数",
+    "engine_cvar_async_loading_thread": "在独立线程中加载资源包",
+    "engine_cvar_components_registration": "关卡流送时每帧注册的组件数",
+    "engine_cvar_force_gc_after_streaming": "关卡流出后强制垃圾回收（会造成卡顿）",
+    "engine_cvar_incremental_gc_pending_purge": "关卡等待清除时运行增量垃圾回收",
+    "engine_config_dir_missing": "未找到 Stalker 2 配置文件夹 {path}。请先启动一次游戏以创建它。"
 }
 
 # Language names (in their native script)
@@ -116,7 +178,11 @@ SUCCESS_MESSAGES = {
     "mod_created_local": "模组已在当前文件夹中创建。",
     "mouse_settings_removed": "鼠标平滑设置已被移除",
     "mouse_settings_added": "鼠标平滑设置已被添加",
-    "language_changed": "语言已更改为 {language}。请重启应用程序。"
+    "language_changed": "语言已更改为 {language}。请重启应用程序。",
+    "overrides_merged": "已将 {count} 个原型覆盖打包到一个 pak 中（减少 {paks_saved} 个 pak，约节省 {bytes_saved} 字节）。",
+    "engine_settings_applied": "Engine.ini 设置已应用。",
+    "engine_settings_reverted": "Engine.ini 设置已还原。",
+    "diagnostics_copied": "诊断信息已复制到剪贴板。请将其粘贴到错误报告中。"
 }
 
 # Warning messages
@@ -128,7 +194,9 @@ WARNING_MESSAGES = {
 请在游戏前移除这些模组：
 {mod_list}
 
-祝您狩猎愉快，潜行者。"""
+祝您狩猎愉快，潜行者。""",
+    "engine_nothing_to_revert": "没有可还原的 SCAM Engine.ini 更改。",
+    "watch_select_preset": "请先选择要监视的已保存预设。"
 }
 
 # Error messages
@@ -162,7 +230,14 @@ Stalker Character Adjustment Manager.exe
     "value_cannot_be_empty": "{section} - {key}：不能为空",
     "value_exceeds_maximum": "{section} - {key}：值 {value} 超过最大值 {max}",
     "value_must_be_number": "{section} - {key}：必须是有效数字",
-    "invalid_value_for_key": "{key} 的值无效！"
+    "invalid_value_for_key": "{key} 的值无效！",
+    "pak_verification_failed": "已安装的模组未通过验证：{error}",
+    "failed_to_update_engine_ini": "更新 Engine.ini 失败：{error}",
+    "preset_file_not_found": "未找到预设文件：{path}",
+    "failed_to_load_preset": "加载预设失败：{error}",
+    "invalid_formula": "公式无效：{error}",
+    "invalid_bulk_amount": "请输入用于缩放（%）或相加的数字。",
+    "invalid_engine_value": "{cvar} 必须是数字，而不是“{value}”。"
 }
 
 # Confirmation messages
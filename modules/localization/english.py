@@ -42,7 +42,10 @@ TITLES = {
     "success": "Success",
     "error": "Error",
     "warning": "Warning",
-    "language_selection": "Language Selection"
+    "language_selection": "Language Selection",
+    "mods_analyzer": "Mods Analyzer",
+    "engine_changes": "Engine.ini Changes",
+    "diagnostics": "Diagnostics"
 }
 
 # Button labels
@@ -61,7 +64,20 @@ BUTTONS = {
     "open_mod_directory": "Open Mod Directory",
     "remove_mouse_smoothing": "Remove Mouse Smoothing",
     "re_enable_mouse_smoothing": "Re-Enable Mouse Smoothing",
-    "language": "Language"
+    "language": "Language",
+    "analyze_mods": "Analyze ~mods",
+    "engine_show_changes": "Show Changes",
+    "engine_apply": "Apply",
+    "engine_revert": "Revert",
+    "diagnostics": "Diagnostics",
+    "copy_diagnostics": "Copy Diagnostics",
+    "undo": "Undo",
+    "redo": "Redo",
+    "bulk_scale": "Scale %",
+    "bulk_offset": "Add",
+    "bulk_clamp": "Clamp to Limits",
+    "bulk_reset": "Reset Tab",
+    "watch_preset": "Rebuild on preset save"
 }
 
 # Form labels and text
@@ -82,7 +98,53 @@ LABELS = {
     "max_value": "Max: {max}",
     "generated_by": "Generated by SCAM (Stalker Character Adjustment Manager) by v3fish",
     "select_language": "Select Language:",
-    "language_restart_note": "Language will change after restarting the application."
+    "language_restart_note": "Language will change after restarting the application.",
+    "mods_summary": "{count} paks, {size} MB, {entries} files",
+    "mods_column_order": "Order",
+    "mods_column_pak": "Pak",
+    "mods_column_entries": "Files",
+    "mods_column_size": "Bytes",
+    "mods_column_notes": "Notes",
+    "mods_overrides_scam": "Loads after SCAM",
+    "mods_not_installed": "not installed",
+    "engine_tier": "Preset:",
+    "engine_tier_low": "Low (6 GB VRAM)",
+    "engine_tier_medium": "Medium (8 GB VRAM)",
+    "engine_tier_high": "High (12 GB VRAM)",
+    "engine_tier_ultra": "Ultra (16+ GB VRAM)",
+    "engine_ini_location": "Engine.ini: {path}",
+    "engine_ini_not_found": "Stalker 2 config folder not found. Start the game once to create it.",
+    "engine_current_value": "Current: {value}",
+    "engine_no_changes": "No changes.",
+    "startup_timings": "Startup timings",
+    "startup_column_phase": "Phase",
+    "startup_column_start": "Start",
+    "startup_column_duration": "Duration",
+    "startup_column_widgets": "Widgets",
+    "startup_tracing_disabled": "Startup tracing is off. Start SCAM with --trace-startup or SCAM_TRACE_STARTUP=1.",
+    "stall_events": "Event-loop stalls",
+    "stall_column_time": "Time",
+    "stall_column_duration": "Duration",
+    "stall_column_callback": "Blocking callback",
+    "stall_monitor_disabled": "Stall monitoring is off. Start SCAM with --monitor-stalls to record freezes.",
+    "bulk_amount": "Whole tab:",
+    "min_value": "Min: {min}",
+    "watch_waiting": "Watching {preset}.ini",
+    "watch_installed": "Mod rebuilt and installed in {ms} ms",
+    "watch_unchanged": "Preset saved, mod files unchanged",
+    "watch_invalid": "Not rebuilt: {error}",
+    "watch_failed": "Rebuild failed: {error}",
+    "engine_cvar_pool_size": "Texture streaming pool in MB, match it to your VRAM",
+    "engine_cvar_limit_pool_to_vram": "Never let the pool exceed available VRAM",
+    "engine_cvar_frames_for_full_update": "Frames to spread a full streaming update over",
+    "engine_cvar_pso_cache": "Use the shader pipeline (PSO) cache",
+    "engine_cvar_pso_batch_size": "PSOs compiled per frame while the cache is warming up",
+    "engine_cvar_pso_background_batch_size": "PSOs compiled per frame in the background",
+    "engine_cvar_async_loading_thread": "Load packages on a separate thread",
+    "engine_cvar_components_registration": "Components registered per frame while streaming levels",
+    "engine_cvar_force_gc_after_streaming": "Force a garbage collection hitch after a level streams out",
+    "engine_cvar_incremental_gc_pending_purge": "Run incremental GC while levels wait to be purged",
+    "engine_config_dir_missing": "Stalker 2 config folder {path} not found. Start the game once to create it."
 }
 
 # Language names (in their native script)
@@ -116,7 +178,11 @@ SUCCESS_MESSAGES = {
     "mod_created_local": "The mod has been created in the current folder.",
     "mouse_settings_removed": "Mouse smoothing settings have been removed",
     "mouse_settings_added": "Mouse smoothing settings have been added",
-    "language_changed": "Language changed to {language}. Please restart the application."
+    "language_changed": "Language changed to {language}. Please restart the application.",
+    "overrides_merged": "{count} prototype overrides were packed into one pak ({paks_saved} fewer paks, about {bytes_saved} bytes saved).",
+    "engine_settings_applied": "Engine.ini settings have been applied.",
+    "engine_settings_reverted": "Engine.ini settings have been reverted.",
+    "diagnostics_copied": "Diagnostics copied to the clipboard. Paste them into your bug report."
 }
 
 # Warning messages
@@ -128,7 +194,9 @@ WARNING_MESSAGES = {
 Please remove these mods before playing:
 {mod_list}
 
-Good hunting, Stalker."""
+Good hunting, Stalker.""",
+    "engine_nothing_to_revert": "There are no SCAM Engine.ini changes to revert.",
+    "watch_select_preset": "Select a saved preset to watch first."
 }
 
 # Error messages
@@ -162,7 +230,14 @@ Stalker Character Adjustment Manager.exe
     "value_cannot_be_empty": "{section} - {key}: Cannot be empty",
     "value_exceeds_maximum": "{section} - {key}: Value {value} exceeds maximum of {max}",
     "value_must_be_number": "{section} - {key}: Must be a valid number",
-    "invalid_value_for_key": "Invalid value for {key}!"
+    "invalid_value_for_key": "Invalid value for {key}!",
+    "pak_verification_failed": "The installed mod failed verification: {error}",
+    "failed_to_update_engine_ini": "Failed to update Engine.ini: {error}",
+    "preset_file_not_found": "Preset file not found: {path}",
+    "failed_to_load_preset": "Failed to load preset: {error}",
+    "invalid_formula": "Invalid formula: {error}",
+    "invalid_bulk_amount": "Enter a number to scale (in %) or add.",
+    "invalid_engine_value": "{cvar} must be a number, not '{value}'."
 }
 
 # Confirmation messages
@@ -42,7 +42,10 @@ TITLES = {
     "success": "성공",
     "error": "오류",
     "warning": "경고",
-    "language_selection": "언어 선택"
+    "language_selection": "언어 선택",
+    "mods_analyzer": "모드 분석",
+    "engine_changes": "Engine.ini 변경 사항",
+    "diagnostics": "진단"
 }
 
 # Button labels
@@ -61,7 +64,20 @@ BUTTONS = {
     "open_mod_directory": "모드 디렉터리 열기",
     "remove_mouse_smoothing": "마우스 스무딩 제거",
     "re_enable_mouse_smoothing": "마우스 스무딩 다시 활성화",
-    "language": "언어"
+    "language": "언어",
+    "analyze_mods": "~mods 분석",
+    "engine_show_changes": "변경 사항 보기",
+    "engine_apply": "적용",
+    "engine_revert": "되돌리기",
+    "diagnostics": "진단",
+    "copy_diagnostics": "진단 정보 복사",
+    "undo": "실행 취소",
+    "redo": "다시 실행",
+    "bulk_scale": "% 배율",
+    "bulk_offset": "더하기",
+    "bulk_clamp": "범위로 제한",
+    "bulk_reset": "탭 초기화",
+    "watch_preset": "프리셋 저장 시 다시 빌드"
 }
 
 # Form labels and text
@@ -82,7 +98,53 @@ LABELS = {
     "max_value": "최대: {max}",
     "generated_by": "SCAM (스토커 캐릭터 조정 관리자) v3fish 제작",
     "select_language": "언어 선택:",
-    "language_restart_note": "언어는 애플리케이션을 다시 시작한 후 변경됩니다."
+    "language_restart_note": "언어는 애플리케이션을 다시 시작한 후 변경됩니다.",
+    "mods_summary": "pak {count}개, {size} MB, 파일 {entries}개",
+    "mods_column_order": "순서",
+    "mods_column_pak": "Pak",
+    "mods_column_entries": "파일",
+    "mods_column_size": "바이트",
+    "mods_column_notes": "비고",
+    "mods_overrides_scam": "SCAM 이후 로드",
+    "mods_not_installed": "설치되지 않음",
+    "engine_tier": "프리셋:",
+    "engine_tier_low": "낮음 (6 GB VRAM)",
+    "engine_tier_medium": "중간 (8 GB VRAM)",
+    "engine_tier_high": "높음 (12 GB VRAM)",
+    "engine_tier_ultra": "울트라 (16+ GB VRAM)",
+    "engine_ini_location": "Engine.ini: {path}",
+    "engine_ini_not_found": "Stalker 2 설정 폴더를 찾을 수 없습니다. 게임을 한 번 실행하여 생성하세요.",
+    "engine_current_value": "현재: {value}",
+    "engine_no_changes": "변경 사항이 없습니다.",
+    "startup_timings": "시작 시간",
+    "startup_column_phase": "단계",
+    "startup_column_start": "시작",
+    "startup_column_duration": "소요 시간",
+    "startup_column_widgets": "위젯",
+    "startup_tracing_disabled": "시작 추적이 꺼져 있습니다. --trace-startup 또는 SCAM_TRACE_STARTUP=1로 SCAM을 실행하세요.",
+    "stall_events": "이벤트 루프 정지",
+    "stall_column_time": "시간",
+    "stall_column_duration": "지속 시간",
+    "stall_column_callback": "차단한 콜백",
+    "stall_monitor_disabled": "정지 모니터링이 꺼져 있습니다. 멈춤을 기록하려면 --monitor-stalls 옵션으로 SCAM을 시작하세요.",
+    "bulk_amount": "탭 전체:",
+    "min_value": "최소: {min}",
+    "watch_waiting": "{preset}.ini 감시 중",
+    "watch_installed": "모드를 {ms}ms 만에 다시 빌드하고 설치했습니다",
+    "watch_unchanged": "프리셋이 저장되었으나 모드 파일은 변경되지 않았습니다",
+    "watch_invalid": "다시 빌드하지 않음: {error}",
+    "watch_failed": "다시 빌드 실패: {error}",
+    "engine_cvar_pool_size": "텍스처 스트리밍 풀(MB), VRAM 용량에 맞추세요",
+    "engine_cvar_limit_pool_to_vram": "풀이 사용 가능한 VRAM을 넘지 않도록 제한",
+    "engine_cvar_frames_for_full_update": "전체 스트리밍 업데이트를 나눌 프레임 수",
+    "engine_cvar_pso_cache": "셰이더 파이프라인(PSO) 캐시 사용",
+    "engine_cvar_pso_batch_size": "캐시 예열 중 프레임당 컴파일할 PSO 수",
+    "engine_cvar_pso_background_batch_size": "백그라운드에서 프레임당 컴파일할 PSO 수",
+    "engine_cvar_async_loading_thread": "별도 스레드에서 패키지 로드",
+    "engine_cvar_components_registration": "레벨 스트리밍 중 프레임당 등록할 컴포넌트 수",
+    "engine_cvar_force_gc_after_streaming": "레벨 스트리밍 아웃 후 가비지 컬렉션 강제 실행(끊김 발생)",
+    "engine_cvar_incremental_gc_pending_purge": "레벨 정리 대기 중 증분 GC 실행",
+    "engine_config_dir_missing": "Stalker 2 설정 폴더 {path}을(를) 찾을 수 없습니다. 게임을 한 번 실행하여 생성하세요."
 }
 
 # Language names (in their native script)
@@ -116,7 +178,11 @@ SUCCESS_MESSAGES = {
     "mod_created_local": "모드가 현재 폴더에 생성되었습니다.",
     "mouse_settings_removed": "마우스 스무딩 설정이 제거되었습니다",
     "mouse_settings_added": "마우스 스무딩 설정이 추가되었습니다",
-    "language_changed": "언어가 {language}로 변경되었습니다. 애플리케이션을 다시 시작해주세요."
+    "language_changed": "언어가 {language}로 변경되었습니다. 애플리케이션을 다시 시작해주세요.",
+    "overrides_merged": "{count}개의 프로토타입 오버라이드를 하나의 pak으로 묶었습니다 (pak {paks_saved}개 감소, 약 {bytes_saved}바이트 절약).",
+    "engine_settings_applied": "Engine.ini 설정이 적용되었습니다.",
+    "engine_settings_reverted": "Engine.ini 설정이 복원되었습니다.",
+    "diagnostics_copied": "진단 정보가 클립보드에 복사되었습니다. 버그 보고서에 붙여넣으세요."
 }
 
 # Warning messages
@@ -128,7 +194,9 @@ WARNING_MESSAGES = {
 게임을 플레이하기 전에 이 모드들을 제거해주세요:
 {mod_list}
 
-좋은 사냥 되세요, 스토커."""
+좋은 사냥 되세요, 스토커.""",
+    "engine_nothing_to_revert": "되돌릴 SCAM Engine.ini 변경 사항이 없습니다.",
+    "watch_select_preset": "먼저 감시할 저장된 프리셋을 선택하세요."
 }
 
 # Error messages
@@ -162,7 +230,14 @@ Stalker Character Adjustment Manager.exe
     "value_cannot_be_empty": "{section} - {key}: 비어있을 수 없습니다",
     "value_exceeds_maximum": "{section} - {key}: 값 {value}가 최대값 {max}를 초과합니다",
     "value_must_be_number": "{section} - {key}: 유효한 숫자여야 합니다",
-    "invalid_value_for_key": "{key}에 대한 잘못된 값입니다!"
+    "invalid_value_for_key": "{key}에 대한 잘못된 값입니다!",
+    "pak_verification_failed": "설치된 모드 검증에 실패했습니다: {error}",
+    "failed_to_update_engine_ini": "Engine.ini 업데이트 실패: {error}",
+    "preset_file_not_found": "프리셋 파일을 찾을 수 없습니다: {path}",
+    "failed_to_load_preset": "프리셋을 불러오지 못했습니다: {error}",
+    "invalid_formula": "잘못된 수식: {error}",
+    "invalid_bulk_amount": "배율(%) 또는 더할 숫자를 입력하세요.",
+    "invalid_engine_value": "{cvar} 값은 숫자여야 합니다: '{value}'"
 }
 
 # Confirmation messages
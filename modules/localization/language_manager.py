@@ -6,12 +6,21 @@ Handles language selection, switching, and provides centralized access to locali
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import importlib
 import json
 import os
+from ..timing import startup_spans
+from ..diagnostics_log import diagnostics_log
+from .manifest import LANGUAGE_MANIFEST
 
 # Global variable to store current localization
 _current_localization = None
 
+LOCALIZATION_DIR = os.path.dirname(__file__)
+MANIFEST_FILE = os.path.join(LOCALIZATION_DIR, 'manifest.py')
+# Files in the localization folder that are not language catalogs
+NON_LANGUAGE_FILES = {'__init__.py', 'language_manager.py', 'manifest.py'}
+
 def get_data_folder_name():
     """Get the data folder name without circular imports"""
     try:
@@ -31,7 +40,8 @@ class LanguageManager:
         self.user_data_path = user_data_path if user_data_path is not None else base_path
         self.preferences_file = os.path.join(self.user_data_path, 'app_preferences.json')
         self.current_language = self.load_saved_language()
-        self.available_languages = self.discover_languages()
+        with startup_spans.span('LanguageManager.discover_languages'):
+            self.available_languages = self.discover_languages()
         self.load_language(self.current_language)
 
     def load_saved_language(self):
@@ -41,30 +51,24 @@ class LanguageManager:
                 with open(self.preferences_file, 'r') as f:
                     prefs = json.load(f)
                     return prefs.get('language', 'en')
-        except:
-            pass
+        except Exception as e:
+            diagnostics_log.warning('language.load_saved_failed', path=self.preferences_file, error=str(e))
         return 'en'
 
     def discover_languages(self):
-        """Discover available language files"""
+        """Discover available languages from the manifest, without importing their catalogs"""
         languages = {'en': 'English'}  # Always have English as default
+        languages.update((code, info['name']) for code, info in LANGUAGE_MANIFEST.items())
         
+        # Language files added after the manifest was generated are still offered and loaded when selected
         try:
-            import os
-            localization_dir = os.path.dirname(__file__)
-            for filename in os.listdir(localization_dir):
-                if filename.endswith('.py') and filename not in ['__init__.py', 'language_manager.py', 'english.py']:
-                    lang_code = filename[:-3]  # Remove .py extension
-                    try:
-                        lang_module = __import__(f'modules.localization.{lang_code}', fromlist=[lang_code])
-                        if hasattr(lang_module, 'LANGUAGES') and lang_code in lang_module.LANGUAGES:
-                            languages[lang_code] = lang_module.LANGUAGES[lang_code]
-                        else:
-                            languages[lang_code] = lang_code.capitalize()
-                    except ImportError:
-                        pass
-        except:
-            pass
+            for filename in os.listdir(LOCALIZATION_DIR):
+                lang_code = filename[:-3]  # Remove .py extension
+                if (filename.endswith('.py') and filename not in NON_LANGUAGE_FILES
+                        and lang_code != 'english' and lang_code not in languages):
+                    languages[lang_code] = lang_code.capitalize()
+        except OSError as e:
+            diagnostics_log.warning('language.discover_failed', error=str(e))
         
         return languages
 
@@ -80,8 +84,8 @@ class LanguageManager:
             
             with open(self.preferences_file, 'w', encoding='utf-8') as f:
                 json.dump(prefs, f, indent=2)
-        except:
-            pass
+        except Exception as e:
+            diagnostics_log.error('language.save_preference_failed', path=self.preferences_file, error=str(e))
 
     def load_language(self, language_code):
         """Load a specific language"""
@@ -95,11 +99,20 @@ class LanguageManager:
             # Try to import other language files if they exist
             try:
                 lang_module = __import__(f'modules.localization.{language_code}', fromlist=[language_code])
-            except ImportError:
+            except ImportError as e:
+                diagnostics_log.warning('language.import_failed', language=language_code, error=str(e))
                 from . import english as lang_module  # Fallback to English
 
         _current_localization = Localization(lang_module)
 
+    def get_font_family(self, language_code=None):
+        """Default font family of a language (the current one by default), read from the manifest"""
+        info = LANGUAGE_MANIFEST.get(language_code or self.current_language)
+        if info:
+            return info['font']
+        # Added after the manifest was generated
+        return get_current_localization().get_font('default')[0]
+
     def get_available_languages(self):
         """Get list of available languages"""
         return self.available_languages
@@ -117,6 +130,37 @@ class LanguageManager:
         dialog = LanguageSelectionDialog(parent, self, refresh_callback)
         return dialog.result
 
+def build_language_manifest():
+    """Import every language catalog and return {code: {'name': display name, 'font': font family}}"""
+    manifest = {}
+    for filename in sorted(os.listdir(LOCALIZATION_DIR)):
+        if not filename.endswith('.py') or filename in NON_LANGUAGE_FILES:
+            continue
+        module_name = filename[:-3]
+        lang_module = importlib.import_module(f'{__package__}.{module_name}')
+        lang_code = 'en' if module_name == 'english' else module_name
+        name = getattr(lang_module, 'LANGUAGES', {}).get(module_name, module_name.capitalize())
+        fonts = getattr(lang_module, 'FONTS', {})
+        manifest[lang_code] = {'name': name, 'font': fonts.get('default', ('Arial', 9))[0]}
+    # English first, as in the language dialog
+    return dict(sorted(manifest.items(), key=lambda item: item[0] != 'en'))
+
+def write_language_manifest(path=MANIFEST_FILE):
+    """Regenerate manifest.py from the language catalogs"""
+    lines = [
+        '# modules/localization/manifest.py',
+        '# Generated by build_language_manifest() from the language catalogs, do not edit by hand.',
+        '# Regenerate with: "Stalker Character Adjustment Manager.py" build-language-manifest',
+        '',
+        '# Language code -> display name and default font family',
+        'LANGUAGE_MANIFEST = {',
+    ]
+    lines.extend(f'    {code!r}: {info!r},' for code, info in build_language_manifest().items())
+    lines.append('}')
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lines) + '\n')
+    return path
+
 class LanguageSelectionDialog(tk.Toplevel):
     """
     Dialog for selecting application language
@@ -145,8 +189,9 @@ class LanguageSelectionDialog(tk.Toplevel):
             icon_path = os.path.join(base_path, 'ico', 'icon2.ico')
             if os.path.exists(icon_path):
                 self.iconbitmap(icon_path)
-        except Exception:
-            pass  # If icon setting fails, continue without it
+        except Exception as e:
+            # If icon setting fails, continue without it
+            diagnostics_log.debug('language_dialog.icon_failed', error=str(e))
         
         # Center the window
         self.update_idletasks()
@@ -234,10 +279,34 @@ class LanguageSelectionDialog(tk.Toplevel):
         """Handle Cancel button"""
         self.destroy()
 
+# get_text() categories and the catalog dict behind each
+TEXT_CATEGORIES = {
+    'title': 'TITLES',
+    'button': 'BUTTONS',
+    'label': 'LABELS',
+    'language': 'LANGUAGES',
+    'preset': 'PRESETS',
+    'section': 'SECTIONS',
+    'success': 'SUCCESS_MESSAGES',
+    'warning': 'WARNING_MESSAGES',
+    'error': 'ERROR_MESSAGES',
+    'confirmation': 'CONFIRMATIONS',
+    'instruction': 'INSTRUCTIONS',
+    'status': 'STATUS'
+}
+# Categories whose strings are format templates ({data_folder} is always available)
+FORMATTED_CATEGORIES = {'label', 'success', 'warning', 'error', 'confirmation', 'instruction', 'status'}
+# Order in which t() looks a key up
+T_CATEGORIES = ('button', 'label', 'title')
+
 class Localization:
     """
     Localization class to manage all text strings.
     
+    The catalog is flattened once into a (category, key) -> template table; strings
+    without placeholders are stored as plain text and results of calls without
+    arguments are cached. A new instance is created by load_language, which resets both.
+    
     Usage:
         loc = Localization(language_module)
         title = loc.get_app_title("1.0.0")
@@ -246,6 +315,45 @@ class Localization:
     
     def __init__(self, language_module):
         self.lang = language_module
+        self.data_folder = get_data_folder_name()
+        self._templates = {}
+        self._cache = {}
+        for category, attribute in TEXT_CATEGORIES.items():
+            formatted = category in FORMATTED_CATEGORIES
+            for key, text in getattr(language_module, attribute, {}).items():
+                # Only strings with braces need str.format (which also unescapes {{ and }})
+                self._templates[category, key] = text.format if formatted and ('{' in text or '}' in text) else text
+        # What t() resolves each key to, first category match wins: the text itself
+        # for buttons and titles, None for labels which may need formatting
+        self._t_table = {}
+        for category in reversed(T_CATEGORIES):
+            for key, text in getattr(language_module, TEXT_CATEGORIES[category], {}).items():
+                self._t_table[key] = None if category == 'label' else text
+        
+    def get_text(self, category, key, **kwargs):
+        """Get text of any category, formatting templates with kwargs"""
+        cacheable = not kwargs
+        if cacheable:
+            try:
+                return self._cache[category, key]
+            except KeyError:
+                pass
+        template = self._templates.get((category, key), key)
+        if isinstance(template, str):
+            text = template
+        else:
+            kwargs['data_folder'] = self.data_folder
+            text = template(**kwargs)
+        if cacheable:
+            self._cache[category, key] = text
+        return text
+        
+    def t(self, key, **kwargs):
+        """Look a key up as button, then label, then title"""
+        text = self._t_table.get(key, key)
+        if text is None:
+            return self.get_text('label', key, **kwargs)
+        return text
         
     def get_app_title(self, version):
         """Get the application title with version - hardcoded in English"""
@@ -257,65 +365,51 @@ class Localization:
         
     def get_title(self, key):
         """Get a window/dialog title"""
-        return self.lang.TITLES.get(key, key)
+        return self.get_text('title', key)
         
     def get_button(self, key):
         """Get a button label"""
-        return self.lang.BUTTONS.get(key, key)
+        return self.get_text('button', key)
         
     def get_label(self, key, **kwargs):
         """Get a form label with optional formatting"""
-        text = self.lang.LABELS.get(key, key)
-        kwargs['data_folder'] = get_data_folder_name()
-        return text.format(**kwargs) if kwargs else text
+        return self.get_text('label', key, **kwargs)
         
     def get_language(self, key):
         """Get a language name"""
-        return self.lang.LANGUAGES.get(key, key)
+        return self.get_text('language', key)
         
     def get_preset(self, key):
         """Get a preset name"""
-        return self.lang.PRESETS.get(key, key)
+        return self.get_text('preset', key)
         
     def get_section(self, key):
         """Get a section/tab name"""
-        return self.lang.SECTIONS.get(key, key)
+        return self.get_text('section', key)
         
     def get_success(self, key, **kwargs):
         """Get a success message with optional formatting"""
-        text = self.lang.SUCCESS_MESSAGES.get(key, key)
-        kwargs['data_folder'] = get_data_folder_name()
-        return text.format(**kwargs) if kwargs else text
+        return self.get_text('success', key, **kwargs)
         
     def get_warning(self, key, **kwargs):
         """Get a warning message with optional formatting"""
-        text = self.lang.WARNING_MESSAGES.get(key, key)
-        kwargs['data_folder'] = get_data_folder_name()
-        return text.format(**kwargs) if kwargs else text
+        return self.get_text('warning', key, **kwargs)
         
     def get_error(self, key, **kwargs):
         """Get an error message with optional formatting"""
-        text = self.lang.ERROR_MESSAGES.get(key, key)
-        kwargs['data_folder'] = get_data_folder_name()
-        return text.format(**kwargs) if kwargs else text
+        return self.get_text('error', key, **kwargs)
         
     def get_confirmation(self, key, **kwargs):
         """Get a confirmation message with optional formatting"""
-        text = self.lang.CONFIRMATIONS.get(key, key)
-        kwargs['data_folder'] = get_data_folder_name()
-        return text.format(**kwargs) if kwargs else text
+        return self.get_text('confirmation', key, **kwargs)
         
     def get_instruction(self, key, **kwargs):
         """Get an instruction text with optional formatting"""
-        text = self.lang.INSTRUCTIONS.get(key, key)
-        kwargs['data_folder'] = get_data_folder_name()
-        return text.format(**kwargs) if kwargs else text
+        return self.get_text('instruction', key, **kwargs)
         
     def get_status(self, key, **kwargs):
         """Get a status message with optional formatting"""
-        text = self.lang.STATUS.get(key, key)
-        kwargs['data_folder'] = get_data_folder_name()
-        return text.format(**kwargs) if kwargs else text
+        return self.get_text('status', key, **kwargs)
         
     def get_font(self, key):
         """Get a font configuration"""
@@ -344,38 +438,14 @@ def get_text(category, key, **kwargs):
         key: The text key
         **kwargs: Format arguments
     """
-    loc = get_current_localization()
-    method_map = {
-        'title': loc.get_title,
-        'button': loc.get_button,
-        'label': loc.get_label,
-        'language': loc.get_language,
-        'preset': loc.get_preset,
-        'section': loc.get_section,
-        'success': loc.get_success,
-        'warning': loc.get_warning,
-        'error': loc.get_error,
-        'confirmation': loc.get_confirmation,
-        'instruction': loc.get_instruction,
-        'status': loc.get_status
-    }
-    
-    method = method_map.get(category)
-    if method:
-        return method(key, **kwargs)
+    if category in TEXT_CATEGORIES:
+        return get_current_localization().get_text(category, key, **kwargs)
     return key
 
 # Direct access functions for most common use cases
 def t(key, **kwargs):
     """Quick access function for common text (tries button, then label, then title)"""
-    loc = get_current_localization()
-    if hasattr(loc.lang, 'BUTTONS') and key in loc.lang.BUTTONS:
-        return loc.get_button(key)
-    elif hasattr(loc.lang, 'LABELS') and key in loc.lang.LABELS:
-        return loc.get_label(key, **kwargs)
-    elif hasattr(loc.lang, 'TITLES') and key in loc.lang.TITLES:
-        return loc.get_title(key)
-    return key
+    return get_current_localization().t(key, **kwargs)
 
 def error(key, **kwargs):
     """Quick access for error messages"""
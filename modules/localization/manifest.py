@@ -0,0 +1,12 @@
+# modules/localization/manifest.py
+# Generated by build_language_manifest() from the language catalogs, do not edit by hand.
+# Regenerate with: "Stalker Character Adjustment Manager.py" build-language-manifest
+
+# Language code -> display name and default font family
+LANGUAGE_MANIFEST = {
+    'en': {'name': 'English', 'font': 'Arial'},
+    'chinese': {'name': '简体中文', 'font': 'Microsoft YaHei'},
+    'korean': {'name': '한국어', 'font': 'Malgun Gothic'},
+    'russian': {'name': 'Русский', 'font': 'Segoe UI'},
+    'ukrainian': {'name': 'Українська', 'font': 'Segoe UI'},
+}
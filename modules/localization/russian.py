@@ -42,7 +42,10 @@ TITLES = {
     "success": "Успех",
     "error": "Ошибка",
     "warning": "Предупреждение",
-    "language_selection": "Выбор языка"
+    "language_selection": "Выбор языка",
+    "mods_analyzer": "Анализ модов",
+    "engine_changes": "Изменения Engine.ini",
+    "diagnostics": "Диагностика"
 }
 
 # Button labels
@@ -61,7 +64,20 @@ BUTTONS = {
     "open_mod_directory": "Открыть папку мода",
     "remove_mouse_smoothing": "Убрать сглаживание мыши",
     "re_enable_mouse_smoothing": "Включить сглаживание мыши",
-    "language": "Язык"
+    "language": "Язык",
+    "analyze_mods": "Анализ ~mods",
+    "engine_show_changes": "Показать изменения",
+    "engine_apply": "Применить",
+    "engine_revert": "Откатить",
+    "diagnostics": "Диагностика",
+    "copy_diagnostics": "Копировать диагностику",
+    "undo": "Отменить",
+    "redo": "Повторить",
+    "bulk_scale": "Изменить на %",
+    "bulk_offset": "Прибавить",
+    "bulk_clamp": "Ограничить пределами",
+    "bulk_reset": "Сбросить вкладку",
+    "watch_preset": "Пересобирать при сохранении пресета"
 }
 
 # Form labels and text
@@ -82,7 +98,53 @@ LABELS = {
     "max_value": "Макс: {max}",
     "generated_by": "Создано SCAM (Stalker Character Adjustment Manager) от v3fish",
     "select_language": "Выберите язык:",
-    "language_restart_note": "Язык изменится после перезапуска приложения."
+    "language_restart_note": "Язык изменится после перезапуска приложения.",
+    "mods_summary": "{count} pak-файлов, {size} МБ, {entries} файлов",
+    "mods_column_order": "Порядок",
+    "mods_column_pak": "Pak",
+    "mods_column_entries": "Файлы",
+    "mods_column_size": "Байт",
+    "mods_column_notes": "Примечания",
+    "mods_overrides_scam": "Загружается после SCAM",
+    "mods_not_installed": "не установлен",
+    "engine_tier": "Пресет:",
+    "engine_tier_low": "Низкий (6 ГБ VRAM)",
+    "engine_tier_medium": "Средний (8 ГБ VRAM)",
+    "engine_tier_high": "Высокий (12 ГБ VRAM)",
+    "engine_tier_ultra": "Ультра (16+ ГБ VRAM)",
+    "engine_ini_location": "Engine.ini: {path}",
+    "engine_ini_not_found": "Папка настроек Stalker 2 не найдена. Запустите игру один раз, чтобы создать её.",
+    "engine_current_value": "Сейчас: {value}",
+    "engine_no_changes": "Изменений нет.",
+    "startup_timings": "Время запуска",
+    "startup_column_phase": "Этап",
+    "startup_column_start": "Начало",
+    "startup_column_duration": "Длительность",
+    "startup_column_widgets": "Виджеты",
+    "startup_tracing_disabled": "Трассировка запуска выключена. Запустите SCAM с --trace-startup или SCAM_TRACE_STARTUP=1.",
+    "stall_events": "Зависания цикла событий",
+    "stall_column_time": "Время",
+    "stall_column_duration": "Длительность",
+    "stall_column_callback": "Блокирующий обработчик",
+    "stall_monitor_disabled": "Отслеживание зависаний выключено. Запустите SCAM с --monitor-stalls, чтобы записывать зависания.",
+    "bulk_amount": "Вся вкладка:",
+    "min_value": "Мин: {min}",
+    "watch_waiting": "Отслеживается {preset}.ini",
+    "watch_installed": "Мод пересобран и установлен за {ms} мс",
+    "watch_unchanged": "Пресет сохранён, файлы мода не изменились",
+    "watch_invalid": "Не пересобран: {error}",
+    "watch_failed": "Ошибка пересборки: {error}",
+    "engine_cvar_pool_size": "Пул стриминга текстур в МБ, подберите под объём видеопамяти",
+    "engine_cvar_limit_pool_to_vram": "Не давать пулу превышать доступную видеопамять",
+    "engine_cvar_frames_for_full_update": "На сколько кадров растягивать полное обновление стриминга",
+    "engine_cvar_pso_cache": "Использовать кэш шейдерных конвейеров (PSO)",
+    "engine_cvar_pso_batch_size": "PSO, компилируемых за кадр при прогреве кэша",
+    "engine_cvar_pso_background_batch_size": "PSO, компилируемых за кадр в фоне",
+    "engine_cvar_async_loading_thread": "Загружать пакеты в отдельном потоке",
+    "engine_cvar_components_registration": "Компонентов, регистрируемых за кадр при стриминге уровней",
+    "engine_cvar_force_gc_after_streaming": "Принудительная сборка мусора (с подвисанием) после выгрузки уровня",
+    "engine_cvar_incremental_gc_pending_purge": "Инкрементальная сборка мусора, пока уровни ждут очистки",
+    "engine_config_dir_missing": "Папка настроек Stalker 2 {path} не найдена. Запустите игру один раз, чтобы она появилась."
 }
 
 # Language names (in their native script)
@@ -116,7 +178,11 @@ SUCCESS_MESSAGES = {
     "mod_created_local": "Мод был создан в текущей папке.",
     "mouse_settings_removed": "Настройки сглаживания мыши были удалены",
     "mouse_settings_added": "Настройки сглаживания мыши были добавлены",
-    "language_changed": "Язык изменен на {language}. Пожалуйста, перезапустите приложение."
+    "language_changed": "Язык изменен на {language}. Пожалуйста, перезапустите приложение.",
+    "overrides_merged": "{count} переопределений прототипов упаковано в один pak (на {paks_saved} pak меньше, сэкономлено около {bytes_saved} байт).",
+    "engine_settings_applied": "Настройки Engine.ini применены.",
+    "engine_settings_reverted": "Настройки Engine.ini восстановлены.",
+    "diagnostics_copied": "Диагностика скопирована в буфер обмена. Вставьте её в отчёт об ошибке."
 }
 
 # Warning messages
@@ -128,7 +194,9 @@ WARNING_MESSAGES = {
 Пожалуйста, удалите эти моды перед игрой:
 {mod_list}
 
-Удачной охоты, Сталкер."""
+Удачной охоты, Сталкер.""",
+    "engine_nothing_to_revert": "Нет изменений Engine.ini от SCAM для отката.",
+    "watch_select_preset": "Сначала выберите сохранённый пресет для отслеживания."
 }
 
 # Error messages
@@ -162,7 +230,14 @@ Stalker Character Adjustment Manager.exe
     "value_cannot_be_empty": "{section} - {key}: Не может быть пустым",
     "value_exceeds_maximum": "{section} - {key}: Значение {value} превышает максимум {max}",
     "value_must_be_number": "{section} - {key}: Должно быть действительным числом",
-    "invalid_value_for_key": "Неверное значение для {key}!"
+    "invalid_value_for_key": "Неверное значение для {key}!",
+    "pak_verification_failed": "Установленный мод не прошёл проверку: {error}",
+    "failed_to_update_engine_ini": "Не удалось обновить Engine.ini: {error}",
+    "preset_file_not_found": "Файл пресета не найден: {path}",
+    "failed_to_load_preset": "Не удалось загрузить пресет: {error}",
+    "invalid_formula": "Неверная формула: {error}",
+    "invalid_bulk_amount": "Введите число для изменения (в %) или прибавления.",
+    "invalid_engine_value": "{cvar} должно быть числом, а не «{value}»."
 }
 
 # Confirmation messages
@@ -42,7 +42,10 @@ TITLES = {
     "success": "Успіх",
     "error": "Помилка",
     "warning": "Попередження",
-    "language_selection": "Вибір мови"
+    "language_selection": "Вибір мови",
+    "mods_analyzer": "Аналіз модів",
+    "engine_changes": "Зміни Engine.ini",
+    "diagnostics": "Діагностика"
 }
 
 # Button labels
@@ -61,7 +64,20 @@ BUTTONS = {
     "open_mod_directory": "Відкрити папку мода",
     "remove_mouse_smoothing": "Видалити згладжування миші",
     "re_enable_mouse_smoothing": "Увімкнути згладжування миші",
-    "language": "Мова"
+    "language": "Мова",
+    "analyze_mods": "Аналіз ~mods",
+    "engine_show_changes": "Показати зміни",
+    "engine_apply": "Застосувати",
+    "engine_revert": "Відкотити",
+    "diagnostics": "Діагностика",
+    "copy_diagnostics": "Копіювати діагностику",
+    "undo": "Скасувати",
+    "redo": "Повторити",
+    "bulk_scale": "Змінити на %",
+    "bulk_offset": "Додати",
+    "bulk_clamp": "Обмежити межами",
+    "bulk_reset": "Скинути вкладку",
+    "watch_preset": "Перезбирати при збереженні пресету"
 }
 
 # Form labels and text
@@ -82,7 +98,53 @@ LABELS = {
     "max_value": "Макс: {max}",
     "generated_by": "Створено SCAM (Stalker Character Adjustment Manager) від v3fish",
     "select_language": "Оберіть мову:",
-    "language_restart_note": "Мова зміниться після перезапуску програми."
+    "language_restart_note": "Мова зміниться після перезапуску програми.",
+    "mods_summary": "{count} pak-файлів, {size} МБ, {entries} файлів",
+    "mods_column_order": "Порядок",
+    "mods_column_pak": "Pak",
+    "mods_column_entries": "Файли",
+    "mods_column_size": "Байт",
+    "mods_column_notes": "Примітки",
+    "mods_overrides_scam": "Завантажується після SCAM",
+    "mods_not_installed": "не встановлено",
+    "engine_tier": "Пресет:",
+    "engine_tier_low": "Низький (6 ГБ VRAM)",
+    "engine_tier_medium": "Середній (8 ГБ VRAM)",
+    "engine_tier_high": "Високий (12 ГБ VRAM)",
+    "engine_tier_ultra": "Ультра (16+ ГБ VRAM)",
+    "engine_ini_location": "Engine.ini: {path}",
+    "engine_ini_not_found": "Папку налаштувань Stalker 2 не знайдено. Запустіть гру один раз, щоб її створити.",
+    "engine_current_value": "Зараз: {value}",
+    "engine_no_changes": "Змін немає.",
+    "startup_timings": "Час запуску",
+    "startup_column_phase": "Етап",
+    "startup_column_start": "Початок",
+    "startup_column_duration": "Тривалість",
+    "startup_column_widgets": "Віджети",
+    "startup_tracing_disabled": "Трасування запуску вимкнено. Запустіть SCAM з --trace-startup або SCAM_TRACE_STARTUP=1.",
+    "stall_events": "Зависання циклу подій",
+    "stall_column_time": "Час",
+    "stall_column_duration": "Тривалість",
+    "stall_column_callback": "Блокуючий обробник",
+    "stall_monitor_disabled": "Відстеження зависань вимкнено. Запустіть SCAM з --monitor-stalls, щоб записувати зависання.",
+    "bulk_amount": "Уся вкладка:",
+    "min_value": "Мін: {min}",
+    "watch_waiting": "Відстежується {preset}.ini",
+    "watch_installed": "Мод перезібрано та встановлено за {ms} мс",
+    "watch_unchanged": "Пресет збережено, файли мода не змінилися",
+    "watch_invalid": "Не перезібрано: {error}",
+    "watch_failed": "Помилка перезбирання: {error}",
+    "engine_cvar_pool_size": "Пул стримінгу текстур у МБ, підберіть під обсяг відеопам'яті",
+    "engine_cvar_limit_pool_to_vram": "Не дозволяти пулу перевищувати доступну відеопам'ять",
+    "engine_cvar_frames_for_full_update": "На скільки кадрів розподіляти повне оновлення стримінгу",
+    "engine_cvar_pso_cache": "Використовувати кеш шейдерних конвеєрів (PSO)",
+    "engine_cvar_pso_batch_size": "PSO, що компілюються за кадр під час прогріву кешу",
+    "engine_cvar_pso_background_batch_size": "PSO, що компілюються за кадр у фоні",
+    "engine_cvar_async_loading_thread": "Завантажувати пакети в окремому потоці",
+    "engine_cvar_components_registration": "Компонентів, що реєструються за кадр під час стримінгу рівнів",
+    "engine_cvar_force_gc_after_streaming": "Примусове збирання сміття (з підвисанням) після вивантаження рівня",
+    "engine_cvar_incremental_gc_pending_purge": "Інкрементальне збирання сміття, поки рівні чекають очищення",
+    "engine_config_dir_missing": "Теку налаштувань Stalker 2 {path} не знайдено. Запустіть гру один раз, щоб вона з'явилася."
 }
 
 # Language names (in their native script)
@@ -116,7 +178,11 @@ SUCCESS_MESSAGES = {
     "mod_created_local": "Мод було створено в поточній папці.",
     "mouse_settings_removed": "Налаштування згладжування миші видалено",
     "mouse_settings_added": "Налаштування згладжування миші додано",
-    "language_changed": "Мову змінено на {language}. Будь ласка, перезапустіть програму."
+    "language_changed": "Мову змінено на {language}. Будь ласка, перезапустіть програму.",
+    "overrides_merged": "{count} перевизначень прототипів упаковано в один pak (на {paks_saved} pak менше, заощаджено близько {bytes_saved} байт).",
+    "engine_settings_applied": "Налаштування Engine.ini застосовано.",
+    "engine_settings_reverted": "Налаштування Engine.ini відновлено.",
+    "diagnostics_copied": "Діагностику скопійовано в буфер обміну. Вставте її у звіт про помилку."
 }
 
 # Warning messages
@@ -128,7 +194,9 @@ WARNING_MESSAGES = {
 Будь ласка, видаліть ці моди перед грою:
 {mod_list}
 
-Вдалого полювання, Сталкере."""
+Вдалого полювання, Сталкере.""",
+    "engine_nothing_to_revert": "Немає змін Engine.ini від SCAM для відкату.",
+    "watch_select_preset": "Спочатку виберіть збережений пресет для відстеження."
 }
 
 # Error messages
@@ -162,7 +230,14 @@ Stalker Character Adjustment Manager.exe
     "value_cannot_be_empty": "{section} - {key}: Не може бути порожнім",
     "value_exceeds_maximum": "{section} - {key}: Значення {value} перевищує максимум {max}",
     "value_must_be_number": "{section} - {key}: Повинно бути дійсним числом",
-    "invalid_value_for_key": "Неправильне значення для {key}!"
+    "invalid_value_for_key": "Неправильне значення для {key}!",
+    "pak_verification_failed": "Встановлений мод не пройшов перевірку: {error}",
+    "failed_to_update_engine_ini": "Не вдалося оновити Engine.ini: {error}",
+    "preset_file_not_found": "Файл пресету не знайдено: {path}",
+    "failed_to_load_preset": "Не вдалося завантажити пресет: {error}",
+    "invalid_formula": "Неправильна формула: {error}",
+    "invalid_bulk_amount": "Введіть число для зміни (у %) або додавання.",
+    "invalid_engine_value": "{cvar} має бути числом, а не «{value}»."
 }
 
 # Confirmation messages
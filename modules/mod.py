@@ -6,15 +6,29 @@ Licensed under MIT License and Apache License 2.0
 import os
 import subprocess
 import shutil
+import tempfile
 from pathlib import Path
 import sys
 import json
 from tkinter import messagebox
-from .config import DATA_FOLDER_NAME
+from .config import DATA_FOLDER_NAME, check_prototype_refkey
+from .formulas import FORMULAS_SECTION
+from .pak import PakError, PakReader
+from .timing import SpanRecorder
+
+# Location of the generated prototype overrides inside the mod folder / pak
+PROTOTYPES_PATH = ('Stalker2', 'Content', 'GameLite', 'GameData', 'ObjPrototypes')
+
+# Pak name fragments of mods known to conflict with SCAM
+INCOMPATIBLE_KEYWORDS = ['FluidMovementAim', 'FMAO']
 
 class ModCreator:
-    def __init__(self, base_path):
+    def __init__(self, base_path, packer_command=None, interactive=True):
         self.base_path = base_path
+        # Command used instead of repak.exe, run as packer_command + ['pack', <mod folder>]
+        self.packer_command = packer_command
+        # Without a UI (CLI, benchmarks) no progress window or warning dialogs are shown
+        self.interactive = interactive
         if getattr(sys, 'frozen', False):
             self.exe_dir = os.path.dirname(sys.executable)
         else:
@@ -69,51 +83,67 @@ class ModCreator:
                     pak_files.append(os.path.join(root, file))
         return pak_files
 
-    def check_incompatible_mods(self, mods_path):
-        """Check for incompatible mods in the mods directory and its subdirectories"""
-        if not os.path.exists(mods_path):
-            return
-            
-        incompatible_keywords = ['FluidMovementAim', 'FMAO']
+    def find_incompatible_mods(self, mods_path, pak_files=None):
+        """Return the file names of known incompatible mods in the mods directory"""
+        if pak_files is None:
+            if not os.path.exists(mods_path):
+                return []
+            pak_files = self.find_pak_files(mods_path)
         found_mods = []
-        
-        pak_files = self.find_pak_files(mods_path)
         for file_path in pak_files:
             filename = os.path.basename(file_path)
-            if any(keyword in filename for keyword in incompatible_keywords):
+            if any(keyword in filename for keyword in INCOMPATIBLE_KEYWORDS):
                 found_mods.append(filename)
-                    
-        if found_mods:
+        return found_mods
+
+    def check_incompatible_mods(self, mods_path):
+        """Check for incompatible mods in the mods directory and its subdirectories, warning about any found"""
+        found_mods = self.find_incompatible_mods(mods_path)
+        if found_mods and self.interactive:
             from .localization.language_manager import get_current_localization
             loc = get_current_localization()
             messagebox.showwarning(loc.get_title("incompatible_mods"), 
                                   loc.get_warning("incompatible_mods_detected", 
                                                  mod_list="\n".join(found_mods)))
+        return found_mods
+
+    def create_mod(self, config, mods_path, prototypes=None, spans=None):
+        """
+        Build the mod pak and install it into mods_path.
 
-    def create_mod(self, config, mods_path):
+        prototypes optionally maps extra ObjPrototypes refkeys to key/value overrides;
+        they are packed into the same pak as PlayerCustom.cfg. spans, an optional
+        SpanRecorder, receives the timing of each build stage. Returns a build report.
+        """
+        spans = spans or SpanRecorder()
+        
         # Check for incompatible mods first
-        self.check_incompatible_mods(mods_path)
+        with spans.span('scan'):
+            incompatible_mods = self.check_incompatible_mods(mods_path)
         
-        # Only look in the correct repak folder location
-        repak_path = self._find_repak()
-        if not repak_path:
-            from .localization.language_manager import get_current_localization
-            loc = get_current_localization()
-            repak_folder_path = os.path.join(self.exe_dir, DATA_FOLDER_NAME, 'repak')
-            raise FileNotFoundError(loc.get_error("repak_not_found", repak_path=repak_folder_path))
+        packer_command = self.packer_command
+        if packer_command is None:
+            # Only look in the correct repak folder location
+            repak_path = self._find_repak()
+            if not repak_path:
+                from .localization.language_manager import get_current_localization
+                loc = get_current_localization()
+                repak_folder_path = os.path.join(self.exe_dir, DATA_FOLDER_NAME, 'repak')
+                raise FileNotFoundError(loc.get_error("repak_not_found", repak_path=repak_folder_path))
+            packer_command = [repak_path]
 
         # Create temporary build directory
-        import tempfile
         temp_build_dir = None
         
         try:
-            # Remove old mod file if it exists (for people upgrading from old version)
-            old_mod_file = os.path.join(mods_path, 'z_SCAMMovementAiming_P.pak')
-            if os.path.exists(old_mod_file):
-                os.remove(old_mod_file)
-            
-            # Create temporary directory for mod building
-            temp_build_dir = tempfile.mkdtemp(prefix='pak_mod_builder')
+            with spans.span('setup'):
+                # Remove old mod file if it exists (for people upgrading from old version)
+                old_mod_file = os.path.join(mods_path, 'z_SCAMMovementAiming_P.pak')
+                if os.path.exists(old_mod_file):
+                    os.remove(old_mod_file)
+                
+                # Create temporary directory for mod building
+                temp_build_dir = tempfile.mkdtemp(prefix='pak_mod_builder')
             
             # Enforce all config keys must be present
             required_keys = ['mod_folder_name', 'cfg_folder_name', 'cfg_file_name']
@@ -121,21 +151,19 @@ class ModCreator:
                 if key not in self.mod_config:
                     raise KeyError(f"'{key}' missing in mod_config.json or database. Please provide all required keys.")
             mod_folder = self.mod_config['mod_folder_name']
-            cfg_folder = self.mod_config['cfg_folder_name']
-            cfg_file = self.mod_config['cfg_file_name']
-            
-            mod_path = Path(temp_build_dir) / mod_folder / 'Stalker2' / 'Content' / 'GameLite' / 'GameData' / 'ObjPrototypes' / cfg_folder
-            mod_path.mkdir(parents=True, exist_ok=True)
             
             if 'Aiming' in config:
                 del config['Aiming']
+            # Formulas are already resolved into the values they compute
+            config.pop(FORMULAS_SECTION, None)
             
-            cfg_content = self._generate_cfg_content(config)
-            
-            with open(mod_path / cfg_file, 'w', encoding='utf-8') as f:
-                f.write(cfg_content)
-            
-            self._run_repak(mods_path, repak_path, temp_build_dir)
+            # Generates the cfg files and writes the build tree
+            with spans.span('generate'):
+                payloads = self.build_payloads(config, prototypes, Path(temp_build_dir, mod_folder))
+            pak_overhead = self._run_repak(mods_path, packer_command, temp_build_dir, payloads, spans)
+            report = self._build_report(payloads, os.path.join(mods_path, f'{mod_folder}.pak'), pak_overhead)
+            report['incompatible_mods'] = incompatible_mods
+            return report
             
         except Exception as e:
             # Clean up temp directory if there's an error
@@ -144,8 +172,9 @@ class ModCreator:
             raise
         finally:
             # Always clean up temp directory
-            if temp_build_dir and os.path.exists(temp_build_dir):
-                shutil.rmtree(temp_build_dir)
+            with spans.span('cleanup'):
+                if temp_build_dir and os.path.exists(temp_build_dir):
+                    shutil.rmtree(temp_build_dir)
 
     def _find_repak(self):
         """Find repak.exe in the correct location only"""
@@ -166,6 +195,63 @@ class ModCreator:
 
         return None
 
+    def get_entry_paths(self, prototypes=None):
+        """Paths inside the pak of every file SCAM writes, PlayerCustom.cfg first; raises ValueError for a bad refkey"""
+        for refkey in prototypes or {}:
+            check_prototype_refkey(refkey)
+        folder = '/'.join(PROTOTYPES_PATH + (self.mod_config['cfg_folder_name'],))
+        paths = [f"{folder}/{self.mod_config['cfg_file_name']}"]
+        paths.extend(f'{folder}/{refkey}Custom.cfg' for refkey in (prototypes or {}))
+        return paths
+
+    def build_payloads(self, config, prototypes=None, output_dir=None):
+        """
+        Generate every cfg file of the mod, keyed by its path inside the pak.
+
+        When output_dir is given the files are also written below it.
+        """
+        player_path, *prototype_paths = self.get_entry_paths(prototypes)
+        jobs = {player_path: (self._generate_cfg_content, config)}
+        for entry_path, (refkey, values) in zip(prototype_paths, (prototypes or {}).items()):
+            if entry_path in jobs:
+                raise ValueError(f"Prototype override '{refkey}' conflicts with {self.mod_config['cfg_file_name']}")
+            jobs[entry_path] = (self._generate_prototype_content, refkey, values)
+        
+        def build(entry_path):
+            generate, *args = jobs[entry_path]
+            # Write bytes ourselves so the exact content can be verified inside the pak
+            data = generate(*args).replace('\n', os.linesep).encode('utf-8')
+            if output_dir is not None:
+                file_path = Path(output_dir, *entry_path.split('/'))
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(file_path, 'wb') as f:
+                    f.write(data)
+            return entry_path, data
+        
+        return dict(map(build, jobs))
+
+    def _build_report(self, payloads, pak_path, pak_overhead):
+        """Summarize how much packing every payload into one pak saved compared to one pak each"""
+        pak_bytes = os.path.getsize(pak_path)
+        return {
+            'entries': len(payloads),
+            'pak_count': 1,
+            'separate_pak_count': len(payloads),
+            'payload_bytes': sum(len(data) for data in payloads.values()),
+            'pak_bytes': pak_bytes,
+            # Every extra pak would repeat the footer and index header
+            'separate_pak_bytes': pak_bytes + (len(payloads) - 1) * pak_overhead,
+        }
+
+    def _generate_prototype_content(self, refkey, values):
+        content = f"{refkey}Custom : struct.begin {{refurl=../../ObjPrototypes.cfg; refkey={refkey}}}\n"
+        for key, value in values.items():
+            content += f"{key} = {value}\n"
+        content += "struct.end\n\n"
+        content += "// Generated by SCAM (Stalker Character Adjustment Manager) by v3fish\n"
+        content += "// Personal use only - redistribution requires author permission\n"
+        return content
+
     def _generate_cfg_content(self, config):
         content = "PlayerCustom : struct.begin {refurl=../../ObjPrototypes.cfg; refkey=Player}\n"
         
@@ -193,40 +279,70 @@ class ModCreator:
         content += "// Personal use only - redistribution requires author permission\n"
         return content
 
-    def _run_repak(self, mods_path, repak_path, temp_build_dir):
+    def _install_pak(self, pak_file, mods_path, expected_files):
+        """
+        Copy the built pak next to its destination, verify it, then atomically replace the installed one.
+        Returns the size of the pak's fixed overhead (footer and index).
+        """
+        target = os.path.join(mods_path, os.path.basename(pak_file))
+        temp_target = None
         try:
-            # Show progress dialog during repak execution
-            import tkinter as tk
-            from tkinter import ttk
-            
-            # Create progress window
-            progress_window = tk.Toplevel()
-            progress_window.title("Creating Mod")
-            progress_window.geometry("300x100")
-            progress_window.resizable(False, False)
-            progress_window.transient()
-            progress_window.grab_set()
-            
-            # Center the window
-            progress_window.update_idletasks()
-            x = (progress_window.winfo_screenwidth() // 2) - (150)
-            y = (progress_window.winfo_screenheight() // 2) - (50)
-            progress_window.geometry(f"+{x}+{y}")
+            # Sibling temp file on the same volume so os.replace is atomic; no .pak suffix so the game ignores it.
+            # Its name is unique, so installs from another SCAM (the CLI, another window) never share it.
+            with open(pak_file, 'rb') as src, tempfile.NamedTemporaryFile(
+                    'wb', dir=mods_path, prefix=f'.{os.path.basename(pak_file)}.', suffix='.tmp', delete=False) as dst:
+                temp_target = dst.name
+                shutil.copyfileobj(src, dst)
+                dst.flush()
+                os.fsync(dst.fileno())
             
-            # Add content
-            ttk.Label(progress_window, text="Creating mod file, please wait...").pack(pady=15)
-            progress_bar = ttk.Progressbar(progress_window, mode='indeterminate', length=250)
-            progress_bar.pack(pady=(0, 15))
-            progress_bar.start(10)
+            with PakReader(temp_target) as pak:
+                for entry_path, expected_bytes in expected_files.items():
+                    pak.verify_entry(entry_path, expected_bytes)
+                overhead = pak.footer_size + pak.index_size
             
-            # Update the window to show it
-            progress_window.update()
+            os.replace(temp_target, target)
+            return overhead
+        finally:
+            if temp_target is not None and os.path.exists(temp_target):
+                os.remove(temp_target)
+
+    def show_progress_window(self):
+        """Show an indeterminate progress dialog while the packer runs"""
+        import tkinter as tk
+        from tkinter import ttk
+        
+        # Create progress window
+        progress_window = tk.Toplevel()
+        progress_window.title("Creating Mod")
+        progress_window.geometry("300x100")
+        progress_window.resizable(False, False)
+        progress_window.transient()
+        progress_window.grab_set()
+        
+        # Center the window
+        progress_window.update_idletasks()
+        x = (progress_window.winfo_screenwidth() // 2) - (150)
+        y = (progress_window.winfo_screenheight() // 2) - (50)
+        progress_window.geometry(f"+{x}+{y}")
+        
+        # Add content
+        ttk.Label(progress_window, text="Creating mod file, please wait...").pack(pady=15)
+        progress_bar = ttk.Progressbar(progress_window, mode='indeterminate', length=250)
+        progress_bar.pack(pady=(0, 15))
+        progress_bar.start(10)
+        
+        # Update the window to show it
+        progress_window.update()
+        return progress_window
+
+    def _run_repak(self, mods_path, packer_command, temp_build_dir, expected_files, spans):
+        """Pack the build directory with repak (or packer_command) and install the result, returns the pak overhead size"""
+        try:
+            # Show progress dialog during repak execution
+            progress_window = self.show_progress_window() if self.interactive else None
             
             try:
-                # Change to temp directory for repak execution
-                original_cwd = os.getcwd()
-                os.chdir(temp_build_dir)
-                
                 # Set up subprocess parameters to hide CMD window
                 startupinfo = None
                 creationflags = 0
@@ -239,28 +355,34 @@ class ModCreator:
                 # Get mod folder name from config
                 mod_folder = self.mod_config.get('mod_folder_name', 'z_SCAM_P')
                 
-                # Run repak subprocess (hidden)
-                subprocess.run([repak_path, 'pack', mod_folder], 
-                             check=True,
-                             startupinfo=startupinfo,
-                             creationflags=creationflags)
-                
-                # Move the created pak file to destination
-                pak_file = os.path.join(temp_build_dir, f'{mod_folder}.pak')
-                if os.path.exists(pak_file):
-                    shutil.move(pak_file, os.path.join(mods_path, f'{mod_folder}.pak'))
+                # Run repak subprocess (hidden) inside the temp directory
+                with spans.span('pack'):
+                    subprocess.run(list(packer_command) + ['pack', mod_folder],
+                                 check=True,
+                                 cwd=temp_build_dir,
+                                 startupinfo=startupinfo,
+                                 creationflags=creationflags)
                 
-                # Restore original working directory
-                os.chdir(original_cwd)
+                # Verify and install the created pak file
+                with spans.span('install'):
+                    pak_file = os.path.join(temp_build_dir, f'{mod_folder}.pak')
+                    if not os.path.exists(pak_file):
+                        raise PakError(f"repak did not create {mod_folder}.pak")
+                    return self._install_pak(pak_file, mods_path, expected_files)
                 
             finally:
                 # Always close the progress window
-                progress_window.destroy()
+                if progress_window is not None:
+                    progress_window.destroy()
                 
         except subprocess.CalledProcessError as e:
             from .localization.language_manager import get_current_localization
             loc = get_current_localization()
             raise RuntimeError(loc.get_error("failed_to_run_repak", error=str(e)))
+        except PakError as e:
+            from .localization.language_manager import get_current_localization
+            loc = get_current_localization()
+            raise RuntimeError(loc.get_error("pak_verification_failed", error=str(e)))
         except Exception as e:
             from .localization.language_manager import get_current_localization
             loc = get_current_localization()
@@ -0,0 +1,181 @@
+# modules/mods_analyzer.py
+"""
+~mods footprint analyzer.
+
+Scans the mods directory once, summarizes every pak's index (cached by size and
+modification time) and works out which paks are mounted after SCAM and may
+override the prototype files it writes.
+"""
+import json
+import os
+
+from .mod import PROTOTYPES_PATH
+from .pak import PakError, PakReader
+from .diagnostics_log import diagnostics_log
+
+CACHE_FILE_NAME = 'mods_index_cache.json'
+PROTOTYPES_PREFIX = '/'.join(PROTOTYPES_PATH)
+# Bumped when cached summaries change meaning, so older ones are read again
+SUMMARY_VERSION = 2
+
+
+def mounted_path(mount_point, entry_path):
+    """
+    Path of a pak entry relative to the game root, like the paths SCAM writes.
+
+    Entry paths are relative to the pak's mount point, which is relative to the
+    engine folder: '../../../' is the game root, '../../../Stalker2/Content/'
+    holds paths starting below Content.
+    """
+    mount = mount_point.replace('\\', '/')
+    while mount.startswith('../'):
+        mount = mount[3:]
+    mount = mount.strip('/')
+    entry_path = entry_path.replace('\\', '/').lstrip('/')
+    return f'{mount}/{entry_path}' if mount else entry_path
+
+
+def load_order_key(pak_path):
+    """
+    Sort key matching the order the game mounts paks in.
+
+    Paks ending in _P are patch paks and win over regular ones; within the same
+    group later names win, which is why mods use z_ and ~ prefixes to load last.
+    """
+    name = os.path.splitext(os.path.basename(pak_path))[0]
+    return (name.endswith('_P'), name.lower())
+
+
+class ModsAnalyzer:
+    def __init__(self, mod_creator, user_data_path=None):
+        self.mod_creator = mod_creator
+        self.cache_path = os.path.join(user_data_path, CACHE_FILE_NAME) if user_data_path else None
+        self._cache = self._load_cache()
+
+    def _load_cache(self):
+        if self.cache_path and os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                diagnostics_log.warning('mods_cache.load_failed', path=self.cache_path, error=str(e))
+        return {}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+        except OSError as e:
+            diagnostics_log.warning('mods_cache.save_failed', path=self.cache_path, error=str(e))
+
+    def summarize_pak(self, pak_path, stat=None):
+        """Return the cached index summary of a pak, reading its index only if the file changed"""
+        stat = stat or os.stat(pak_path)
+        cached = self._cache.get(pak_path)
+        if cached and cached.get('version') == SUMMARY_VERSION and cached['size'] == stat.st_size \
+                and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached
+
+        summary = {'version': SUMMARY_VERSION, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                   'entries': 0, 'prototype_paths': [], 'error': None}
+        try:
+            with PakReader(pak_path) as pak:
+                summary['entries'] = len(pak.entries)
+                # Only keep the paths that can collide with SCAM to keep the cache small
+                paths = (mounted_path(pak.mount_point, path) for path in pak.entries)
+                summary['prototype_paths'] = sorted(path for path in paths if path.startswith(PROTOTYPES_PREFIX))
+        except (PakError, OSError) as e:
+            summary['error'] = str(e)
+        self._cache[pak_path] = summary
+        return summary
+
+    def analyze(self, mods_path, prototypes=None):
+        """
+        Scan mods_path and return a report dict with the total footprint, per-pak
+        summaries in load order and the providers of every path SCAM writes.
+        """
+        pak_files = self.mod_creator.find_pak_files(mods_path) if os.path.exists(mods_path) else []
+        pak_files.sort(key=load_order_key)
+
+        paks = []
+        for order, pak_path in enumerate(pak_files, 1):
+            summary = self.summarize_pak(pak_path)
+            paks.append({
+                'order': order,
+                'name': os.path.relpath(pak_path, mods_path),
+                'path': pak_path,
+                'size': summary['size'],
+                'entries': summary['entries'],
+                'prototype_paths': summary['prototype_paths'],
+                'error': summary['error'],
+            })
+
+        # Forget paks that no longer exist so the cache does not grow forever
+        scanned = set(pak_files)
+        for stale in [path for path in self._cache if path not in scanned and path.startswith(mods_path)]:
+            del self._cache[stale]
+        self._save_cache()
+
+        scam_paths = self.mod_creator.get_entry_paths(prototypes)
+        scam_names = {os.path.basename(path) for path in self._scam_pak_paths(mods_path)}
+        scam_order = max((pak['order'] for pak in paks
+                          if os.path.basename(pak['path']) in scam_names), default=None)
+
+        load_order = {}
+        for path in scam_paths:
+            providers = [pak['name'] for pak in paks if path in pak['prototype_paths']]
+            load_order[path] = {'providers': providers, 'winner': providers[-1] if providers else None}
+
+        # Any pak mounted after SCAM that ships ObjPrototypes files can override its values
+        overriding = []
+        if scam_order is not None:
+            overriding = [pak['name'] for pak in paks
+                          if pak['order'] > scam_order and pak['prototype_paths']]
+
+        return {
+            'mods_path': mods_path,
+            'pak_count': len(paks),
+            'total_bytes': sum(pak['size'] for pak in paks),
+            'total_entries': sum(pak['entries'] for pak in paks),
+            'paks': paks,
+            'scam_installed': scam_order is not None,
+            'load_order': load_order,
+            'overriding_paks': overriding,
+            'incompatible_mods': self.mod_creator.find_incompatible_mods(mods_path, pak_files),
+        }
+
+    def _scam_pak_paths(self, mods_path):
+        mod_folder = self.mod_creator.mod_config.get('mod_folder_name', 'z_SCAM_P')
+        return [os.path.join(mods_path, f'{mod_folder}.pak'),
+                os.path.join(mods_path, 'z_SCAMMovementAiming_P.pak')]
+
+
+def format_report(report):
+    """Render an analyzer report as plain text for the CLI"""
+    lines = [f"{report['mods_path']}",
+             f"{report['pak_count']} paks, {report['total_bytes'] / (1024 * 1024):.1f} MB, "
+             f"{report['total_entries']} entries", ""]
+    for pak in report['paks']:
+        note = f"  [{pak['error']}]" if pak['error'] else ''
+        prototypes = f"  ({len(pak['prototype_paths'])} prototype files)" if pak['prototype_paths'] else ''
+        lines.append(f"{pak['order']:4d}  {pak['name']}  {pak['entries']} entries, "
+                     f"{pak['size']} bytes{prototypes}{note}")
+    lines.append("")
+    for path, order in report['load_order'].items():
+        lines.append(f"{path}:")
+        if order['providers']:
+            for name in order['providers']:
+                lines.append(f"    {name}{'  <- wins' if name == order['winner'] else ''}")
+        else:
+            lines.append("    (not installed)")
+    if report['overriding_paks']:
+        lines.append("")
+        lines.append("Paks loaded after SCAM that ship ObjPrototypes files:")
+        lines.extend(f"    {name}" for name in report['overriding_paks'])
+    if report['incompatible_mods']:
+        lines.append("")
+        lines.append("Incompatible mods:")
+        lines.extend(f"    {name}" for name in report['incompatible_mods'])
+    return "\n".join(lines)
@@ -0,0 +1,373 @@
+# modules/pak.py
+"""
+Minimal reader for Unreal Engine .pak archives (the format written by repak).
+
+Only the parts SCAM needs are implemented: locating the footer, parsing the
+index (legacy and path-hash layouts) and reading back stored entries so an
+installed mod can be verified without unpacking it.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import zlib
+
+PAK_MAGIC = 0x5A6F12E1
+
+# Pak format versions (matching repak's VersionMajor numbering, V8A/V8B share 8)
+VERSION_INITIAL = 1
+VERSION_COMPRESSION_ENCRYPTION = 3
+VERSION_INDEX_ENCRYPTION = 4
+VERSION_RELATIVE_CHUNK_OFFSETS = 5
+VERSION_ENCRYPTION_KEY_GUID = 7
+VERSION_FNAME_BASED_COMPRESSION = 8
+VERSION_FROZEN_INDEX = 9
+VERSION_PATH_HASH_INDEX = 10
+
+COMPRESSION_NAME_SIZE = 32
+
+
+class PakError(Exception):
+    """Raised when a pak file cannot be parsed or fails verification"""
+
+
+class PakEntry:
+    """Location and metadata of a single file stored in a pak"""
+    __slots__ = ('path', 'offset', 'compressed_size', 'uncompressed_size',
+                 'compression', 'blocks', 'encrypted', 'compression_block_size')
+
+    def __init__(self, path, offset, compressed_size, uncompressed_size,
+                 compression=None, blocks=None, encrypted=False, compression_block_size=0):
+        self.path = path
+        self.offset = offset
+        self.compressed_size = compressed_size
+        self.uncompressed_size = uncompressed_size
+        self.compression = compression
+        self.blocks = blocks
+        self.encrypted = encrypted
+        self.compression_block_size = compression_block_size
+
+
+class _Cursor:
+    """Little-endian reader over a bytes-like object"""
+
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+
+    def read(self, size):
+        if size < 0 or self.pos + size > len(self.data):
+            raise PakError("Unexpected end of pak data")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def unpack(self, fmt):
+        size = struct.calcsize(fmt)
+        if self.pos + size > len(self.data):
+            raise PakError("Unexpected end of pak data")
+        values = struct.unpack_from(fmt, self.data, self.pos)
+        self.pos += size
+        return values if len(values) > 1 else values[0]
+
+    def u8(self):
+        return self.unpack('<B')
+
+    def u32(self):
+        return self.unpack('<I')
+
+    def i32(self):
+        return self.unpack('<i')
+
+    def u64(self):
+        return self.unpack('<Q')
+
+    def fstring(self):
+        length = self.i32()
+        if length == 0:
+            return ''
+        if length > 0:
+            return bytes(self.read(length)).rstrip(b'\0').decode('utf-8', errors='replace')
+        return bytes(self.read(-length * 2)).decode('utf-16-le', errors='replace').rstrip('\0')
+
+
+def _footer_size(version, v8_names):
+    size = 44  # magic, version, index offset, index size, index hash
+    if version >= VERSION_INDEX_ENCRYPTION:
+        size += 1
+    if version >= VERSION_ENCRYPTION_KEY_GUID:
+        size += 16
+    if version >= VERSION_FNAME_BASED_COMPRESSION:
+        size += COMPRESSION_NAME_SIZE * v8_names
+    if version == VERSION_FROZEN_INDEX:
+        size += 1
+    return size
+
+
+# Every footer layout that can appear at the end of a pak, largest first
+_FOOTER_LAYOUTS = [(v, n) for v in range(11, 0, -1) for n in ((5, 4) if v == 8 else (5,))]
+
+
+class PakReader:
+    """
+    Read-only view of a pak file backed by mmap.
+
+    Usage:
+        with PakReader(path) as pak:
+            data = pak.read_entry('Stalker2/Content/.../PlayerCustom.cfg')
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.version = None
+        self.mount_point = ''
+        self.entries = {}
+        self.compression_methods = []
+        self.index_offset = 0
+        self.index_size = 0
+        self.footer_size = 0
+        self._file = open(path, 'rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size == 0:
+                raise PakError(f"Empty pak file: {path}")
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_footer()
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        data = getattr(self, '_data', None)
+        if data is not None:
+            data.close()
+            self._data = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _read_footer(self):
+        data = self._data
+        for version, names in _FOOTER_LAYOUTS:
+            footer_size = _footer_size(version, names)
+            start = len(data) - footer_size
+            if start < 0:
+                continue
+            magic_pos = start + (16 if version >= VERSION_ENCRYPTION_KEY_GUID else 0) + \
+                (1 if version >= VERSION_INDEX_ENCRYPTION else 0)
+            magic, stored_version = struct.unpack_from('<II', data, magic_pos)
+            if magic != PAK_MAGIC or stored_version != version:
+                continue
+
+            cursor = _Cursor(data, start)
+            if version >= VERSION_ENCRYPTION_KEY_GUID:
+                cursor.read(16)
+            encrypted = version >= VERSION_INDEX_ENCRYPTION and cursor.u8() != 0
+            cursor.read(8)  # magic and version, already checked
+            self.index_offset = cursor.u64()
+            self.index_size = cursor.u64()
+            cursor.read(20)  # index hash
+            if version == VERSION_FROZEN_INDEX:
+                cursor.read(1)
+            if version >= VERSION_FNAME_BASED_COMPRESSION:
+                for _ in range(names):
+                    name = bytes(cursor.read(COMPRESSION_NAME_SIZE)).rstrip(b'\0').decode('ascii', errors='replace')
+                    if name:
+                        self.compression_methods.append(name)
+            if encrypted:
+                raise PakError(f"Pak index is encrypted: {self.path}")
+            if self.index_offset + self.index_size > start:
+                raise PakError(f"Pak index lies outside of the file: {self.path}")
+
+            self.version = version
+            self.v8_names = names
+            self.footer_size = footer_size
+            return
+        raise PakError(f"Not a pak file (footer magic not found): {self.path}")
+
+    def _read_entry_record(self, cursor):
+        """Read a full (non-encoded) entry record as serialized in the index or before the data"""
+        version = self.version
+        offset = cursor.u64()
+        compressed = cursor.u64()
+        uncompressed = cursor.u64()
+        if version == VERSION_FNAME_BASED_COMPRESSION and self.v8_names == 4:
+            compression = cursor.u8()
+        else:
+            compression = cursor.u32()
+        if version == VERSION_INITIAL:
+            cursor.u64()  # timestamp
+        sha1 = bytes(cursor.read(20))
+        blocks = None
+        if version >= VERSION_COMPRESSION_ENCRYPTION and compression:
+            blocks = [cursor.unpack('<QQ') for _ in range(cursor.u32())]
+        encrypted = False
+        block_size = 0
+        if version >= VERSION_COMPRESSION_ENCRYPTION:
+            encrypted = bool(cursor.u8() & 1)
+            block_size = cursor.u32()
+        entry = PakEntry(None, offset, compressed, uncompressed,
+                         compression or None, blocks, encrypted, block_size)
+        return entry, sha1
+
+    def _record_size(self, compression, block_count):
+        """Size of the entry record that precedes each file's data"""
+        size = 8 * 3 + 20
+        size += 1 if (self.version == VERSION_FNAME_BASED_COMPRESSION and self.v8_names == 4) else 4
+        if self.version == VERSION_INITIAL:
+            size += 8
+        if self.version >= VERSION_COMPRESSION_ENCRYPTION:
+            if compression:
+                size += 4 + 16 * block_count
+            size += 1 + 4
+        return size
+
+    def _read_encoded_entry(self, cursor):
+        bits = cursor.u32()
+        compression = (bits >> 23) & 0x3f
+        encrypted = bool(bits & (1 << 22))
+        block_count = (bits >> 6) & 0xffff
+        block_size = bits & 0x3f
+        if block_size == 0x3f:
+            block_size = cursor.u32()
+        else:
+            block_size <<= 11
+
+        def var_int(bit):
+            return cursor.u32() if bits & (1 << bit) else cursor.u64()
+
+        offset = var_int(31)
+        uncompressed = var_int(30)
+        compressed = var_int(29) if compression else uncompressed
+
+        blocks = None
+        base = self._record_size(compression, block_count)
+        if block_count == 1 and not encrypted:
+            blocks = [(base, base + compressed)]
+        elif block_count > 0:
+            blocks = []
+            start = base
+            for _ in range(block_count):
+                length = cursor.u32()
+                blocks.append((start, start + length))
+                start += (length + 15) & ~15 if encrypted else length
+        return PakEntry(None, offset, compressed, uncompressed,
+                        compression or None, blocks, encrypted, block_size)
+
+    def _read_index(self):
+        cursor = _Cursor(self._data, self.index_offset)
+        self.mount_point = cursor.fstring()
+        count = cursor.u32()
+
+        if self.version < VERSION_PATH_HASH_INDEX:
+            for _ in range(count):
+                path = cursor.fstring()
+                entry, _sha1 = self._read_entry_record(cursor)
+                entry.path = path
+                self.entries[path] = entry
+            return
+
+        cursor.u64()  # path hash seed
+        if cursor.u32():
+            cursor.read(8 + 8 + 20)  # path hash index location, not needed
+        directory_index = None
+        if cursor.u32():
+            directory_index = (cursor.u64(), cursor.u64())
+            cursor.read(20)
+        encoded_size = cursor.u32()
+        encoded = self._data[cursor.pos:cursor.pos + encoded_size]
+        cursor.read(encoded_size)
+        plain_entries = []
+        for _ in range(cursor.u32()):
+            entry, _sha1 = self._read_entry_record(cursor)
+            plain_entries.append(entry)
+
+        if directory_index is None:
+            raise PakError(f"Pak has no full directory index: {self.path}")
+        offset, size = directory_index
+        if offset + size > len(self._data):
+            raise PakError(f"Pak directory index lies outside of the file: {self.path}")
+
+        dir_cursor = _Cursor(self._data, offset)
+        encoded_cursor = _Cursor(encoded)
+        for _ in range(dir_cursor.u32()):
+            directory = dir_cursor.fstring()
+            for _ in range(dir_cursor.u32()):
+                name = dir_cursor.fstring()
+                location = dir_cursor.i32()
+                if location >= 0:
+                    encoded_cursor.pos = location
+                    entry = self._read_encoded_entry(encoded_cursor)
+                else:
+                    entry = plain_entries[-location - 1]
+                path = (directory + name).lstrip('/')
+                entry.path = path
+                self.entries[path] = entry
+
+    def read_record_hash(self, entry):
+        """Return the SHA1 stored in the record that precedes an entry's data"""
+        cursor = _Cursor(self._data, entry.offset)
+        _record, sha1 = self._read_entry_record(cursor)
+        return sha1
+
+    def read_raw(self, entry):
+        """Return the stored (possibly compressed) bytes of an entry"""
+        if entry.blocks:
+            base = entry.offset if self.version >= VERSION_RELATIVE_CHUNK_OFFSETS else 0
+            return b''.join(self._data[base + start:base + end] for start, end in entry.blocks)
+        start = entry.offset + self._record_size(entry.compression, 0)
+        end = start + entry.compressed_size
+        if end > len(self._data):
+            raise PakError(f"Entry data lies outside of the file: {entry.path}")
+        return self._data[start:end]
+
+    def read_entry(self, path):
+        """Return the uncompressed contents of the entry at path"""
+        entry = self.entries.get(path)
+        if entry is None:
+            raise PakError(f"'{path}' not found in {self.path}")
+        if entry.encrypted:
+            raise PakError(f"'{path}' is encrypted")
+        if not entry.compression:
+            return bytes(self.read_raw(entry))
+
+        method = self._compression_name(entry.compression)
+        if method.lower() not in ('zlib', 'gzip'):
+            raise PakError(f"Unsupported compression '{method}' for {path}")
+        base = entry.offset if self.version >= VERSION_RELATIVE_CHUNK_OFFSETS else 0
+        return b''.join(zlib.decompress(self._data[base + start:base + end])
+                        for start, end in entry.blocks or [])
+
+    def verify_entry(self, path, expected_bytes):
+        """
+        Check that the entry at path holds exactly expected_bytes.
+
+        Compares the SHA1 recorded in the pak with the hash of the generated content
+        and with the hash of the data actually stored. Raises PakError on mismatch.
+        """
+        entry = self.entries.get(path)
+        if entry is None:
+            raise PakError(f"'{path}' not found in {os.path.basename(self.path)}")
+        stored_hash = self.read_record_hash(entry)
+        if hashlib.sha1(self.read_raw(entry)).digest() != stored_hash:
+            raise PakError(f"Stored data for '{path}' is corrupt")
+        if entry.compression:
+            if self.read_entry(path) != expected_bytes:
+                raise PakError(f"'{path}' does not match the generated content")
+        elif stored_hash != hashlib.sha1(expected_bytes).digest() or entry.uncompressed_size != len(expected_bytes):
+            raise PakError(f"'{path}' does not match the generated content")
+
+    def _compression_name(self, compression):
+        if self.version >= VERSION_FNAME_BASED_COMPRESSION:
+            index = compression - 1
+            if 0 <= index < len(self.compression_methods):
+                return self.compression_methods[index]
+            return 'unknown'
+        return {1: 'Zlib', 2: 'Gzip', 4: 'Oodle'}.get(compression, 'unknown')
@@ -0,0 +1,285 @@
+# modules/preset_lint.py
+"""
+Preset linter.
+
+Checks every preset .ini below a folder against the defaults schema and
+reports, per file:
+    unknown_section / unknown_key   not in the schema (ignored by the editor)
+    type_mismatch                   not a number or true/false where one is expected
+    constraint                      outside the |max, [Constraints] min/max/step or relations
+    invalid_formula / unknown_base  [Formulas] that do not compile, a [Preset] base that does not exist
+    invalid_refkey                  [Prototype:<RefKey>] that is not letters, digits and _
+    parse_error                     not readable as an ini file
+    equals_default                  value that changes nothing (info)
+
+Files are linted in parallel in a process pool. Results are cached in the
+user data folder by the SHA-256 of each file's content, together with a
+fingerprint of the schema, so relinting an unchanged dump (or one full of
+copies of the same preset) only hashes the files.
+"""
+import configparser
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import PROTOTYPE_SECTION_PREFIX, check_prototype_refkey
+from .constraints import ConstraintChecker
+from .diagnostics_log import diagnostics_log
+from .formulas import FORMULAS_SECTION, FormulaError, FormulaSet
+from .presets import BASE_KEY, PRESET_SECTION
+from .settings_model import SYNC_KEY
+
+CACHE_FILE_NAME = 'preset_lint_cache.json'
+# Bump when the checks change so cached results are redone
+LINT_VERSION = 3
+# Below this many files to lint, starting worker processes costs more than it saves
+MIN_PARALLEL_FILES = 16
+CHUNK_SIZE = 32
+
+SEVERITIES = ('error', 'warning', 'info')
+BUILTIN_BASES = ('default', 'v3fish_recommended', 'xysensitivityfix')
+
+
+def find_presets(root):
+    """Every .ini file below root, sorted"""
+    if os.path.isfile(root):
+        return [os.path.abspath(root)]
+    paths = []
+    for folder, _, files in os.walk(root):
+        paths.extend(os.path.join(folder, name) for name in files if name.lower().endswith('.ini'))
+    return sorted(os.path.abspath(path) for path in paths)
+
+
+def _parse_value(text, default):
+    """The value the editor reads from preset text, or None if it does not fit the type of the default"""
+    if isinstance(default, bool):
+        return text.lower() == 'true' if text.lower() in ('true', 'false') else None
+    try:
+        return float(text) if '.' in text else int(text)
+    except ValueError:
+        return None
+
+
+class Linter:
+    """Checks preset text against one schema; built once per worker process"""
+
+    def __init__(self, schema):
+        self.defaults = {(section, key): value for section, values in schema['defaults'].items()
+                         for key, value in values.items()}
+        self.defaults.setdefault(SYNC_KEY, False)
+        self.sections = {section for section, _ in self.defaults}
+        self.max_values = {(section, key): value for section, values in schema['max_values'].items()
+                           for key, value in values.items()}
+        self.checker = ConstraintChecker(self.defaults, self.max_values, schema['constraints'])
+
+    def lint(self, text):
+        """{'issues': [...], 'base': name or None} of a preset's text; whether the base exists is checked later"""
+        issues = []
+        base = None
+
+        def report(severity, code, message, section=None, key=None):
+            issues.append({'severity': severity, 'code': code, 'section': section, 'key': key, 'message': message})
+
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.optionxform = str
+        try:
+            parser.read_string(text)
+        except configparser.Error as e:
+            report('error', 'parse_error', str(e).splitlines()[0])
+            return {'issues': issues, 'base': None}
+
+        values = {}
+        for section in parser.sections():
+            if section.startswith(PROTOTYPE_SECTION_PREFIX):
+                # Overrides of other prototypes have no schema to check against, only their refkey
+                try:
+                    check_prototype_refkey(section[len(PROTOTYPE_SECTION_PREFIX):])
+                except ValueError as e:
+                    report('error', 'invalid_refkey', str(e), section)
+                continue
+            if section == PRESET_SECTION:
+                base = parser[section].get(BASE_KEY, '').split(';')[0].strip() or None
+                continue
+            if section == FORMULAS_SECTION:
+                continue
+            if section not in self.sections:
+                report('warning', 'unknown_section', f"Unknown section [{section}]", section)
+                continue
+            for key, raw in parser[section].items():
+                setting = (section, key)
+                if setting not in self.defaults:
+                    report('warning', 'unknown_key', f"Unknown setting {key}", section, key)
+                    continue
+                text_value = raw.split(';')[0].strip()
+                if not text_value:
+                    # Clears the base preset's value
+                    continue
+                default = self.defaults[setting]
+                value = _parse_value(text_value, default)
+                if value is None:
+                    expected = 'true or false' if isinstance(default, bool) else 'a number'
+                    report('error', 'type_mismatch', f"'{text_value}' is not {expected}", section, key)
+                    continue
+                values[setting] = value
+                if type(value) is type(default) and value == default:
+                    report('info', 'equals_default', f"Same as the default ({default})", section, key)
+
+        if parser.has_section(FORMULAS_SECTION):
+            try:
+                # Empty ones clear an inherited formula
+                FormulaSet(self.defaults, {key: raw.split(';')[0] for key, raw in parser[FORMULAS_SECTION].items()
+                                           if raw.split(';')[0].strip()})
+            except FormulaError as e:
+                report('error', 'invalid_formula', str(e), FORMULAS_SECTION)
+
+        # Relations compare against the preset's value or else the default, as the editor would
+        self.checker.clear()
+        get = lambda section, key: values.get((section, key), self.defaults[(section, key)])
+        for setting in values:
+            if isinstance(self.defaults[setting], bool):
+                continue
+            problem = self.checker.check(setting, get)
+            if problem:
+                report('error', 'constraint', problem, *setting)
+        return {'issues': issues, 'base': base}
+
+
+_worker_linter = None
+
+
+def _init_worker(schema):
+    global _worker_linter
+    _worker_linter = Linter(schema)
+
+
+def _lint_in_worker(text):
+    return _worker_linter.lint(text)
+
+
+def schema_from_handler(config_handler):
+    return {
+        'defaults': config_handler.default_config,
+        'max_values': config_handler.max_values,
+        'constraints': config_handler.constraints,
+    }
+
+
+class PresetLinter:
+    def __init__(self, config_handler, user_data_path=None, jobs=None):
+        self.config_handler = config_handler
+        self.cache_path = os.path.join(user_data_path, CACHE_FILE_NAME) if user_data_path else None
+        self.jobs = jobs or os.cpu_count() or 1
+
+    def _load_cache(self, fingerprint):
+        if self.cache_path and os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if cache.get('fingerprint') == fingerprint:
+                    return cache['files']
+            except (OSError, ValueError, KeyError) as e:
+                diagnostics_log.warning('lint_cache.load_failed', path=self.cache_path, error=str(e))
+        return {}
+
+    def _save_cache(self, fingerprint, files):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': fingerprint, 'files': files}, f)
+        except OSError as e:
+            diagnostics_log.warning('lint_cache.save_failed', path=self.cache_path, error=str(e))
+
+    def lint(self, root, use_cache=True):
+        """Lint every preset below root and return a report dict"""
+        paths = find_presets(root)
+        schema = schema_from_handler(self.config_handler)
+        fingerprint = hashlib.sha256(json.dumps([LINT_VERSION, schema], sort_keys=True).encode()).hexdigest()
+        cache = self._load_cache(fingerprint) if use_cache else {}
+
+        files = []
+        pending = {}  # sha256 -> text
+        for path in paths:
+            entry = {'path': path, 'sha256': None, 'cached': False, 'issues': []}
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError as e:
+                entry['issues'] = [{'severity': 'error', 'code': 'parse_error', 'section': None, 'key': None,
+                                    'message': str(e)}]
+                files.append(entry)
+                continue
+            digest = entry['sha256'] = hashlib.sha256(data).hexdigest()
+            entry['cached'] = digest in cache
+            if not entry['cached'] and digest not in pending:
+                pending[digest] = data.decode('utf-8', errors='replace')
+            files.append(entry)
+
+        with diagnostics_log.timed('lint.run', files=len(paths), linted=len(pending)):
+            results = self._lint_texts(schema, list(pending.values()))
+        cache.update(zip(pending, results))
+        # Bases are looked up by name among the presets, like in the editor's Presets folder
+        preset_names = {os.path.splitext(os.path.basename(path))[0] for path in paths} | set(BUILTIN_BASES)
+        for entry in files:
+            if entry['sha256'] is None:
+                continue
+            result = cache[entry['sha256']]
+            entry['issues'] = list(result['issues'])
+            if result['base'] and result['base'] not in preset_names:
+                entry['issues'].append({'severity': 'warning', 'code': 'unknown_base', 'section': PRESET_SECTION,
+                                        'key': BASE_KEY, 'message': f"Base preset '{result['base']}' not found"})
+        if use_cache:
+            # Only keep the files of this run so the cache does not grow forever
+            self._save_cache(fingerprint, {entry['sha256']: cache[entry['sha256']]
+                                           for entry in files if entry['sha256'] is not None})
+
+        counts = {severity: 0 for severity in SEVERITIES}
+        for entry in files:
+            for issue in entry['issues']:
+                counts[issue['severity']] += 1
+        return {
+            'root': os.path.abspath(root),
+            'files': files,
+            'summary': {
+                'files': len(files),
+                'files_with_errors': sum(any(issue['severity'] == 'error' for issue in entry['issues'])
+                                         for entry in files),
+                'cached': sum(entry['cached'] for entry in files),
+                'linted': len(pending),
+                'errors': counts['error'],
+                'warnings': counts['warning'],
+                'infos': counts['info'],
+            },
+        }
+
+    def _lint_texts(self, schema, texts):
+        if self.jobs <= 1 or len(texts) < MIN_PARALLEL_FILES:
+            linter = Linter(schema)
+            return [linter.lint(text) for text in texts]
+        with ProcessPoolExecutor(max_workers=min(self.jobs, len(texts)),
+                                 initializer=_init_worker, initargs=(schema,)) as executor:
+            # Small enough chunks that every worker gets several
+            chunksize = max(1, min(CHUNK_SIZE, len(texts) // (self.jobs * 4)))
+            return list(executor.map(_lint_in_worker, texts, chunksize=chunksize))
+
+
+def format_report(report, show_info=False):
+    """Render a lint report as plain text for the CLI"""
+    lines = []
+    for entry in report['files']:
+        issues = [issue for issue in entry['issues'] if show_info or issue['severity'] != 'info']
+        if not issues:
+            continue
+        lines.append(os.path.relpath(entry['path'], report['root']) if os.path.isdir(report['root'])
+                     else entry['path'])
+        for issue in issues:
+            where = '.'.join(part for part in (issue['section'], issue['key']) if part)
+            lines.append(f"  {issue['severity']:<7} {issue['code']:<16} {where}: {issue['message']}")
+    summary = report['summary']
+    if lines:
+        lines.append("")
+    lines.append(f"{summary['files']} presets ({summary['cached']} cached): {summary['errors']} errors, "
+                 f"{summary['warnings']} warnings, {summary['infos']} unchanged values, "
+                 f"{summary['files_with_errors']} presets with errors")
+    return "\n".join(lines)
@@ -0,0 +1,101 @@
+# modules/preset_watch.py
+"""
+Watch mode: rebuild and reinstall the mod when a preset file is saved.
+
+PresetWatcher polls a preset file, or every .ini in a folder, on a
+background thread (see file_watch.py). A burst of writes (editors often
+save in several steps) is reported once, after the writes settle.
+
+WatchBuilder turns the saved preset into the mod through the normal
+pipeline: the preset is resolved (inheritance), loaded into a
+SettingsModel (formulas, validation) and installed through a BuildQueue
+(build_queue.py), shared with the editor's other builds, which skips the build
+when the generated cfg files are unchanged, so saving a comment or
+reformatting the file costs no repak run.
+"""
+import os
+
+from .diagnostics_log import diagnostics_log
+from .file_watch import FileWatcher, file_signature
+from .formulas import FormulaError
+from .presets import PresetError, PresetResolver
+from .settings_model import SettingsModel
+
+POLL_INTERVAL = 0.1
+
+
+def _snapshot(target):
+    """{path: (mtime_ns, size)} of the watched file or of the .ini files in the watched folder"""
+    if not os.path.isdir(target):
+        signature = file_signature(target)
+        return {target: signature} if signature is not None else {}
+    files = {}
+    try:
+        with os.scandir(target) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith('.ini') and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    except OSError as e:
+        diagnostics_log.debug('watch.scan_failed', path=target, error=str(e))
+    return files
+
+
+class PresetWatcher(FileWatcher):
+    """Calls on_change(path) from a background thread once a watched preset has stopped changing"""
+
+    name = 'PresetWatcher'
+
+    def __init__(self, target, on_change, poll_interval=POLL_INTERVAL, **kwargs):
+        self.target = os.path.abspath(target)
+        self.on_change = on_change
+        super().__init__(poll_interval, **kwargs)
+
+    def scan(self):
+        return _snapshot(self.target)
+
+    def report(self, changed):
+        # When several presets were saved together, the last one saved is built; deleted ones are not
+        saved = [path for path in changed if path in self.files]
+        if saved:
+            self.on_change(max(saved, key=changed.get))
+
+
+class WatchBuilder:
+    """Builds and installs the mod from preset files, skipping builds that would not change the cfg files"""
+
+    def __init__(self, config_handler, build_queue, mods_path, include_defaults=False, presets_dir='Presets'):
+        self.config_handler = config_handler
+        self.build_queue = build_queue
+        self.mods_path = mods_path
+        self.include_defaults = include_defaults
+        # Separate from the editor's resolver and model: builds run on the watcher thread
+        self.resolver = PresetResolver(config_handler, presets_dir)
+        self.model = SettingsModel.from_handler(config_handler)
+
+    def prepare(self, path):
+        """Load a preset file into the model and return its prototype overrides; raises PresetError or FormulaError"""
+        config, prototypes = self.config_handler.split_prototype_sections(self.resolver.resolve_file(path))
+        self.model.load(config)
+        return prototypes
+
+    def build(self, path):
+        """Build and install the mod from a preset file; returns a result dict with a 'status'"""
+        result = {'path': path, 'status': None}
+        try:
+            prototypes = self.prepare(path)
+        except (PresetError, FormulaError) as e:
+            result.update(status='invalid', issues=[str(e)])
+            return result
+        issues = self.model.invalid_settings()
+        if issues:
+            result.update(status='invalid', issues=issues)
+            return result
+
+        # Waits on the watcher thread for the build, or the one it was merged into
+        future = self.build_queue.submit(self.model.to_config(self.include_defaults), prototypes, self.mods_path,
+                                        source='watch')
+        result.update(future.result())
+        if result['status'] == 'installed':
+            diagnostics_log.info('watch.installed', path=path, duration_ms=result['duration_ms'])
+        return result
@@ -0,0 +1,182 @@
+# modules/presets.py
+"""
+Preset inheritance.
+
+A preset can name a parent in a [Preset] section:
+
+    [Preset]
+    base = v3fish_recommended
+
+    [MovementParams]
+    SprintSpeed = 900
+
+The parent is another preset in the Presets folder or a built-in preset
+(default, v3fish_recommended, xysensitivityfix). Resolving a preset overlays
+its sections on its parent's resolved config, so the result only holds the
+values that differ from the defaults, like a flat preset. Resolved configs
+are cached per file together with the file's mtime and size; a cached result
+is reused until the preset or one of its ancestors changes on disk, so a
+cached chain costs a stat per level. A resolved config shares every section it does
+not override with its parent's: treat results as read-only.
+
+A key left empty (`RunSpeed =`) clears what the parent sets for it, so a child
+can drop an inherited formula or prototype override; rebase() writes these
+markers, and False for an inherited Aiming sync, when saving a child preset.
+"""
+import os
+
+from .config import PROTOTYPE_SECTION_PREFIX, check_prototype_refkey
+from .diagnostics_log import diagnostics_log
+from .formulas import FORMULAS_SECTION, FormulaError, FormulaSet
+from .settings_model import SYNC_KEY
+
+PRESETS_DIR_NAME = 'Presets'
+PRESET_SECTION = 'Preset'
+BASE_KEY = 'base'
+# Overrides of the default preset, and the parent of presets without a base; never modified
+NO_OVERRIDES = {}
+# Value of a key that clears the parent's value
+CLEARED = ''
+
+
+class PresetError(Exception):
+    pass
+
+
+def overlay(parent, config):
+    """Return parent with config's sections laid over it, copying only the sections config touches"""
+    resolved = dict(parent)
+    for section, values in config.items():
+        merged = {**parent[section], **values} if section in parent else dict(values)
+        for key, value in values.items():
+            if value == CLEARED:
+                del merged[key]
+        if merged:
+            resolved[section] = merged
+        else:
+            resolved.pop(section, None)
+    return resolved
+
+
+class _Resolved:
+    __slots__ = ('signature', 'base', 'config', 'parent', 'resolved')
+
+    def __init__(self, signature, base, config, parent, resolved):
+        self.signature = signature
+        self.base = base
+        self.config = config
+        self.parent = parent
+        self.resolved = resolved
+
+
+class PresetResolver:
+    def __init__(self, config_handler, presets_dir=PRESETS_DIR_NAME):
+        self.config_handler = config_handler
+        self.presets_dir = presets_dir
+        self._cache = {}
+
+    def builtin_presets(self):
+        handler = self.config_handler
+        return {'default': NO_OVERRIDES, 'v3fish_recommended': handler.v3fish_config,
+                'xysensitivityfix': handler.xy_fix_config}
+
+    def preset_path(self, name):
+        if name.lower().endswith('.ini'):
+            name = name[:-4]
+        return os.path.abspath(os.path.join(self.presets_dir, f'{name}.ini'))
+
+    def resolve(self, name):
+        """Resolved config of a preset in the Presets folder or a built-in preset"""
+        path = self.preset_path(name)
+        if not os.path.exists(path):
+            builtins = self.builtin_presets()
+            if name in builtins:
+                return builtins[name]
+        return self.resolve_file(path)
+
+    def resolve_file(self, path, _chain=()):
+        """Resolved config of a preset file; its base is looked up in the Presets folder"""
+        path = os.path.abspath(path)
+        if path in _chain:
+            names = [os.path.splitext(os.path.basename(p))[0] for p in _chain + (path,)]
+            raise PresetError(f"Preset inheritance loop: {' -> '.join(names)}")
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise PresetError(f"Preset not found: {path}") from e
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._cache.get(path)
+        if entry is None or entry.signature != signature:
+            config = self.config_handler.load_ini_file(path)
+            base = config.pop(PRESET_SECTION, {}).get(BASE_KEY)
+            for section in config:
+                if section.startswith(PROTOTYPE_SECTION_PREFIX):
+                    try:
+                        check_prototype_refkey(section[len(PROTOTYPE_SECTION_PREFIX):])
+                    except ValueError as e:
+                        raise PresetError(f"{e} in {path}") from None
+            entry = _Resolved(signature, str(base).strip() if base else None, config, None, None)
+            self._cache[path] = entry
+
+        parent = self._resolve_base(entry.base, _chain + (path,)) if entry.base else NO_OVERRIDES
+        if entry.resolved is None or parent is not entry.parent:
+            # First use, or the file or an ancestor changed: rebuild from the parsed file
+            entry.parent = parent
+            entry.resolved = overlay(parent, entry.config)
+            diagnostics_log.debug('preset.resolved', path=path, base=entry.base)
+        return entry.resolved
+
+    def _resolve_base(self, base, chain):
+        path = self.preset_path(base)
+        if os.path.exists(path):
+            return self.resolve_file(path, chain)
+        builtins = self.builtin_presets()
+        if base in builtins:
+            return builtins[base]
+        raise PresetError(f"Base preset '{base}' not found")
+
+    def base_of(self, path):
+        """The base a preset file names, or None"""
+        self.resolve_file(path)
+        return self._cache[os.path.abspath(path)].base
+
+    def _formula_names(self, formulas):
+        """{name as written: "Section.Key"} of formula targets, and their canonical {"Section.Key": text}"""
+        defaults = {(section, key): value for section, values in self.config_handler.default_config.items()
+                    for key, value in values.items()}
+        try:
+            formula_set = FormulaSet(defaults, formulas)
+        except FormulaError:
+            # The base could not be loaded either; compare as written
+            return {name: name for name in formulas}, dict(formulas)
+        return ({name: '.'.join(formula_set.resolve(name)) for name in formulas}, formula_set.definitions)
+
+    def rebase(self, config, base):
+        """Reduce a full config (every setting) to the values that differ from base, with a [Preset] section naming it"""
+        base_config = self._resolve_base(base, ())
+        parent = overlay(self.config_handler.default_config, base_config)
+        # config names formula targets "Section.Key"; the base may write them either way
+        formula_names, parent_formulas = self._formula_names(base_config.get(FORMULAS_SECTION, {}))
+        child = {PRESET_SECTION: {BASE_KEY: base}}
+        for section, values in config.items():
+            inherited = parent_formulas if section == FORMULAS_SECTION else parent.get(section, {})
+            # Compared as written to the file
+            changed = {key: value for key, value in values.items() if str(inherited.get(key)) != str(value)}
+            if changed:
+                child[section] = changed
+
+        # What the base sets and config no longer has would be inherited again on load
+        for section, values in base_config.items():
+            kept = config.get(section, {})
+            for key in values:
+                if section == FORMULAS_SECTION:
+                    target = formula_names[key]
+                    # Dropped, or restated under its full name
+                    if (key != target and target in child.get(section, {})) or target not in kept:
+                        child.setdefault(section, {})[key] = CLEARED
+                elif key not in kept:
+                    # The model only writes the sync flag when it is on
+                    cleared = False if (section, key) == SYNC_KEY else CLEARED
+                    child.setdefault(section, {})[key] = cleared
+        return child
@@ -0,0 +1,170 @@
+# modules/profiling.py
+"""
+Per-action profiling hooks for GUI commands.
+
+When enabled (--profile-actions or SCAM_PROFILE_ACTIONS=cprofile|tracemalloc,
+where 1 or true means cprofile),
+each wrapped command writes a cProfile .prof file or a tracemalloc .json
+snapshot to the profiles folder in the user data directory, keeping only the
+most recent files per action so they can be attached to bug reports.
+When disabled, wrap() returns the callback unchanged.
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from .diagnostics_log import diagnostics_log
+
+PROFILE_ENV_VAR = 'SCAM_PROFILE_ACTIONS'
+PROFILE_DIR_NAME = 'profiles'
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+DEFAULT_PROFILE_MODE = 'cprofile'
+MAX_FILES_PER_ACTION = 5
+TOP_ENTRIES = 30
+
+
+def get_mode_from_env():
+    """Return the profiling mode configured through the environment, or None"""
+    value = os.environ.get(PROFILE_ENV_VAR, '').strip().lower()
+    if not value or value in ('0', 'false'):
+        return None
+    if value in ('1', 'true'):
+        return DEFAULT_PROFILE_MODE
+    if value not in PROFILE_MODES:
+        # A typo in the environment should not keep the window from opening
+        diagnostics_log.warning('profile.unknown_mode', value=value, expected=', '.join(PROFILE_MODES))
+        return None
+    return value
+
+
+class ActionProfiler:
+    def __init__(self, output_dir, mode=None, keep=MAX_FILES_PER_ACTION):
+        if mode is None:
+            mode = get_mode_from_env()
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profiling mode '{mode}', expected one of {', '.join(PROFILE_MODES)}")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.keep = keep
+        # Per thread, so a build on the build queue's thread is profiled while a GUI action is
+        self._local = threading.local()
+        # tracemalloc is process-wide: it is stopped when the last action tracing with it ends
+        self._tracing_lock = threading.Lock()
+        self._tracing_count = 0
+        self._started_tracing = False
+
+    @property
+    def enabled(self):
+        return self.mode is not None
+
+    def wrap(self, name, func):
+        """Return func profiled under name, or func itself when profiling is disabled"""
+        if not self.enabled:
+            return func
+
+        def profiled(*args, **kwargs):
+            # Actions triggered from inside another one are part of the outer profile
+            if getattr(self._local, 'active', False):
+                return func(*args, **kwargs)
+            self._local.active = True
+            try:
+                if self.mode == 'tracemalloc':
+                    return self._run_tracemalloc(name, func, args, kwargs)
+                return self._run_cprofile(name, func, args, kwargs)
+            finally:
+                self._local.active = False
+
+        profiled.__name__ = getattr(func, '__name__', name)
+        profiled.__doc__ = getattr(func, '__doc__', None)
+        return profiled
+
+    def _output_path(self, name, extension):
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        return os.path.join(self.output_dir, f'{name}-{stamp}{extension}')
+
+    def _rotate(self, name, extension):
+        """Delete the oldest files of an action beyond the retention limit"""
+        prefix = f'{name}-'
+        files = sorted(f for f in os.listdir(self.output_dir)
+                       if f.startswith(prefix) and f.endswith(extension))
+        for old_file in files[:-self.keep]:
+            try:
+                os.remove(os.path.join(self.output_dir, old_file))
+            except OSError as e:
+                diagnostics_log.warning('profile.rotate_failed', file=old_file, error=str(e))
+
+    # The profilers are imported when first used, keeping them off the startup path
+    def _run_cprofile(self, name, func, args, kwargs):
+        import cProfile
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            return profile.runcall(func, *args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            try:
+                path = self._output_path(name, '.prof')
+                profile.dump_stats(path)
+                self._write_json(path[:-len('.prof')] + '.json', {
+                    'action': name,
+                    'duration_ms': round(duration * 1000, 3),
+                    'top_cumulative': self._top_functions(profile),
+                })
+                self._rotate(name, '.prof')
+                self._rotate(name, '.json')
+            except OSError as e:
+                diagnostics_log.warning('profile.write_failed', action=name, error=str(e))
+
+    def _top_functions(self, profile):
+        import pstats
+        stats = pstats.Stats(profile)
+        rows = []
+        for (filename, line, function), (_cc, ncalls, tottime, cumtime, _callers) in stats.stats.items():
+            rows.append({'function': f'{os.path.basename(filename)}:{line}({function})',
+                         'calls': ncalls,
+                         'tottime_ms': round(tottime * 1000, 3),
+                         'cumtime_ms': round(cumtime * 1000, 3)})
+        rows.sort(key=lambda row: row['cumtime_ms'], reverse=True)
+        return rows[:TOP_ENTRIES]
+
+    def _run_tracemalloc(self, name, func, args, kwargs):
+        import tracemalloc
+        with self._tracing_lock:
+            if self._tracing_count == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                self._started_tracing = True
+            self._tracing_count += 1
+        before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            after = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            with self._tracing_lock:
+                self._tracing_count -= 1
+                if self._tracing_count == 0 and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+            top = after.compare_to(before, 'lineno')[:TOP_ENTRIES]
+            try:
+                self._write_json(self._output_path(name, '.json'), {
+                    'action': name,
+                    'duration_ms': round(duration * 1000, 3),
+                    'current_bytes': current,
+                    'peak_bytes': peak,
+                    'top_allocations': [{'location': str(stat.traceback[0]),
+                                         'size_diff': stat.size_diff,
+                                         'count_diff': stat.count_diff} for stat in top],
+                })
+                self._rotate(name, '.json')
+            except OSError as e:
+                diagnostics_log.warning('profile.write_failed', action=name, error=str(e))
+
+    def _write_json(self, path, data):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,437 @@
+# modules/settings_model.py
+"""
+Tk-independent state of the settings editor.
+
+SettingsModel holds the typed value of every setting keyed by (section, key),
+starting from the defaults ConfigHandler loads. Changes made inside a
+transaction are delivered to observers once, as {(section, key): (old, new)},
+when the outermost transaction ends. snapshot() returns a read-only view
+that stays unchanged after later edits. Values are stored per section and a
+section is copied on its first write after a snapshot, so snapshots share
+every section that did not change.
+
+Formulas (see formulas.py) are stored in the model as a Formulas section of
+{"Section.Key": expression}. When a transaction ends, the targets that depend
+on what changed are re-evaluated and written in the same notification, so
+observers only hear about the settings that actually moved.
+
+History records each notification as one undo step holding only the changed
+settings, so a preset load or a synced rate edit is undone in one go.
+
+ConfigInterface is a view over a model; scripts and background jobs can use
+a model without tkinter:
+
+    model = SettingsModel.from_handler(config_handler)
+    with model.transaction():
+        model.set('MovementParams', 'MaxWalkSpeed', 300)
+        model.set('MovementParams', 'MaxSprintSpeed', 600)
+    config = model.to_config()
+"""
+import contextlib
+import time
+from collections import deque
+from collections.abc import Mapping
+
+from .constraints import ConstraintChecker
+from .formulas import FLOAT_DIGITS, FORMULAS_SECTION, FormulaSet
+
+# The Aiming tab's sync checkbox, and the two rates it keeps equal
+SYNC_KEY = ('Aiming', 'SyncTurnRate')
+SYNCED_RATES = (('MovementParams', 'BaseTurnRate'), ('MovementParams', 'BaseLookUpRate'))
+
+MAX_HISTORY_STEPS = 5000
+BULK_OPERATIONS = ('scale', 'offset', 'clamp', 'reset')
+
+# Edits of the same settings closer together than this are one undo step (typing a number)
+COALESCE_SECONDS = 1.0
+
+
+class InvalidSettingError(ValueError):
+    def __init__(self, section, key, value):
+        super().__init__(f"{section} - {key}: invalid value {value!r}")
+        self.section = section
+        self.key = key
+        self.value = value
+
+
+def parse_value(text, default):
+    """Convert entry text to the type of the setting's default; text that does not parse is kept as is"""
+    text = text.strip()
+    if isinstance(default, (int, float)) and not isinstance(default, bool):
+        try:
+            return float(text) if '.' in text else int(text)
+        except ValueError:
+            return text
+    return text
+
+
+def format_value(value):
+    """Entry text for a value"""
+    return str(value)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _same(a, b):
+    # 1 == 1.0 == True, but they show and save differently
+    return type(a) is type(b) and a == b
+
+
+class SettingsSnapshot(Mapping):
+    """Read-only {(section, key): value}, sharing unchanged section dicts with the model and other snapshots"""
+
+    def __init__(self, sections):
+        self._sections = sections
+
+    def __getitem__(self, setting):
+        section, key = setting
+        return self._sections[section][key]
+
+    def __iter__(self):
+        for section, values in self._sections.items():
+            for key in values:
+                yield (section, key)
+
+    def __len__(self):
+        return sum(len(values) for values in self._sections.values())
+
+    def section(self, section):
+        return dict(self._sections[section])
+
+
+class SettingsModel:
+    def __init__(self, defaults, max_values=None, constraints=None):
+        self.defaults = {(section, key): value for section, values in defaults.items()
+                         for key, value in values.items()}
+        # Settings in the schema, in file order; the sync flag is tracked even when the schema lacks it
+        self.keys = list(self.defaults)
+        self.defaults.setdefault(SYNC_KEY, False)
+        self.max_values = {(section, key): value for section, values in (max_values or {}).items()
+                           for key, value in values.items()}
+        # Checks the |max suffixes and the [Constraints] rules of the defaults, caching results per setting
+        self.constraints = ConstraintChecker(self.defaults, self.max_values, constraints)
+        self._sections = {}
+        for (section, key), value in self.defaults.items():
+            self._sections.setdefault(section, {})[key] = value
+        self._sections[FORMULAS_SECTION] = {}
+        self.formulas = FormulaSet(self.defaults)
+        self._formulas_changed = False
+        # Sections no snapshot refers to, which can be written in place
+        self._owned = set(self._sections)
+        self._observers = []
+        self._depth = 0
+        self._pending = {}
+
+    @classmethod
+    def from_handler(cls, config_handler):
+        return cls(config_handler.default_config, config_handler.max_values, config_handler.constraints)
+
+    def get(self, section, key):
+        return self._sections[section][key]
+
+    def __contains__(self, setting):
+        return setting in self.defaults
+
+    def subscribe(self, callback):
+        """Call callback({(section, key): (old, new)}) after every change or transaction"""
+        self._observers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._observers.remove(callback)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Group changes so observers are notified once, when the outermost transaction ends"""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0 and self._pending:
+                self._apply_formulas()
+                changes, self._pending = self._pending, {}
+                changes = {setting: change for setting, change in changes.items() if not _same(*change)}
+                if changes:
+                    for callback in list(self._observers):
+                        callback(changes)
+
+    def _write(self, setting, value):
+        section, key = setting
+        # Only formulas can be missing; None removes one
+        old = self._sections[section].get(key)
+        if _same(old, value):
+            return
+        if section not in self._owned:
+            # A snapshot refers to this section; leave it untouched
+            self._sections[section] = dict(self._sections[section])
+            self._owned.add(section)
+        if value is None:
+            del self._sections[section][key]
+        else:
+            self._sections[section][key] = value
+        self.constraints.invalidate(setting)
+        if section == FORMULAS_SECTION:
+            self._formulas_changed = True
+        first_old = self._pending[setting][0] if setting in self._pending else old
+        self._pending[setting] = (first_old, value)
+
+    def _apply_formulas(self):
+        """Re-evaluate the formula targets that depend on the pending changes (all of them if the formulas changed)"""
+        if self._formulas_changed:
+            self._formulas_changed = False
+            # Definitions were checked by set_formulas or load before being written
+            self.formulas = FormulaSet(self.defaults, self._sections[FORMULAS_SECTION])
+            targets = self.formulas.order
+        elif self.formulas:
+            targets = self.formulas.affected(self._pending)
+        else:
+            return
+        for target in targets:
+            value = self.formulas.evaluate(target, self.get)
+            if value is not None:
+                self._write(target, value)
+
+    def _write_formulas(self, formulas):
+        for name in list(self._sections[FORMULAS_SECTION]):
+            if name not in formulas.definitions:
+                self._write((FORMULAS_SECTION, name), None)
+        for name, text in formulas.definitions.items():
+            self._write((FORMULAS_SECTION, name), text)
+
+    def formula_definitions(self):
+        """{"Section.Key": expression} of every formula"""
+        return dict(self._sections[FORMULAS_SECTION])
+
+    def set_formulas(self, definitions):
+        """Replace the formulas; raises FormulaError, changing nothing, if one is invalid or they form a loop"""
+        formulas = FormulaSet(self.defaults, definitions)
+        with self.transaction():
+            self._write_formulas(formulas)
+
+    def set(self, section, key, value):
+        """Change one setting, keeping the turn and look-up rates equal while sync is on"""
+        setting = (section, key)
+        with self.transaction():
+            self._write(setting, value)
+            if setting in SYNCED_RATES and self.get(*SYNC_KEY) and type(value) is int:
+                for rate in SYNCED_RATES:
+                    if rate in self.defaults:
+                        self._write(rate, value)
+            elif setting == SYNC_KEY and value and all(rate in self.defaults for rate in SYNCED_RATES):
+                turn_rate = self.get(*SYNCED_RATES[0])
+                if type(turn_rate) is int:
+                    self._write(SYNCED_RATES[1], turn_rate)
+
+    def update(self, values):
+        """Set {(section, key): value} in one transaction"""
+        with self.transaction():
+            for (section, key), value in values.items():
+                self.set(section, key, value)
+
+    def bulk_update(self, settings, operation, amount=None):
+        """
+        Apply one operation to many settings as a single change: 'scale' multiplies by amount,
+        'offset' adds amount, 'clamp' brings values within their min and max and 'reset' restores defaults.
+        Settings computed by a formula are skipped, and so are values that are not valid numbers
+        except by 'reset'. Integer settings stay integers.
+        """
+        if operation not in BULK_OPERATIONS:
+            raise ValueError(f"Unknown bulk operation '{operation}'")
+        settings = [setting for setting in settings if setting not in self.formulas and setting != SYNC_KEY]
+        if operation == 'reset':
+            with self.transaction():
+                for setting in settings:
+                    self.reset(*setting)
+            return
+        # Computed from the current values before any is written, as the sync rule may tie two of them
+        values = {}
+        for setting in settings:
+            value = self._sections[setting[0]][setting[1]]
+            default = self.defaults[setting]
+            if not _is_number(value) or not _is_number(default):
+                continue
+            if operation == 'scale':
+                value = value * amount
+            elif operation == 'offset':
+                value = value + amount
+            else:
+                low, high = self.constraints.bounds(setting)
+                if low is not None and value < low:
+                    value = low
+                elif high is not None and value > high:
+                    value = high
+                else:
+                    continue
+            values[setting] = int(round(value)) if isinstance(default, int) else round(float(value), FLOAT_DIGITS)
+        self.update(values)
+
+    def restore(self, values):
+        """Write {(section, key): value} as is, without the sync rule; used to undo and redo"""
+        with self.transaction():
+            for setting, value in values.items():
+                self._write(setting, value)
+
+    def reset(self, section, key):
+        """Return a setting to its default; resetting either rate turns sync off"""
+        with self.transaction():
+            if (section, key) in SYNCED_RATES:
+                self._write(SYNC_KEY, False)
+            self._write((section, key), self.defaults[(section, key)])
+
+    def load(self, config):
+        """
+        Replace every setting with config ({section: {key: value}}) over the defaults, keeping sync unless given.
+        Its Formulas section replaces the formulas; raises FormulaError, changing nothing, if one is invalid.
+        """
+        formulas = FormulaSet(self.defaults, config.get(FORMULAS_SECTION))
+        with self.transaction():
+            self._write_formulas(formulas)
+            for setting in self.keys:
+                if setting != SYNC_KEY:
+                    self._write(setting, self.defaults[setting])
+            for section, values in config.items():
+                for key, value in values.items():
+                    setting = (section, key)
+                    if setting == SYNC_KEY:
+                        self._write(setting, bool(value))
+                    elif setting in self.defaults:
+                        default = self.defaults[setting]
+                        # Values go in the way an entry would read them; type mismatches are ignored
+                        if isinstance(default, bool) != isinstance(value, bool):
+                            continue
+                        self._write(setting, value if isinstance(value, bool) else parse_value(str(value), default))
+
+    def snapshot(self):
+        """Read-only {(section, key): value} that later changes do not affect"""
+        self._owned.clear()
+        return SettingsSnapshot(dict(self._sections))
+
+    def is_default(self, section, key):
+        return _same(self._sections[section][key], self.defaults[(section, key)])
+
+    def has_changes(self, settings=None):
+        """True if any of settings (default: every setting in the schema) differs from its default"""
+        return any(not self.is_default(section, key) for section, key in (self.keys if settings is None else settings))
+
+    def validate(self, section, key):
+        """Return why the value of a setting is invalid, or None"""
+        value = self._sections[section][key]
+        default = self.defaults[(section, key)]
+        if _is_number(default):
+            if isinstance(value, str):
+                return "Cannot be empty" if not value else "Must be a valid number"
+            return self.constraints.check((section, key), self.get)
+        return None
+
+    def invalid_settings(self):
+        """Messages for every invalid setting, as "section - key: reason" """
+        messages = []
+        for section, key in self.keys:
+            problem = self.validate(section, key)
+            if problem:
+                messages.append(f"{section} - {key}: {problem}")
+        return messages
+
+    def to_config(self, include_defaults=False):
+        """Return {section: {key: value}} of changed settings (or all of them), Aiming holding only the sync flag, plus any Formulas"""
+        config = {}
+        for section, key in self.keys:
+            if section == 'Aiming' or (not include_defaults and self.is_default(section, key)):
+                continue
+            value = self._sections[section][key]
+            default = self.defaults[(section, key)]
+            if isinstance(value, str) and isinstance(default, (int, float)) and not isinstance(default, bool):
+                raise InvalidSettingError(section, key, value)
+            config.setdefault(section, {})[key] = value
+        if self.get(*SYNC_KEY):
+            config['Aiming'] = {'SyncTurnRate': True}
+        if self._sections[FORMULAS_SECTION]:
+            config[FORMULAS_SECTION] = self.formula_definitions()
+        return config
+
+
+class History:
+    """Undo/redo of a SettingsModel, one step per change notification"""
+
+    def __init__(self, model, max_steps=MAX_HISTORY_STEPS, coalesce_seconds=COALESCE_SECONDS, clock=time.monotonic):
+        self.model = model
+        # Steps are flat tuples (setting, old, new, setting, old, new, ...) to keep thousands of them small;
+        # settings are the model's own key tuples, shared by every step
+        self._undo = deque(maxlen=max_steps)
+        self._redo = []
+        self._coalesce_seconds = coalesce_seconds
+        self._clock = clock
+        self._last_time = None
+        self._applying = False
+        self._keys = {setting: setting for setting in model.defaults}
+        model.subscribe(self._record)
+
+    def _record(self, changes):
+        if self._applying:
+            return
+        step = []
+        for setting, (old, new) in changes.items():
+            step += (self._keys.get(setting, setting), old, new)
+        step = tuple(step)
+        now = self._clock()
+        previous = self._undo[-1] if self._undo else None
+        if (previous is not None and self._last_time is not None and now - self._last_time < self._coalesce_seconds
+                and previous[::3] == step[::3]):
+            # Keep the values from before the first edit of the run
+            merged = list(previous)
+            merged[2::3] = step[2::3]
+            if all(_same(old, new) for old, new in zip(merged[1::3], merged[2::3])):
+                # Edited back to where the run started
+                self._undo.pop()
+            else:
+                self._undo[-1] = tuple(merged)
+        else:
+            self._undo.append(step)
+        self._last_time = now
+        self._redo.clear()
+
+    def _apply(self, step, index):
+        self._applying = True
+        try:
+            self.model.restore(dict(zip(step[::3], step[index::3])))
+        finally:
+            self._applying = False
+        # The next edit starts a new step
+        self._last_time = None
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        """Revert the last step; False if there is none"""
+        if not self._undo:
+            return False
+        step = self._undo.pop()
+        self._redo.append(step)
+        self._apply(step, 1)
+        return True
+
+    def redo(self):
+        """Reapply the last undone step; False if there is none"""
+        if not self._redo:
+            return False
+        step = self._redo.pop()
+        self._undo.append(step)
+        self._apply(step, 2)
+        return True
+
+    def checkpoint(self):
+        """Start a new step with the next change, even if it touches the settings of the last one"""
+        self._last_time = None
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._last_time = None
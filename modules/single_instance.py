@@ -0,0 +1,127 @@
+# modules/single_instance.py
+"""
+Single-instance guard for the GUI.
+
+The first window takes an OS lock on scam.lock in the user data folder (held
+until the process exits, so a crash never leaves a stale lock) and listens on
+a local endpoint: a Unix socket on Linux/macOS, a named pipe on Windows. Its
+address and a random auth key go to scam_instance.json. A second launch finds
+the lock taken, sends its request (e.g. a preset to open) to that endpoint and
+exits without starting Tk.
+
+Messages are dicts, sent as UTF-8 JSON in one multiprocessing.connection frame
+(like the automation API, never pickled), received on a background thread and
+queued; the GUI picks them up from `messages` on the Tk thread.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+
+from .diagnostics_log import diagnostics_log
+
+LOCK_FILE_NAME = 'scam.lock'
+INFO_FILE_NAME = 'scam_instance.json'
+IPC_FAMILY = 'AF_PIPE' if os.name == 'nt' else 'AF_UNIX'
+FORWARD_TIMEOUT = 5.0
+RETRY_INTERVAL = 0.05
+
+
+def _try_lock(lock_file):
+    """Take an exclusive non-blocking lock on an open file; False if another process holds it"""
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _encode(message):
+    return json.dumps(message).encode('utf-8')
+
+
+class SingleInstance:
+    def __init__(self, user_data_path):
+        self.lock_path = os.path.join(user_data_path, LOCK_FILE_NAME)
+        self.info_path = os.path.join(user_data_path, INFO_FILE_NAME)
+        self.messages = queue.Queue()
+        self._lock_file = None
+        self._listener = None
+
+    def acquire(self):
+        """Become the running instance and start listening; False if another instance already is"""
+        lock_file = open(self.lock_path, 'a')
+        if not _try_lock(lock_file):
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+
+        authkey = os.urandom(16)
+        self._listener = Listener(family=IPC_FAMILY, authkey=authkey)
+        info = {'pid': os.getpid(), 'family': IPC_FAMILY,
+                'address': self._listener.address, 'authkey': authkey.hex()}
+        temp_path = self.info_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(info, f)
+        os.replace(temp_path, self.info_path)
+
+        threading.Thread(target=self._serve, name='SingleInstance', daemon=True).start()
+        return True
+
+    def _serve(self):
+        listener = self._listener
+        while True:
+            try:
+                conn = listener.accept()
+            except AuthenticationError as e:
+                diagnostics_log.warning('instance.rejected_client', error=str(e))
+                continue
+            except OSError:
+                # Listener closed by release()
+                return
+            with conn:
+                try:
+                    message = json.loads(conn.recv_bytes().decode('utf-8'))
+                    if not isinstance(message, dict):
+                        raise ValueError("message is not an object")
+                    self.messages.put(message)
+                    conn.send_bytes(_encode('ok'))
+                except (EOFError, OSError, ValueError) as e:
+                    diagnostics_log.warning('instance.receive_failed', error=str(e))
+
+    def forward(self, message, timeout=FORWARD_TIMEOUT):
+        """Send message to the running instance; True once it has been received"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                # The running instance may still be starting and not have written its address yet
+                with open(self.info_path, 'r', encoding='utf-8') as f:
+                    info = json.load(f)
+                with Client(info['address'], family=info['family'], authkey=bytes.fromhex(info['authkey'])) as conn:
+                    conn.send_bytes(_encode(message))
+                    return json.loads(conn.recv_bytes().decode('utf-8')) == 'ok'
+            except (OSError, EOFError, ValueError, KeyError, AuthenticationError) as e:
+                if time.monotonic() >= deadline:
+                    diagnostics_log.error('instance.forward_failed', error=str(e))
+                    return False
+                time.sleep(RETRY_INTERVAL)
+
+    def release(self):
+        """Stop listening and give up the lock"""
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        if self._lock_file is not None:
+            try:
+                os.remove(self.info_path)
+            except OSError as e:
+                diagnostics_log.debug('instance.info_remove_failed', error=str(e))
+            self._lock_file.close()
+            self._lock_file = None
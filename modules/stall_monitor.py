@@ -0,0 +1,128 @@
+# modules/stall_monitor.py
+"""
+Tk event-loop stall monitor.
+
+A heartbeat is scheduled on the Tk thread with after(); a background thread
+measures how late it runs. When the loop has been blocked longer than the
+threshold, the Tk thread's stack is captured with sys._current_frames() so the
+blocking callback can be identified. Stall events are kept in a ring buffer.
+
+Enable with --monitor-stalls [THRESHOLD_MS] or SCAM_STALL_MONITOR=<threshold ms>.
+"""
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+STALL_ENV_VAR = 'SCAM_STALL_MONITOR'
+DEFAULT_THRESHOLD_MS = 200
+DEFAULT_INTERVAL_MS = 50
+DEFAULT_CAPACITY = 100
+
+_TKINTER_DIR = f'{os.sep}tkinter{os.sep}'
+
+# Functions that block on purpose while a modal dialog runs its own loop
+_MODAL_FUNCTIONS = {'show', 'wait_window', 'wait_variable', 'askyesno', 'showinfo',
+                    'showerror', 'showwarning', 'askdirectory'}
+
+
+def get_threshold_from_env():
+    """Return the threshold in ms configured through the environment, or None"""
+    value = os.environ.get(STALL_ENV_VAR)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return DEFAULT_THRESHOLD_MS
+
+
+def _find_callback(stack):
+    """Return the first application frame called by tkinter, i.e. the callback that blocks"""
+    callback = None
+    for i, frame in enumerate(stack[:-1]):
+        if _TKINTER_DIR in frame.filename and frame.name in ('__call__', 'callit'):
+            callback = stack[i + 1]
+    if callback is None and stack:
+        callback = stack[-1]
+    if callback is None:
+        return None
+    return f"{os.path.basename(callback.filename)}:{callback.lineno} in {callback.name}"
+
+
+def _is_modal_wait(stack):
+    return any(_TKINTER_DIR in frame.filename and frame.name in _MODAL_FUNCTIONS for frame in stack)
+
+
+class StallMonitor:
+    def __init__(self, window, threshold_ms=DEFAULT_THRESHOLD_MS,
+                 interval_ms=DEFAULT_INTERVAL_MS, capacity=DEFAULT_CAPACITY):
+        self.window = window
+        self.threshold = threshold_ms / 1000
+        self.interval_ms = interval_ms
+        self.interval = interval_ms / 1000
+        self.events = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._last_beat = None
+        self._pending = None
+        self._tk_thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start monitoring; must be called from the Tk thread, ideally once the event loop runs"""
+        self._tk_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self.window.after(self.interval_ms, self._beat)
+        self._thread = threading.Thread(target=self._watch, name='StallMonitor', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _beat(self):
+        """Heartbeat on the Tk thread; closes a pending stall event once the loop is running again"""
+        now = time.perf_counter()
+        with self._lock:
+            if self._pending is not None:
+                self._pending['duration_ms'] = round((now - self._last_beat - self.interval) * 1000, 1)
+                self.events.append(self._pending)
+                self._pending = None
+            self._last_beat = now
+        if not self._stop.is_set():
+            try:
+                self.window.after(self.interval_ms, self._beat)
+            except Exception:
+                # Window destroyed
+                self._stop.set()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval / 2):
+            with self._lock:
+                if self._pending is not None or self._last_beat is None:
+                    continue
+                drift = time.perf_counter() - self._last_beat - self.interval
+                if drift < self.threshold:
+                    continue
+                frame = sys._current_frames().get(self._tk_thread_id)
+                stack = traceback.extract_stack(frame) if frame is not None else []
+                if _is_modal_wait(stack):
+                    # A message box or dialog is open, the loop is not really stuck
+                    self._last_beat = time.perf_counter()
+                    continue
+                self._pending = {
+                    'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'callback': _find_callback(stack),
+                    'stack': traceback.format_list(stack[-15:]),
+                    'duration_ms': None,
+                }
+
+    def get_events(self):
+        """Return recorded stall events, oldest first, including one still in progress"""
+        with self._lock:
+            events = list(self.events)
+            if self._pending is not None:
+                events.append(dict(self._pending))
+        return events
@@ -0,0 +1,96 @@
+# modules/timing.py
+"""
+Lightweight startup phase timing.
+
+Enable with the SCAM_TRACE_STARTUP=1 environment variable or the
+--trace-startup command line flag. When disabled, span() hands back a shared
+no-op context manager so the instrumented code pays almost nothing.
+"""
+import contextlib
+import json
+import os
+import time
+
+TRACE_ENV_VAR = 'SCAM_TRACE_STARTUP'
+TRACE_FILE_NAME = 'startup_trace.json'
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.recorder.record(self.name, self.start, end)
+        return False
+
+
+class SpanRecorder:
+    """
+    Records monotonic timings and widget counts of named phases.
+
+    Usage:
+        with startup_spans.span('setup_gui'):
+            self.setup_gui()
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.widget_root = None
+
+    def enable(self):
+        self.enabled = True
+
+    def span(self, name):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name, start, end):
+        self.spans.append({
+            'name': name,
+            'start_ms': round((start - self.origin) * 1000, 3),
+            'duration_ms': round((end - start) * 1000, 3),
+            'widgets': self.count_widgets(),
+        })
+
+    def count_widgets(self):
+        """Count every widget below the root window, or None before it exists"""
+        if self.widget_root is None:
+            return None
+        try:
+            count = 0
+            pending = [self.widget_root]
+            while pending:
+                widget = pending.pop()
+                children = widget.winfo_children()
+                count += len(children)
+                pending.extend(children)
+            return count
+        except Exception:
+            return None
+
+    def to_dict(self):
+        return {
+            'total_ms': round(sum(span['duration_ms'] for span in self.spans), 3),
+            'spans': list(self.spans),
+        }
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+# Shared recorder for application startup
+startup_spans = SpanRecorder(enabled=os.environ.get(TRACE_ENV_VAR) == '1')